@@ -0,0 +1,65 @@
+"""
+Benchmark for the memory held by a batch of chunks.
+
+Cuts one document into overlapping chunks, once as chunks owning a copy of
+their text and a metadata dict (the former dataclass layout) and once as
+``Chunk`` views over the shared document, and reports traced memory.
+
+Usage:
+    python -m benchmarks.bench_chunk_memory [--chunks N] [--chunk-size C] [--overlap O]
+"""
+
+import argparse
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Dict
+
+from pdf2vector.core.chunking import Chunk
+
+@dataclass
+class CopiedChunk:
+    """Chunk layout before views: its own text and metadata dict."""
+    text: str
+    metadata: Dict[str, Any]
+
+KEYS = ("chunk_index", "page_start", "page_end")
+
+def copied(document, starts, chunk_size):
+    shared = {"filename": "bench.pdf"}
+    return [
+        CopiedChunk(document[start:start + chunk_size], {**shared, "chunk_index": i, "page_start": i, "page_end": i})
+        for i, start in enumerate(starts)
+    ]
+
+def views(document, starts, chunk_size):
+    shared = {"filename": "bench.pdf"}
+    return [Chunk.view(document, start, start + chunk_size, shared, KEYS, (i, i, i)) for i, start in enumerate(starts)]
+
+def measure(build, document, starts, chunk_size):
+    """Return the bytes allocated by a batch of chunks."""
+    tracemalloc.start()
+    chunks = build(document, starts, chunk_size)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del chunks
+    return size
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=100_000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--overlap", type=int, default=200)
+    args = parser.parse_args()
+    
+    step = args.chunk_size - args.overlap
+    document = "lorem ipsum dolor sit amet " * (args.chunks * step // 27 + args.chunk_size)
+    starts = range(0, args.chunks * step, step)
+    
+    print(f"document: {len(document) / 2**20:.1f} MiB, {args.chunks:,} chunks")
+    print(f"{'layout':<8} {'MiB':>8} {'bytes/chunk':>12}")
+    for label, build in (("copied", copied), ("views", views)):
+        size = measure(build, document, starts, args.chunk_size)
+        print(f"{label:<8} {size / 2**20:>8.1f} {size / args.chunks:>12.0f}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
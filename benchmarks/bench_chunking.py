@@ -0,0 +1,78 @@
+"""
+Benchmark for page-streaming PDF chunking.
+
+Writes a synthetic PDF and compares whole-document extraction followed by
+slicing with ``PDFChunker.iter_chunks``, serial and with page ranges
+extracted in a process pool, reporting time to first chunk, total time and
+peak traced memory (of this process only).
+
+Usage:
+    python -m benchmarks.bench_chunking [--pages N] [--pdf PATH] [--workers N]
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from pdfminer.high_level import extract_text
+
+from pdf2vector.core.chunking import PDFChunker
+
+from tests.sample_pdf import write_pdf
+
+def whole_document(chunker, pdf_path):
+    """Original approach: extract everything, then slice into a list."""
+    text = extract_text(str(pdf_path))
+    chunks = []
+    start = 0
+    while start < len(text):
+        chunks.append(text[start:start + chunker.chunk_size])
+        start += chunker.chunk_size - chunker.chunk_overlap
+    yield from chunks
+
+def measure(label, chunks):
+    """Consume chunks and print first-chunk latency, total time and peak memory."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    first = None
+    count = 0
+    for _ in chunks:
+        if first is None:
+            first = time.perf_counter() - start
+        count += 1
+    total = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<10} {count:>7} {first:>10.3f} {total:>9.2f} {peak / 2**20:>9.1f}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--lines-per-page", type=int, default=45)
+    parser.add_argument("--pdf", type=Path, default=None, help="use an existing PDF instead")
+    parser.add_argument("--workers", type=int, default=None, help="processes for the parallel run")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = args.pdf
+        if pdf_path is None:
+            pdf_path = Path(tmp) / "sample.pdf"
+            write_pdf(pdf_path, (
+                [f"Page {page} line {line}: the quick brown fox jumps over the lazy dog again"
+                 for line in range(args.lines_per_page)]
+                for page in range(args.pages)
+            ))
+            
+        chunker = PDFChunker(workers=1)
+        parallel = PDFChunker(workers=args.workers, parallel_threshold=1)
+        print(f"{pdf_path.name}, {pdf_path.stat().st_size:,} bytes")
+        print(f"{'method':<10} {'chunks':>7} {'first s':>10} {'total s':>9} {'peak MiB':>9}")
+        measure("whole", whole_document(chunker, pdf_path))
+        measure("streaming", chunker.iter_chunks(pdf_path))
+        if parallel.workers > 1:
+            measure(f"parallel{parallel.workers}", parallel.iter_chunks(pdf_path))
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
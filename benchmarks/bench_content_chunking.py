@@ -0,0 +1,81 @@
+"""
+Benchmark for content-defined chunking.
+
+Chunks a synthetic document and an edited copy of it with each split mode,
+and reports how many chunk IDs of the edited copy are new, i.e. how many
+chunks a re-ingest has to embed again, along with chunk sizes and
+chunking time.
+
+Usage:
+    python -m benchmarks.bench_content_chunking [--pages N] [--edits N]
+"""
+
+import argparse
+import random
+import statistics
+import time
+from pathlib import Path
+
+from pdf2vector.core.chunking import PDFChunker
+from pdf2vector.core.vector_store import ChromaDBStore
+
+WORDS = "the of and to in is that for it as with was on be by this are from at or an which".split()
+
+def make_pages(n_pages, seed=0):
+    """Build page texts of sentences of random length."""
+    rng = random.Random(seed)
+    pages = []
+    for _ in range(n_pages):
+        lines = []
+        for _ in range(40):
+            words = rng.choices(WORDS, k=rng.randint(4, 14))
+            lines.append(" ".join(words).capitalize() + ".")
+        pages.append("\n".join(lines) + "\n\n\f")
+    return pages
+
+def insert_sentences(pages, n_edits, seed=1):
+    """Insert a new sentence at random places in random pages."""
+    rng = random.Random(seed)
+    pages = list(pages)
+    for edit in range(n_edits):
+        page = rng.randrange(len(pages))
+        offset = rng.randrange(len(pages[page]))
+        pages[page] = pages[page][:offset] + f" A sentence added by edit {edit}. " + pages[page][offset:]
+    return pages
+
+def chunk_ids(chunker, pages):
+    """Chunk page texts and return the store ID of every chunk."""
+    chunker.iter_pages = lambda path: iter(pages)
+    # IDs only depend on the chunk, so no store needs to be opened
+    return [ChromaDBStore._generate_id(None, chunk) for chunk in chunker.iter_chunks(Path("doc.pdf"))]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--edits", type=int, default=1, help="sentences inserted in the edited copy")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+    
+    pages = make_pages(args.pages)
+    edited = insert_sentences(pages, args.edits)
+    print(f"{sum(map(len, pages)):,} characters in {len(pages)} pages, {args.edits} insertions")
+    
+    print(f"{'mode':<9} {'chunks':>7} {'mean':>7} {'stdev':>7} {'re-embed':>9} {'ms':>8}")
+    for mode in ("char", "sentence", "content"):
+        chunker = PDFChunker(chunk_size=args.chunk_size, workers=1, split_at=mode)
+        start = time.perf_counter()
+        before = chunk_ids(chunker, pages)
+        elapsed = time.perf_counter() - start
+        after = chunk_ids(chunker, edited)
+        
+        chunker.iter_pages = lambda path: iter(pages)
+        sizes = [len(chunk) for chunk in chunker.iter_chunks(Path("doc.pdf"))]
+        stored = set(before)
+        new = sum(chunk_id not in stored for chunk_id in after)
+        print(
+            f"{mode:<9} {len(before):>7} {statistics.mean(sizes):>7.0f} {statistics.pstdev(sizes):>7.0f} "
+            f"{new / len(after):>8.1%} {elapsed * 1000:>8.1f}"
+        )
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,78 @@
+"""
+Benchmark for near-duplicate chunk elimination.
+
+Builds a corpus in which some chunks are copies of earlier chunks with a few
+words changed, runs them through a MinHash index as ``ChromaDBStore(dedup=...)``
+does, and reports for several thresholds how many planted near-duplicates
+were caught, how many distinct chunks were wrongly dropped, and the dedup
+time per chunk next to the embedding time it saves.
+
+Usage:
+    python -m benchmarks.bench_dedup [--chunks N] [--duplicates F] [--edits N]
+"""
+
+import argparse
+import random
+import time
+
+from pdf2vector.core.dedup import MinHashIndex, minhash
+from pdf2vector.core.embeddings import EmbeddingGenerator
+
+from .bench_embeddings import make_corpus
+
+def plant_duplicates(texts, rate, n_edits, seed=1):
+    """Replace a share of the chunks with edited copies of earlier chunks."""
+    rng = random.Random(seed)
+    texts = list(texts)
+    planted = set()
+    for i in range(1, len(texts)):
+        if rng.random() < rate:
+            words = texts[rng.randrange(i)].split()
+            for _ in range(n_edits):
+                words[rng.randrange(len(words))] = rng.choice(words)
+            texts[i] = " ".join(words)
+            planted.add(i)
+    return texts, planted
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=5000)
+    parser.add_argument("--words-per-chunk", type=int, default=170)
+    parser.add_argument("--duplicates", type=float, default=0.3, help="share of chunks that are edited copies")
+    parser.add_argument("--edits", type=int, default=5, help="words changed in each copy")
+    parser.add_argument("--thresholds", type=float, nargs="+", default=[0.7, 0.8, 0.9])
+    args = parser.parse_args()
+    
+    texts, planted = plant_duplicates(make_corpus(args.chunks, args.words_per_chunk), args.duplicates, args.edits)
+    
+    start = time.perf_counter()
+    EmbeddingGenerator().embed_array(texts)
+    embed_time = (time.perf_counter() - start) / len(texts) * 1e6
+    
+    start = time.perf_counter()
+    signatures = [minhash(text) for text in texts]
+    sign_time = (time.perf_counter() - start) / len(texts) * 1e6
+    
+    print(f"{len(texts)} chunks, {len(planted)} planted near-duplicates with {args.edits} edited words")
+    print(f"embedding {embed_time:.0f} us/chunk, signing {sign_time:.0f} us/chunk")
+    print(f"{'threshold':>9} {'caught':>8} {'false':>7} {'skipped':>8} {'lookup us':>10}")
+    for threshold in args.thresholds:
+        index = MinHashIndex(threshold)
+        flagged = set()
+        start = time.perf_counter()
+        for i, signature in enumerate(signatures):
+            if index.find(signature) is not None:
+                flagged.add(i)
+            else:
+                index.add(str(i), signature)
+        lookup_time = (time.perf_counter() - start) / len(texts) * 1e6
+        
+        caught = len(flagged & planted) / max(len(planted), 1)
+        false = len(flagged - planted)
+        print(
+            f"{threshold:>9.2f} {caught:>8.1%} {false:>7} {len(flagged) / len(texts):>8.1%} "
+            f"{lookup_time:>10.0f}"
+        )
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,73 @@
+"""
+Benchmark for the hash embedding engine.
+
+Compares the original word-by-word loop with the batch engine behind
+``EmbeddingGenerator.embed_text`` and reports words per second.
+
+Usage:
+    python -m benchmarks.bench_embeddings [--chunks N] [--words-per-chunk N]
+"""
+
+import argparse
+import hashlib
+import random
+import time
+
+import numpy as np
+
+from pdf2vector.core.embeddings import EmbeddingGenerator
+
+def legacy_embedding(text, dimension=1536):
+    """Original per-word implementation, kept here as the baseline."""
+    embedding = np.zeros(dimension)
+    for word in text.split():
+        word_hash = int(hashlib.sha256(word.encode()).hexdigest(), 16)
+        for j in range(min(32, dimension)):
+            idx = (word_hash + j) % dimension
+            val = ((word_hash >> j) & 0xFF) / 255.0
+            embedding[idx] = val
+    norm = np.linalg.norm(embedding)
+    if norm > 0:
+        embedding = embedding / norm
+    return embedding.tolist()
+
+def make_corpus(n_chunks, words_per_chunk, vocabulary_size=20000, seed=0):
+    """Build chunks of Zipf-distributed words, similar to real text."""
+    rng = random.Random(seed)
+    vocabulary = [
+        "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(2, 10)))
+        for _ in range(vocabulary_size)
+    ]
+    weights = [1.0 / (rank + 1) for rank in range(vocabulary_size)]
+    return [
+        " ".join(rng.choices(vocabulary, weights=weights, k=words_per_chunk))
+        for _ in range(n_chunks)
+    ]
+
+def timed(label, n_words, func):
+    """Run func once and print its throughput."""
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<12} {elapsed:8.3f} s  {n_words / elapsed:12,.0f} words/sec")
+    return result, elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=500)
+    parser.add_argument("--words-per-chunk", type=int, default=170)
+    args = parser.parse_args()
+
+    texts = make_corpus(args.chunks, args.words_per_chunk)
+    n_words = sum(len(text.split()) for text in texts)
+    generator = EmbeddingGenerator()
+
+    print(f"{len(texts)} chunks, {n_words} words")
+    before, before_time = timed("legacy", n_words, lambda: [legacy_embedding(t) for t in texts])
+    after, after_time = timed("batch", n_words, lambda: generator.embed_text(texts))
+
+    print(f"speedup      {before_time / after_time:8.1f}x")
+    print(f"identical    {before == after}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,65 @@
+"""
+Benchmark for the PDF extraction modes.
+
+Extracts every page of a sample corpus with ``mode="layout"`` and
+``mode="fast"``, timing each page, and reports per-page latency and how
+much of the layout text's vocabulary the fast text keeps.
+
+Usage:
+    python -m benchmarks.bench_extraction [PDF ...] [--pages N]
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from pdf2vector.core.chunking import PDFChunker
+
+from tests.sample_pdf import write_pdf
+
+def page_times(chunker, pdf_path):
+    """Extract a PDF and return its text and the seconds spent on each page."""
+    pages, times = [], []
+    start = time.perf_counter()
+    for page_text in chunker.iter_pages(pdf_path):
+        now = time.perf_counter()
+        pages.append(page_text)
+        times.append(now - start)
+        start = now
+    return "".join(pages), times
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("pdfs", type=Path, nargs="*", help="PDFs to extract (default: generated sample)")
+    parser.add_argument("--pages", type=int, default=20, help="pages of the generated sample")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        pdfs = list(args.pdfs)
+        if not pdfs:
+            pdfs = [Path(tmp) / "sample.pdf"]
+            write_pdf(pdfs[0], (
+                [f"Page {page} line {line}: the quick brown fox jumps over the lazy dog again"
+                 for line in range(45)]
+                for page in range(args.pages)
+            ))
+            
+        print(f"{'pdf':<28} {'mode':<7} {'pages':>5} {'mean ms':>8} {'p50 ms':>7} {'p95 ms':>7} {'words kept':>10}")
+        for pdf_path in pdfs:
+            layout_words = None
+            for mode in ("layout", "fast"):
+                text, times = page_times(PDFChunker(workers=1, mode=mode), pdf_path)
+                words = set(text.split())
+                if layout_words is None:
+                    layout_words = words
+                kept = len(words & layout_words) / max(len(layout_words), 1)
+                ms = sorted(t * 1000 for t in times)
+                print(
+                    f"{pdf_path.name[:28]:<28} {mode:<7} {len(ms):>5} {statistics.mean(ms):>8.1f} "
+                    f"{ms[len(ms) // 2]:>7.1f} {ms[int(len(ms) * 0.95)]:>7.1f} {kept:>10.1%}"
+                )
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,66 @@
+"""
+Benchmark for page-level incremental re-ingest.
+
+Ingests a synthetic PDF, edits one page, and compares re-ingesting the
+whole document with an incremental re-ingest that only extracts and embeds
+the changed page.
+
+Usage:
+    python -m benchmarks.bench_incremental [--pages N]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from pdf2vector.core.chunking import PDFChunker
+from pdf2vector.core.embeddings import EmbeddingGenerator
+from pdf2vector.core.ingestion import IncrementalIngestor
+from pdf2vector.core.vector_store import ChromaDBStore
+
+from tests.sample_pdf import write_pdf
+
+def make_pages(n_pages, edited_page=None):
+    """Build page lines, with different text on the edited page."""
+    return [
+        [f"Page {page} line {line}: {'revised' if page == edited_page else 'original'} requirement text"
+         for line in range(45)]
+        for page in range(n_pages)
+    ]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=50)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = Path(tmp) / "spec.pdf"
+        write_pdf(pdf_path, make_pages(args.pages))
+        chunker = PDFChunker(workers=1)
+        
+        full_store = ChromaDBStore(Path(tmp) / "full", EmbeddingGenerator())
+        ingestor = IncrementalIngestor(chunker, ChromaDBStore(Path(tmp) / "incremental", EmbeddingGenerator()))
+        
+        start = time.perf_counter()
+        full_store.upsert(chunker.iter_chunks(pdf_path))
+        initial = time.perf_counter() - start
+        ingestor.ingest(pdf_path)
+        
+        write_pdf(pdf_path, make_pages(args.pages, edited_page=args.pages // 2))
+        
+        start = time.perf_counter()
+        full_store.upsert(chunker.iter_chunks(pdf_path))
+        full = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        changed = ingestor.ingest(pdf_path)
+        incremental = time.perf_counter() - start
+        
+    print(f"{args.pages} pages, 1 edited")
+    print(f"initial ingest:       {initial:8.2f} s")
+    print(f"full re-ingest:       {full:8.2f} s")
+    print(f"incremental re-ingest:{incremental:8.2f} s ({len(changed)} page re-extracted, {full / incremental:.0f}x faster)")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
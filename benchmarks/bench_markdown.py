@@ -0,0 +1,51 @@
+"""
+Benchmark for MarkdownChunker.
+
+Chunks synthetic Markdown of growing size and reports throughput, which
+stays flat when chunking is linear in the length of the text.
+
+Usage:
+    python -m benchmarks.bench_markdown [--sections N] [--repeat R]
+"""
+
+import argparse
+import time
+
+from pdf2vector.core.chunking import MarkdownChunker
+
+def make_markdown(n_sections: int) -> str:
+    """Build Markdown with headings, paragraphs, code, images, links and page markers."""
+    parts = []
+    for i in range(n_sections):
+        parts.append(f"# Chapter {i}\n")
+        for j in range(3):
+            parts.append(f"## Section {i}.{j}\n")
+            parts.append(
+                f"Paragraph {j} of chapter {i} explains the topic in detail, see "
+                f"[the docs](https://example.com/{i}/{j}) or www.example.org/{i}. " * 4 + "\n"
+            )
+            parts.append(f"![Figure {i}.{j}](figure_{i}_{j}.png)\n")
+            parts.append(f"```python\nprint({i} * {j})\n```\n")
+        parts.append(f"Page {i + 1}\n")
+    return "\n".join(parts)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sections", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    
+    chunker = MarkdownChunker()
+    print(f"{'sections':>9} {'MiB':>7} {'chunks':>7} {'best s':>8} {'MiB/s':>7}")
+    for scale in (1, 4, 16):
+        text = make_markdown(args.sections * scale)
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            chunks = chunker.chunk_text(text, {"filename": "bench.md"})
+            best = min(best, time.perf_counter() - start)
+        size = len(text) / 2**20
+        print(f"{args.sections * scale:>9} {size:>7.1f} {len(chunks):>7} {best:>8.3f} {size / best:>7.1f}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
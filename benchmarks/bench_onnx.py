@@ -0,0 +1,61 @@
+"""
+Benchmark for the local ONNX embedding backend.
+
+Embeds a corpus of mixed-length texts with a local ONNX model for several
+batch sizes, with and without length bucketing, and reports texts per second
+and the share of padding tokens fed to the model.
+
+Usage:
+    python -m benchmarks.bench_onnx --model PATH [--texts N] [--batch-sizes N N ...]
+"""
+
+import argparse
+import random
+import time
+
+from pdf2vector.core.backends import length_buckets
+from pdf2vector.core.onnx_embeddings import OnnxEmbeddingBackend
+
+from .bench_embeddings import make_corpus
+
+def padding_share(lengths, batches):
+    """Return the fraction of padded positions over all batches."""
+    padded = sum(max(lengths[i] for i in batch) * len(batch) for batch in batches)
+    return 1 - sum(lengths) / padded
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--model", required=True, help="model.onnx file or its directory")
+    parser.add_argument("--texts", type=int, default=512)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 8, 32, 64])
+    parser.add_argument("--threads", type=int, default=None)
+    args = parser.parse_args()
+    
+    # Mixed lengths, like chunks cut at paragraph and page boundaries
+    rng = random.Random(0)
+    texts = [" ".join(text.split()[:rng.randint(5, 250)]) for text in make_corpus(args.texts, 250)]
+    
+    backend = OnnxEmbeddingBackend(args.model, threads=args.threads)
+    start = time.perf_counter()
+    backend.embed_many(texts[:1])
+    print(f"model load   {time.perf_counter() - start:8.3f} s, dimension {backend.dimension}")
+    lengths = [len(encoding.ids) for encoding in backend._tokenizer.encode_batch(texts)]
+    
+    print(f"{len(texts)} texts, {sum(lengths)} tokens")
+    print(f"{'batch':>5} {'bucketed':>9} {'texts/s':>10} {'padding':>8}")
+    for batch_size in args.batch_sizes:
+        for bucketed in (False, True):
+            backend.batch_size = batch_size
+            backend.bucket_by_length = bucketed
+            if bucketed:
+                batches = length_buckets(lengths, batch_size)
+            else:
+                batches = [range(i, min(i + batch_size, len(texts))) for i in range(0, len(texts), batch_size)]
+                
+            start = time.perf_counter()
+            backend.embed_many(texts)
+            elapsed = time.perf_counter() - start
+            print(f"{batch_size:>5} {str(bucketed):>9} {len(texts) / elapsed:>10.1f} {padding_share(lengths, batches):>8.1%}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,71 @@
+"""
+Benchmark for quantized embedding storage.
+
+Embeds a sample corpus, stores it at full precision and in the int8 and
+float16 quantized indexes, and reports recall@k against exact float32 search
+together with the memory used by each representation.
+
+Usage:
+    python -m benchmarks.bench_quantization [--chunks N] [--queries N] [--k N]
+"""
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from pdf2vector.core.embeddings import EmbeddingGenerator
+from pdf2vector.core.quantization import QUANTIZATION_MODES, QuantizedIndex
+
+from .bench_embeddings import make_corpus
+
+def make_queries(texts, n_queries, words_per_query=12, seed=1):
+    """Take short word windows from random chunks as queries."""
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(n_queries):
+        words = rng.choice(texts).split()
+        start = rng.randrange(max(1, len(words) - words_per_query))
+        queries.append(" ".join(words[start:start + words_per_query]))
+    return queries
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=5000)
+    parser.add_argument("--words-per-chunk", type=int, default=170)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+    
+    texts = make_corpus(args.chunks, args.words_per_chunk)
+    queries = make_queries(texts, args.queries)
+    generator = EmbeddingGenerator()
+    embeddings = generator.embed_array(texts)
+    query_embeddings = generator.embed_array(queries)
+    ids = [str(i) for i in range(len(texts))]
+    
+    # Exact top-k with full-precision cosine (embeddings are unit length)
+    exact = []
+    for query in query_embeddings:
+        scores = embeddings @ query
+        exact.append(set(np.argsort(-scores, kind="stable")[:args.k].astype(str)))
+        
+    print(f"{len(texts)} chunks, {len(queries)} queries, k={args.k}")
+    print(f"{'mode':<10} {'memory':>12} {'ratio':>7} {'recall@k':>9} {'query ms':>9}")
+    print(f"{'float32':<10} {embeddings.nbytes:>12,} {1.0:>7.2f} {1.0:>9.3f}")
+    
+    for mode in QUANTIZATION_MODES:
+        index = QuantizedIndex(mode, generator.dimension)
+        index.add(ids, embeddings)
+        
+        start = time.perf_counter()
+        found = [{chunk_id for chunk_id, _ in index.search(q, args.k)} for q in query_embeddings]
+        elapsed = (time.perf_counter() - start) / len(queries) * 1000
+        
+        recall = np.mean([len(f & e) / args.k for f, e in zip(found, exact)])
+        ratio = index.memory_bytes / embeddings.nbytes
+        print(f"{mode:<10} {index.memory_bytes:>12,} {ratio:>7.2f} {recall:>9.3f} {elapsed:>9.2f}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
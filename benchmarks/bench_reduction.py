@@ -0,0 +1,61 @@
+"""
+Benchmark for the dimensionality reduction stage.
+
+Embeds a sample corpus, fits each reduction method on its first chunks and
+reports recall@k against exact full-dimension search for several target
+dimensions, together with the size of the reduced vectors.
+
+Usage:
+    python -m benchmarks.bench_reduction [--chunks N] [--sample N] [--dims N N ...]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from pdf2vector.core.embeddings import EmbeddingGenerator
+from pdf2vector.core.reduction import REDUCTION_METHODS, DimensionReducer
+
+from .bench_embeddings import make_corpus
+from .bench_quantization import make_queries
+
+def top_k(embeddings, queries, k):
+    """Return the indices of the k best matches of each query."""
+    scores = queries @ embeddings.T
+    return [set(row) for row in np.argsort(-scores, axis=1, kind="stable")[:, :k]]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=5000)
+    parser.add_argument("--words-per-chunk", type=int, default=170)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--sample", type=int, default=512)
+    parser.add_argument("--dims", type=int, nargs="+", default=[64, 128, 256, 512])
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+    
+    texts = make_corpus(args.chunks, args.words_per_chunk)
+    queries = make_queries(texts, args.queries)
+    generator = EmbeddingGenerator()
+    embeddings = generator.embed_array(texts)
+    query_embeddings = generator.embed_array(queries)
+    exact = top_k(embeddings, query_embeddings, args.k)
+    
+    print(f"{len(texts)} chunks, {len(queries)} queries, k={args.k}, fitted on {args.sample} chunks")
+    print(f"{'method':<8} {'dim':>5} {'memory':>12} {'recall@k':>9} {'fit s':>7}")
+    print(f"{'none':<8} {generator.dimension:>5} {embeddings.nbytes:>12,} {1.0:>9.3f}")
+    
+    for method in REDUCTION_METHODS:
+        for dimension in args.dims:
+            start = time.perf_counter()
+            reducer = DimensionReducer(dimension, method).fit(embeddings[:args.sample])
+            fit_time = time.perf_counter() - start
+            
+            reduced = reducer.transform(embeddings)
+            found = top_k(reduced, reducer.transform(query_embeddings), args.k)
+            recall = np.mean([len(f & e) / args.k for f, e in zip(found, exact)])
+            print(f"{method:<8} {dimension:>5} {reduced.nbytes:>12,} {recall:>9.3f} {fit_time:>7.2f}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,70 @@
+"""
+Benchmark for sentence-boundary chunking.
+
+Extracts a synthetic PDF once, then chunks its pages with ``split_at="char"``
+and ``split_at="sentence"``, reporting chunk count, size spread, chunks
+ending mid-word and chunking time.
+
+Usage:
+    python -m benchmarks.bench_sentence_chunking [--pages N] [--pdf PATH]
+"""
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from pdf2vector.core.chunking import PDFChunker
+
+from tests.sample_pdf import write_pdf
+
+WORDS = "the of and to in is that for it as with was on be by this are from at or an which".split()
+
+def make_pages(n_pages, seed=0):
+    """Build pages of sentences of random length."""
+    rng = random.Random(seed)
+    pages = []
+    for _ in range(n_pages):
+        lines = []
+        for _ in range(40):
+            words = rng.choices(WORDS, k=rng.randint(4, 14))
+            lines.append(" ".join(words).capitalize() + ".")
+        pages.append(lines)
+    return pages
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--pdf", type=Path, default=None, help="use an existing PDF instead")
+    parser.add_argument("--repeat", type=int, default=20, help="times the extracted text is chunked")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = args.pdf
+        if pdf_path is None:
+            pdf_path = Path(tmp) / "sample.pdf"
+            write_pdf(pdf_path, make_pages(args.pages))
+        pages = list(PDFChunker(workers=1).iter_pages(pdf_path))
+        
+    print(f"{sum(map(len, pages)):,} characters in {len(pages)} pages")
+    print(f"{'mode':<9} {'chunks':>7} {'mean':>7} {'stdev':>7} {'mid-word':>9} {'ms':>8}")
+    for mode in ("char", "sentence"):
+        chunker = PDFChunker(workers=1, split_at=mode)
+        chunker.iter_pages = lambda path: iter(pages)
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            chunks = chunker.chunk_pdf(pdf_path)
+        elapsed = (time.perf_counter() - start) / args.repeat
+        
+        sizes = [len(chunk) for chunk in chunks]
+        texts = [chunk.text for chunk in chunks]
+        mid_word = sum(text[-1:].isalnum() for text in texts[:-1]) / max(len(texts) - 1, 1)
+        print(
+            f"{mode:<9} {len(chunks):>7} {statistics.mean(sizes):>7.0f} {statistics.pstdev(sizes):>7.0f} "
+            f"{mid_word:>8.0%} {elapsed * 1000:>8.1f}"
+        )
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,60 @@
+"""
+Benchmark for the binary sketch prefilter.
+
+Embeds a sample corpus and compares sketch search, for several shortlist
+sizes, with brute-force dense search, reporting per-query latency and
+recall@k against exact search.
+
+Usage:
+    python -m benchmarks.bench_sketch [--chunks N] [--queries N] [--candidates N N ...]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from pdf2vector.core.embeddings import EmbeddingGenerator
+from pdf2vector.core.sketch_index import SketchIndex
+
+from .bench_embeddings import make_corpus
+from .bench_quantization import make_queries
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=50000)
+    parser.add_argument("--words-per-chunk", type=int, default=170)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--candidates", type=int, nargs="+", default=[100, 300, 1000])
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+    
+    texts = make_corpus(args.chunks, args.words_per_chunk)
+    queries = make_queries(texts, args.queries)
+    generator = EmbeddingGenerator()
+    embeddings = generator.embed_array(texts)
+    query_embeddings = generator.embed_array(queries)
+    ids = [str(i) for i in range(len(texts))]
+    
+    start = time.perf_counter()
+    exact = [set(np.argpartition(-(embeddings @ q), args.k)[:args.k].astype(str)) for q in query_embeddings]
+    dense_time = (time.perf_counter() - start) / len(queries) * 1000
+    
+    index = SketchIndex(generator.dimension)
+    index.add(ids, embeddings)
+    
+    print(f"{len(texts)} chunks, {len(queries)} queries, k={args.k}")
+    print(f"memory: dense {embeddings.nbytes:,} bytes, sketches {index.sketch_bytes:,} bytes")
+    print(f"{'method':<16} {'ms/query':>10} {'recall@k':>9}")
+    print(f"{'dense':<16} {dense_time:>10.3f} {1.0:>9.3f}")
+    
+    for candidates in args.candidates:
+        index.candidates = candidates
+        start = time.perf_counter()
+        found = [{chunk_id for chunk_id, _ in index.search(q, args.k)} for q in query_embeddings]
+        elapsed = (time.perf_counter() - start) / len(queries) * 1000
+        recall = np.mean([len(f & e) / args.k for f, e in zip(found, exact)])
+        print(f"{f'sketch@{candidates}':<16} {elapsed:>10.3f} {recall:>9.3f}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
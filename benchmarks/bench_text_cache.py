@@ -0,0 +1,55 @@
+"""
+Benchmark for the extracted-text cache.
+
+Chunks a synthetic PDF once with an empty cache, then re-chunks it with
+other chunk sizes, as a chunking experiment would, and reports timings and
+the compressed size of the cached text.
+
+Usage:
+    python -m benchmarks.bench_text_cache [--pages N] [--pdf PATH]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from pdf2vector.core.chunking import PDFChunker
+from pdf2vector.core.text_cache import TextCache
+
+from tests.sample_pdf import write_pdf
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--pdf", type=Path, default=None, help="use an existing PDF instead")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = args.pdf
+        if pdf_path is None:
+            pdf_path = Path(tmp) / "sample.pdf"
+            write_pdf(pdf_path, (
+                [f"Page {page} line {line}: the quick brown fox jumps over the lazy dog again"
+                 for line in range(45)]
+                for page in range(args.pages)
+            ))
+        cache = TextCache(Path(tmp) / "texts.sqlite")
+        
+        print(f"{'run':<24} {'chunks':>7} {'seconds':>9}")
+        for label, chunk_size, chunk_overlap in (
+            ("extract (cold cache)", 1000, 200),
+            ("re-chunk 500/100", 500, 100),
+            ("re-chunk 2000/400", 2000, 400),
+        ):
+            chunker = PDFChunker(chunk_size, chunk_overlap, workers=1, text_cache=cache)
+            start = time.perf_counter()
+            chunks = chunker.chunk_pdf(pdf_path)
+            print(f"{label:<24} {len(chunks):>7} {time.perf_counter() - start:>9.3f}")
+            
+        text_size = sum(len(chunk) for chunk in PDFChunker(10**9, 0, workers=1, text_cache=cache).chunk_pdf(pdf_path))
+        print(f"cached text: {text_size:,} characters in {cache.size_bytes:,} compressed bytes")
+        cache.close()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
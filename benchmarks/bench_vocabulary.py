@@ -0,0 +1,61 @@
+"""
+Benchmark for the persistent vocabulary table.
+
+Simulates a cold-started process: a fresh generator embeds a corpus by
+hashing every word, then another fresh generator does the same after opening
+a vocabulary table built for that corpus.
+
+Usage:
+    python -m benchmarks.bench_vocabulary [--chunks N] [--words-per-chunk N]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from pdf2vector.core.embeddings import EmbeddingGenerator
+
+from .bench_embeddings import make_corpus
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=2000)
+    parser.add_argument("--words-per-chunk", type=int, default=170)
+    parser.add_argument("--vocabulary-size", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    
+    texts = make_corpus(args.chunks, args.words_per_chunk, args.vocabulary_size)
+    n_words = sum(len(text.split()) for text in texts)
+    print(f"{len(texts)} chunks, {n_words} words")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "vocabulary"
+        start = time.perf_counter()
+        table = EmbeddingGenerator().build_vocabulary(texts, path)
+        print(f"build        {time.perf_counter() - start:8.3f} s  {len(table)} words")
+        
+        # Best of several runs, each with a fresh generator and cold caches
+        hashed = total = opened = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            cold = EmbeddingGenerator().embed_array(texts)
+            hashed = min(hashed, time.perf_counter() - start)
+            
+            start = time.perf_counter()
+            generator = EmbeddingGenerator(vocabulary=path)
+            opened = min(opened, time.perf_counter() - start)
+            warm = generator.embed_array(texts)
+            total = min(total, time.perf_counter() - start)
+            
+        print(f"cold hash    {hashed:8.3f} s  {n_words / hashed:12,.0f} words/sec")
+        print(f"table open   {opened:8.3f} s")
+        print(f"cold table   {total:8.3f} s  {n_words / total:12,.0f} words/sec")
+        print(f"speedup      {hashed / total:8.1f}x")
+        print(f"identical    {np.array_equal(cold, warm)}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
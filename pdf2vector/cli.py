@@ -112,6 +112,21 @@ def process(
         "--persist-dir",
         "-p",
         help="Directory to persist the vector store"
+    ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Only re-extract and re-embed the pages that changed since the last run"
+    ),
+    split_at: str = typer.Option(
+        "char",
+        "--split-at",
+        help="Where to cut chunks: char, sentence or content"
+    ),
+    dedup: Optional[str] = typer.Option(
+        None,
+        "--dedup",
+        help="Skip near-duplicate chunks (skip) or keep them as references (reference)"
     )
 ):
     """Process a single PDF file."""
@@ -126,7 +141,10 @@ def process(
             # Initialize application
             pdf2vector = PDF2Vector(
                 input_dir=input_dir,
-                persist_dir=persist_dir
+                persist_dir=persist_dir,
+                incremental=incremental,
+                split_at=split_at,
+                dedup=dedup
             )
             
             # Process PDF
@@ -140,4 +158,4 @@ def process(
         raise typer.Exit(1)
 
 if __name__ == "__main__":
-    app() 
\ No newline at end of file
+    app()
\ No newline at end of file
@@ -7,10 +7,12 @@ PDF processing, vector storage, and question answering.
 
 import logging
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
 from .chunking import PDFChunker
 from .embeddings import EmbeddingGenerator
+from .ingestion import IncrementalIngestor
+from .text_cache import TextCache
 from .vector_store import ChromaDBStore
 
 logger = logging.getLogger(__name__)
@@ -18,24 +20,43 @@ logger = logging.getLogger(__name__)
 class PDF2Vector:
     """Main application class for PDF to vector conversion."""
     
-    def __init__(self, input_dir: str, persist_dir: str):
+    def __init__(
+        self,
+        input_dir: str,
+        persist_dir: str,
+        incremental: bool = False,
+        split_at: str = "char",
+        dedup: Optional[str] = None
+    ):
         """Initialize the application.
         
         Args:
             input_dir: Directory to watch for PDF files.
             persist_dir: Directory to persist the vector store.
+            incremental: If True, PDFs are chunked page by page and a
+                re-ingest only extracts and embeds the pages that changed.
+            split_at: Where chunks are cut, see ``PDFChunker``. With
+                ``"content"``, re-processing an edited PDF only embeds the
+                chunks around the edits.
+            dedup: ``"skip"`` or ``"reference"`` to avoid embedding chunks
+                that nearly repeat stored ones, see ``ChromaDBStore``.
         """
         self.input_dir = Path(input_dir)
         self.persist_dir = Path(persist_dir)
         
         # Initialize components
-        self.chunker = PDFChunker()
+        self.text_cache = TextCache(self.persist_dir / "text_cache.sqlite")
+        self.chunker = PDFChunker(split_at=split_at, text_cache=self.text_cache)
         self.embedding_generator = EmbeddingGenerator()
         self.vector_store = ChromaDBStore(
             persist_dir=self.persist_dir,
-            embedding_generator=self.embedding_generator
+            embedding_generator=self.embedding_generator,
+            dedup=dedup
         )
-        
+        self.ingestor: Optional[IncrementalIngestor] = None
+        if incremental:
+            self.ingestor = IncrementalIngestor(self.chunker, self.vector_store)
+            
         logger.info("Initialized PDF2Vector application")
         
     def process_pdf(self, pdf_path: Path):
@@ -47,12 +68,14 @@ class PDF2Vector:
         try:
             logger.info(f"Processing PDF: {pdf_path}")
             
-            # Extract text and chunk
-            chunks = self.chunker.chunk_pdf(pdf_path)
-            
-            # Store chunks in vector store
-            self.vector_store.upsert(chunks)
-            
+            if self.ingestor is not None:
+                # Only extract and embed the pages that changed
+                self.ingestor.ingest(pdf_path)
+            else:
+                # Extract text page by page and store chunks as they are produced,
+                # embedding only those not stored yet
+                self.vector_store.sync_document(pdf_path.name, self.chunker.iter_chunks(pdf_path))
+                
             logger.info(f"Successfully processed PDF: {pdf_path}")
             
         except Exception as e:
@@ -90,4 +113,4 @@ class PDF2Vector:
             
         except Exception as e:
             logger.error(f"Error answering question: {str(e)}")
-            raise 
\ No newline at end of file
+            raise
\ No newline at end of file
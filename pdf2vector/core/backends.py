@@ -0,0 +1,106 @@
+"""
+Embedding backend module for pdf2vector.
+
+This module defines the interface of the model backends behind
+``EmbeddingGenerator`` and a registry that selects a backend from the
+prefix of a model name, such as ``onnx:/models/minilm``.
+"""
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+Vectors = Union[np.ndarray, List[List[float]]]
+
+class EmbeddingBackend(ABC):
+    """Interface of a model that turns batches of texts into embeddings."""
+    
+    @property
+    @abstractmethod
+    def dimension(self) -> Optional[int]:
+        """Embedding dimension, or None if the backend cannot tell."""
+        
+    @abstractmethod
+    def embed_many(self, texts: List[str]) -> Vectors:
+        """Embed texts.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            One embedding per text, in input order
+        """
+        
+    def embed_one(self, text: str) -> List[float]:
+        """Embed a single text.
+        
+        Args:
+            text: Text to embed
+            
+        Returns:
+            List[float]: The embedding
+        """
+        return list(np.asarray(self.embed_many([text])[0], dtype=float))
+        
+    async def aembed_many(self, texts: List[str]) -> Vectors:
+        """Embed texts from asyncio code without blocking the event loop.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            One embedding per text, in input order
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.embed_many, texts)
+        
+    def close(self):
+        """Release the resources held by the backend."""
+
+BackendFactory = Callable[..., EmbeddingBackend]
+
+_BACKENDS: Dict[str, BackendFactory] = {}
+
+def register_backend(prefix: str, factory: BackendFactory):
+    """Register a backend for model names of the form ``prefix:location``.
+    
+    Args:
+        prefix: Model name prefix, without the colon
+        factory: Called as ``factory(location, **backend_options)``
+    """
+    _BACKENDS[prefix] = factory
+
+def find_backend(model_name: str) -> Optional[Tuple[BackendFactory, str]]:
+    """Find the registered backend serving a model name.
+    
+    Args:
+        model_name: Model name, e.g. ``onnx:/models/minilm``
+        
+    Returns:
+        Tuple of (factory, location), or None if no prefix matches
+    """
+    prefix, separator, location = model_name.partition(":")
+    if not separator or prefix not in _BACKENDS:
+        return None
+    return _BACKENDS[prefix], location
+
+def length_buckets(lengths: Sequence[int], batch_size: int) -> List[np.ndarray]:
+    """Group items of similar length into batches.
+    
+    Items are sorted by length and cut into consecutive batches, so each
+    batch only pads up to the longest of a few similar items.
+    
+    Args:
+        lengths: Length of each item, e.g. its number of tokens
+        batch_size: Maximum number of items per batch
+        
+    Returns:
+        List of index arrays, one per batch, covering every item once
+    """
+    order = np.argsort(np.asarray(lengths, dtype=np.int64), kind="stable")
+    return [order[start:start + batch_size] for start in range(0, len(order), batch_size)]
\ No newline at end of file
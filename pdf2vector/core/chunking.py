@@ -6,73 +6,895 @@ and split it into chunks for processing.
 """
 
 import logging
+import math
+import os
+import re
+from bisect import bisect_left, bisect_right
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from io import StringIO
 from pathlib import Path
-from typing import List, Dict, Any
-from dataclasses import dataclass
+from typing import Any, BinaryIO, Container, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from pdfminer.high_level import extract_text
+import numpy as np
+import pdfminer
+from pdfminer.converter import TextConverter
+from pdfminer.layout import LAParams
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdfparser import PDFParser
+from pdfminer.pdftypes import PDFStream, resolve1
+
+from .text_cache import TextCache
+from .text_device import RawTextDevice
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Version of the page text extraction, part of the text cache keys; bump it
+# whenever a change alters the extracted text
+EXTRACTOR_VERSION = 1
+
+# Extraction profiles: full layout analysis, or raw text in drawing order
+EXTRACTION_MODES = ("layout", "fast")
+
+# Smallest number of pages handed to a worker at once
+MIN_PAGE_RANGE = 8
+
+# Number of parsed object streams kept while reading pages
+OBJECT_STREAM_CACHE = 8
+
+# Markdown boilerplate removed by MarkdownChunker.clean_text, matched in one
+# pass. Links keep their text; an unclosed code fence runs to the end.
+_BOILERPLATE = re.compile(
+    r"(?P<fence>^[ \t]*(?P<marker>`{3,}|~{3,})[^\n]*\n(?:.*?^[ \t]*(?P=marker)[ \t]*$|.*\Z))"
+    r"|(?P<page>^[ \t]*page[ \t]+\d+(?:[ \t]+of[ \t]+\d+)?[ \t]*$)"
+    r"|(?P<image>!\[[^\]\n]*\]\([^)\n]*\))"
+    r"|\[(?P<link>[^\]\n]*)\]\([^)\n]*\)"
+    r"|(?P<url>(?:https?|ftp)://[^\s)\]>]+|www\.[^\s)\]>]+)",
+    re.MULTILINE | re.DOTALL | re.IGNORECASE
+)
+_BLANK_LINES = re.compile(r"\n(?:[ \t]*\n)+")
+_HEADING = re.compile(r"^[ \t]*(#{1,6})[ \t]+\S", re.MULTILINE)
+_PARAGRAPH_BREAK = re.compile(r"\n[ \t]*\n")
+
+# Where PDFChunker may cut chunks: anywhere, at sentence boundaries, or where
+# a rolling hash of the content picks a boundary
+SPLIT_MODES = ("char", "sentence", "content")
+
+# End of a sentence, paragraph or page; a boundary lies where a match ends
+_SENTENCE_BOUNDARY = re.compile(r"[.!?][\"')\]]*\s+|\n[ \t]*\n\s*|\f\s*")
+
+# Characters rescanned before a page seam for boundaries spanning it
+_BOUNDARY_LOOKBACK = 8
+
+# Number of characters the gear hash of content-defined chunking covers
+_GEAR_WINDOW = 64
+
+# splitmix64 constants turning character codes into gear values
+_GEAR_SEED = np.uint64(0x9E3779B97F4A7C15)
+_GEAR_MIX = (np.uint64(0xBF58476D1CE4E5B9), np.uint64(0x94D049BB133111EB))
+
+# Names of the per-chunk metadata values of each chunker
+_MARKDOWN_KEYS = ("chunk_index", "chunk_size")
+_PDF_KEYS = ("chunk_index", "page_start", "page_end")
+_PAGE_KEYS = ("chunk_index", "page")
+_CONTENT_KEYS = ("chunk_index", "page_start", "page_end", "occurrence")
+
 class Chunk:
-    """A chunk of text with metadata."""
-    text: str
-    metadata: Dict[str, Any]
+    """A chunk of text with metadata.
+    
+    A chunk is a ``start:end`` span of a text buffer shared with the other
+    chunks cut from it, and its text is only sliced out when read. Its
+    metadata is a dict shared by the chunks of a document plus a tuple of
+    per-chunk values, merged into a dict the first time it is read.
+    """
+    __slots__ = ("_buffer", "start", "end", "_shared", "_keys", "_values", "_metadata")
+    
+    def __init__(self, text: str, metadata: Dict[str, Any]):
+        """Initialize a chunk holding its own text and metadata.
+        
+        Args:
+            text: Text of the chunk.
+            metadata: Metadata of the chunk.
+        """
+        self._buffer = text
+        self.start = 0
+        self.end = len(text)
+        self._metadata: Optional[Dict[str, Any]] = metadata
+        self._shared: Dict[str, Any] = {}
+        self._keys: Tuple[str, ...] = ()
+        self._values: Tuple[Any, ...] = ()
+        
+    @classmethod
+    def view(
+        cls,
+        buffer: str,
+        start: int,
+        end: int,
+        shared: Dict[str, Any],
+        keys: Tuple[str, ...],
+        values: Tuple[Any, ...]
+    ) -> "Chunk":
+        """Create a chunk over a span of a shared buffer without copying it.
+        
+        Args:
+            buffer: Text the chunk is cut from.
+            start: Offset of the first character of the chunk in ``buffer``.
+            end: Offset one past the last character, clamped to ``buffer``.
+            shared: Metadata common to all chunks of the document; it must
+                not be modified afterwards.
+            keys: Names of the per-chunk metadata values, usually a constant
+                tuple shared by all chunks.
+            values: Per-chunk metadata values.
+            
+        Returns:
+            Chunk: The new chunk.
+        """
+        chunk = cls.__new__(cls)
+        chunk._buffer = buffer
+        chunk.start = start
+        chunk.end = min(end, len(buffer))
+        chunk._metadata = None
+        chunk._shared = shared
+        chunk._keys = keys
+        chunk._values = values
+        return chunk
+        
+    @property
+    def text(self) -> str:
+        """Text of the chunk, sliced from the buffer on every read."""
+        return self._buffer[self.start:self.end]
+        
+    @text.setter
+    def text(self, text: str):
+        self._buffer = text
+        self.start = 0
+        self.end = len(text)
+        
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Metadata of the chunk, built on first read."""
+        if self._metadata is None:
+            self._metadata = {**self._shared, **dict(zip(self._keys, self._values))}
+        return self._metadata
+        
+    @metadata.setter
+    def metadata(self, metadata: Dict[str, Any]):
+        self._metadata = metadata
+        
+    def __len__(self) -> int:
+        """Return the length of the text without materializing it."""
+        return self.end - self.start
+        
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Chunk):
+            return NotImplemented
+        return self.text == other.text and self.metadata == other.metadata
+        
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return f"Chunk(text={self.text!r}, metadata={self.metadata!r})"
+
+def _drop_boilerplate(match: re.Match) -> str:
+    """Replacement for a _BOILERPLATE match: the link text, or nothing."""
+    return match.group("link") or ""
+
+class MarkdownChunker:
+    """Splits Markdown into chunks along its headings and paragraphs.
+    
+    Every step scans the text once with precompiled regular expressions and
+    slices each character out at most once, so chunking is linear in the
+    length of the text.
+    """
+    
+    def __init__(self, min_chunk_size: int = 200, max_chunk_size: int = 1000):
+        """Initialize the chunker.
+        
+        Args:
+            min_chunk_size: Pieces shorter than this are merged with their
+                neighbours.
+            max_chunk_size: Maximum size of each chunk in characters.
+        """
+        self.min_chunk_size = min_chunk_size
+        self.max_chunk_size = max_chunk_size
+        
+    def clean_text(self, text: str) -> str:
+        """Remove page markers, fenced code, images and URLs.
+        
+        Links are replaced by their text and runs of blank lines are
+        collapsed into one.
+        
+        Args:
+            text: Markdown text.
+            
+        Returns:
+            The cleaned text.
+        """
+        text = _BOILERPLATE.sub(_drop_boilerplate, text)
+        return _BLANK_LINES.sub("\n\n", text).strip()
+        
+    def split_by_headings(self, text: str) -> List[str]:
+        """Split text into sections at its top-level headings.
+        
+        The top level is the shallowest heading level in the text, so
+        subsections stay with their parent section. Text before the first
+        heading forms its own section.
+        
+        Args:
+            text: Markdown text.
+            
+        Returns:
+            Non-empty sections, in order.
+        """
+        headings = [(match.start(), len(match.group(1))) for match in _HEADING.finditer(text)]
+        if not headings:
+            return [text.strip()] if text.strip() else []
+            
+        top_level = min(level for _, level in headings)
+        bounds = [0] + [start for start, level in headings if level == top_level] + [len(text)]
+        sections = (text[start:end].strip() for start, end in zip(bounds, bounds[1:]))
+        return [section for section in sections if section]
+        
+    def split_by_paragraphs(self, text: str) -> List[str]:
+        """Split text into paragraphs at blank lines.
+        
+        Args:
+            text: Text to split.
+            
+        Returns:
+            Non-empty paragraphs, in order.
+        """
+        paragraphs = (paragraph.strip() for paragraph in _PARAGRAPH_BREAK.split(text))
+        return [paragraph for paragraph in paragraphs if paragraph]
+        
+    def merge_small_chunks(self, chunks: List[str]) -> List[str]:
+        """Merge runs of consecutive small chunks.
+        
+        Chunks shorter than ``min_chunk_size`` are joined with the small
+        chunks that follow them, up to ``max_chunk_size``; larger chunks are
+        kept as they are.
+        
+        Args:
+            chunks: Chunks of text, in order.
+            
+        Returns:
+            The merged chunks, in order.
+        """
+        merged: List[str] = []
+        parts: List[str] = []
+        size = 0
+        
+        for chunk in chunks:
+            if len(chunk) >= self.min_chunk_size:
+                if parts:
+                    merged.append("\n\n".join(parts))
+                    parts, size = [], 0
+                merged.append(chunk)
+                continue
+                
+            joined_size = size + 2 + len(chunk) if parts else len(chunk)
+            if parts and joined_size > self.max_chunk_size:
+                merged.append("\n\n".join(parts))
+                parts, joined_size = [], len(chunk)
+            parts.append(chunk)
+            size = joined_size
+            
+        if parts:
+            merged.append("\n\n".join(parts))
+        return merged
+        
+    def _split_long(self, text: str) -> List[str]:
+        """Cut a paragraph longer than ``max_chunk_size`` at whitespace.
+        
+        Args:
+            text: Paragraph to cut.
+            
+        Returns:
+            Pieces of at most ``max_chunk_size`` characters.
+        """
+        pieces = []
+        start = 0
+        while len(text) - start > self.max_chunk_size:
+            end = start + self.max_chunk_size
+            # Prefer the last space in the second half of the window
+            space = text.rfind(" ", start + self.max_chunk_size // 2, end)
+            if space > start:
+                end = space
+            pieces.append(text[start:end].strip())
+            start = end
+        pieces.append(text[start:].strip())
+        return [piece for piece in pieces if piece]
+        
+    def chunk_text(self, text: str, metadata: Dict[str, Any]) -> List[Chunk]:
+        """Clean Markdown and split it into chunks.
+        
+        Sections longer than ``max_chunk_size`` are split into paragraphs,
+        each heading staying with the paragraph after it, and paragraphs
+        that are still too long are cut at whitespace. Small pieces are then
+        merged.
+        
+        Args:
+            text: Markdown text.
+            metadata: Metadata copied into every chunk.
+            
+        Returns:
+            List of Chunk objects with ``chunk_index`` and ``chunk_size`` added
+            to their metadata.
+        """
+        pieces: List[str] = []
+        for section in self.split_by_headings(self.clean_text(text)):
+            if len(section) <= self.max_chunk_size:
+                pieces.append(section)
+                continue
+            heading = ""
+            for paragraph in self.split_by_paragraphs(section):
+                # Keep headings with the paragraph that follows them
+                if "\n" not in paragraph and _HEADING.match(paragraph):
+                    heading = f"{heading}{paragraph}\n\n"
+                    continue
+                paragraph = heading + paragraph
+                heading = ""
+                if len(paragraph) <= self.max_chunk_size:
+                    pieces.append(paragraph)
+                else:
+                    pieces.extend(self._split_long(paragraph))
+            if heading:
+                pieces.append(heading.strip())
+                
+        shared = dict(metadata)
+        chunks = [
+            Chunk.view(piece, 0, len(piece), shared, _MARKDOWN_KEYS, (i, len(piece)))
+            for i, piece in enumerate(self.merge_small_chunks(pieces))
+        ]
+        logger.info(f"Split text into {len(chunks)} chunks")
+        return chunks
+
+def _gear_hashes(text: str) -> np.ndarray:
+    """Compute the gear hash ending at every character of a text.
+    
+    The hash at position ``i`` is the FastCDC rolling hash
+    ``h = (h << 1) + gear(text[i])`` modulo 2**64, which only depends on the
+    last ``_GEAR_WINDOW`` characters. It is computed for all positions at
+    once by doubling the covered window in log2(``_GEAR_WINDOW``) steps.
+    
+    Args:
+        text: Text to hash.
+        
+    Returns:
+        np.ndarray: uint64 hash of each position.
+    """
+    codes = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    
+    # splitmix64 gives every character a pseudo-random gear value
+    gears = codes.astype(np.uint64) + _GEAR_SEED
+    gears = (gears ^ (gears >> np.uint64(30))) * _GEAR_MIX[0]
+    gears = (gears ^ (gears >> np.uint64(27))) * _GEAR_MIX[1]
+    hashes = gears ^ (gears >> np.uint64(31))
+    
+    width = 1
+    while width < _GEAR_WINDOW:
+        shifted = hashes[:-width] << np.uint64(width)
+        hashes = hashes.copy()
+        hashes[width:] += shifted
+        width *= 2
+    return hashes
 
 class PDFChunker:
     """Extracts and chunks text from PDFs."""
     
-    def __init__(self, chunk_size: int = 1000, chunk_overlap: int = 200):
+    def __init__(
+        self,
+        chunk_size: int = 1000,
+        chunk_overlap: int = 200,
+        workers: Optional[int] = None,
+        parallel_threshold: int = 200,
+        split_at: str = "char",
+        text_cache: Optional[TextCache] = None,
+        mode: str = "layout"
+    ):
         """Initialize the chunker.
         
         Args:
             chunk_size: Target size of each chunk in characters.
             chunk_overlap: Number of characters to overlap between chunks.
+            workers: Number of processes extracting pages of large PDFs
+                (default: number of CPUs, 1 disables the pool).
+            parallel_threshold: Minimum number of pages in a PDF before its
+                pages are extracted in parallel.
+            split_at: ``"char"`` cuts chunks at exactly ``chunk_size``
+                characters; ``"sentence"`` cuts them and starts their overlap
+                at the nearest sentence, paragraph or page boundary, so
+                chunks never exceed ``chunk_size``. ``"content"`` picks cuts
+                from a rolling hash of the text, FastCDC style, so an edit
+                only moves the cuts next to it; chunks are between a quarter
+                and all of ``chunk_size``, average about half of it and do
+                not overlap.
+            text_cache: Optional cache of extracted page texts, consulted
+                before a PDF is extracted.
+            mode: ``"layout"`` runs pdfminer's layout analysis on every page;
+                ``"fast"`` skips it and writes text in the order it is drawn,
+                which is faster but can interleave multi-column text.
         """
+        if split_at not in SPLIT_MODES:
+            raise ValueError(f"Unsupported split mode: {split_at}")
+        if mode not in EXTRACTION_MODES:
+            raise ValueError(f"Unsupported extraction mode: {mode}")
+            
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        self.split_at = split_at
+        self.text_cache = text_cache
+        self.mode = mode
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.parallel_threshold = parallel_threshold
         
-    def chunk_pdf(self, pdf_path: Path) -> List[Chunk]:
-        """Extract text from a PDF and split it into chunks.
+        # Content-defined cuts: size bounds, and the leading bits of the gear
+        # hash that must be zero for a cut before (strong) and after (weak)
+        # the average size, as in FastCDC's normalized chunking
+        self.min_size = max(1, chunk_size // 4)
+        self.avg_size = max(2, chunk_size // 2)
+        bits = round(math.log2(self.avg_size))
+        self._strong_shift = np.uint64(64 - (bits + 2))
+        self._weak_shift = np.uint64(64 - max(1, bits - 2))
+        
+    @property
+    def extractor_version(self) -> str:
+        """Identifies the extraction producing the page texts, for caching."""
+        return f"pdfminer-{pdfminer.__version__}/{EXTRACTOR_VERSION}/{self.mode}"
+        
+    def iter_pages(self, pdf_path: Path) -> Iterator[str]:
+        """Extract the text of a PDF one page at a time.
+        
+        The pages concatenate to the same text as
+        ``pdfminer.high_level.extract_text``. PDFs of at least
+        ``parallel_threshold`` pages are split into page ranges extracted by
+        a process pool, and the pages are still yielded in order. With a
+        text cache, a PDF whose content was extracted before is streamed
+        from the cache, and extracted pages are written to it as they are
+        yielded; the PDF becomes a cache hit once fully extracted.
         
         Args:
             pdf_path: Path to the PDF file.
             
+        Yields:
+            Text of each page, in order.
+        """
+        if self.text_cache is None:
+            yield from self._extract(pdf_path)
+            return
+            
+        digest = TextCache.digest(pdf_path)
+        pages = self.text_cache.get(digest, self.extractor_version)
+        if pages is not None:
+            logger.info(f"Reading {pdf_path} from the text cache")
+            yield from pages
+            return
+            
+        n_pages = 0
+        for page_text in self._extract(pdf_path):
+            self.text_cache.put_page(digest, self.extractor_version, n_pages, page_text)
+            n_pages += 1
+            yield page_text
+        self.text_cache.finish(digest, self.extractor_version, n_pages)
+        
+    def _extract(self, pdf_path: Path) -> Iterator[str]:
+        """Extract the pages of a PDF, in a process pool if it is large.
+        
+        Args:
+            pdf_path: Path to the PDF file.
+            
+        Yields:
+            Text of each page, in order.
+        """
+        if self.workers > 1:
+            n_pages = count_pages(pdf_path)
+            if n_pages >= self.parallel_threshold:
+                yield from self._iter_pages_parallel(pdf_path, n_pages)
+                return
+                
+        yield from _extract_pages(pdf_path, mode=self.mode)
+        
+    def _iter_pages_parallel(self, pdf_path: Path, n_pages: int) -> Iterator[str]:
+        """Extract page ranges in a process pool and yield pages in order.
+        
+        Only a few ranges per worker are in flight at once, so the text of
+        pages waiting to be consumed stays bounded.
+        
+        Args:
+            pdf_path: Path to the PDF file.
+            n_pages: Number of pages in the PDF.
+            
+        Yields:
+            Text of each page, in order.
+        """
+        # A few ranges per worker keeps the pool balanced
+        step = max(MIN_PAGE_RANGE, -(-n_pages // (self.workers * 4)))
+        ranges = iter(range(0, n_pages, step))
+        logger.info(f"Extracting {n_pages} pages with {self.workers} workers in ranges of {step}")
+        
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            pending: Deque[Future] = deque()
+            
+            def submit_next() -> bool:
+                first = next(ranges, None)
+                if first is None:
+                    return False
+                pending.append(pool.submit(
+                    _extract_page_range, str(pdf_path), first, min(first + step, n_pages), self.mode
+                ))
+                return True
+                
+            while len(pending) < self.workers * 2 and submit_next():
+                pass
+                
+            try:
+                while pending:
+                    pages = pending.popleft().result()
+                    submit_next()
+                    yield from pages
+            finally:
+                # Stop early if the caller stops consuming pages
+                for future in pending:
+                    future.cancel()
+                    
+    def _next_cut(self, start: int, boundaries: Optional[List[int]]) -> Tuple[int, int]:
+        """Choose where the chunk starting at ``start`` ends and the next begins.
+        
+        With boundaries, the chunk ends at the last boundary within
+        ``chunk_size`` if that keeps it over half full, and the next chunk
+        starts at the first boundary within the overlap. Without a suitable
+        boundary, both fall back to fixed character offsets.
+        
+        Args:
+            start: Document offset where the chunk starts.
+            boundaries: Sorted document offsets of sentence boundaries, or None
+                to cut at fixed offsets.
+                
         Returns:
-            List of Chunk objects containing text and metadata.
+            Tuple of (end of this chunk, start of the next chunk).
         """
-        try:
-            # Extract text from PDF
-            text = extract_text(str(pdf_path))
+        end = start + self.chunk_size
+        next_start = end - self.chunk_overlap
+        if boundaries is None:
+            return end, next_start
             
-            # Split into chunks
-            chunks = []
-            start = 0
-            chunk_index = 0
+        i = bisect_right(boundaries, end) - 1
+        if i >= 0 and boundaries[i] > start + self.chunk_size // 2:
+            end = boundaries[i]
+        next_start = max(end - self.chunk_overlap, start + 1)
+        j = bisect_left(boundaries, next_start)
+        if j < len(boundaries) and boundaries[j] < end:
+            next_start = boundaries[j]
+        return end, next_start
+        
+    def _next_content_cut(self, start: int, cuts: Tuple[List[int], List[int]], limit: int) -> int:
+        """Choose where the content-defined chunk starting at ``start`` ends.
+        
+        The chunk ends at the first strong cut point between ``min_size`` and
+        ``avg_size``, else at the first weak cut point up to ``chunk_size``,
+        else at ``chunk_size``.
+        
+        Args:
+            start: Document offset where the chunk starts.
+            cuts: Sorted document offsets of the strong and weak cut points.
+            limit: Document offset where the text ends.
             
-            while start < len(text):
-                # Get chunk text
-                end = start + self.chunk_size
-                chunk_text = text[start:end]
+        Returns:
+            int: Document offset where the chunk ends.
+        """
+        strong, weak = cuts
+        end = min(start + self.chunk_size, limit)
+        i = bisect_right(strong, start + self.min_size)
+        if i < len(strong) and strong[i] <= min(start + self.avg_size, end):
+            return strong[i]
+        j = bisect_right(weak, start + self.avg_size)
+        if j < len(weak) and weak[j] <= end:
+            return weak[j]
+        return end
+        
+    def _iter_spans(
+        self,
+        pages: Iterable[str],
+        slice_tail: bool = True
+    ) -> Iterator[Tuple[str, int, int, int, int]]:
+        """Cut the text of consecutive pages into chunk spans as it arrives.
+        
+        Only the text not yet covered by a chunk is kept in memory, and pages
+        come from :func:`iter_pdf_pages`, which drops each page's parsed
+        objects, so memory stays flat however many pages there are. In ``"sentence"`` mode the
+        boundaries of each page are found in one regex pass into a sorted
+        list of offsets, and cut points are chosen from it by bisection. In
+        ``"content"`` mode the gear hash of each page is computed with NumPy
+        and the offsets where it matches the strong and weak masks are kept
+        the same way.
+        
+        Args:
+            pages: Text of each page, in order.
+            slice_tail: In ``"char"`` mode, keep cutting the end of the text
+                into overlapping chunks like whole-document slicing does;
+                otherwise the rest becomes one chunk.
+                
+        Yields:
+            Tuples of (buffer, start, end, page_start, page_end): the chunk is
+            ``buffer[start:end]`` and draws text from pages ``page_start`` to
+            ``page_end`` (1-based).
+        """
+        buffer = ""
+        buffer_start = 0  # Document offset of buffer[0]
+        page_offsets: List[int] = []  # Document offset where each page starts
+        boundaries: Optional[List[int]] = [] if self.split_at == "sentence" else None
+        cuts: Optional[Tuple[List[int], List[int]]] = ([], []) if self.split_at == "content" else None
+        gear_tail = ""  # Last characters of the document, hashed with the next page
+        start = 0
+        
+        def span(end: int) -> Tuple[str, int, int, int, int]:
+            text_end = min(end, buffer_start + len(buffer))
+            return (
+                buffer, start - buffer_start, end - buffer_start,
+                bisect_right(page_offsets, start), bisect_right(page_offsets, text_end - 1)
+            )
+            
+        for page_text in pages:
+            seam = buffer_start + len(buffer)
+            page_offsets.append(seam)
+            buffer += page_text
+            
+            if boundaries is not None:
+                scan_from = max(seam - _BOUNDARY_LOOKBACK, buffer_start) - buffer_start
+                found = [buffer_start + match.end() for match in _SENTENCE_BOUNDARY.finditer(buffer, scan_from)]
+                if boundaries:
+                    # Skip boundaries already found before the seam
+                    found = found[bisect_right(found, boundaries[-1]):]
+                boundaries.extend(found)
+                
+            if cuts is not None:
+                # A cut falls after each character whose hash matches a mask
+                window = gear_tail + page_text
+                hashes = _gear_hashes(window)[len(gear_tail):]
+                gear_tail = window[-(_GEAR_WINDOW - 1):]
+                weak = np.flatnonzero((hashes >> self._weak_shift) == 0)
+                strong = weak[(hashes[weak] >> self._strong_shift) == 0]
+                cuts[0].extend((strong + (seam + 1)).tolist())
+                cuts[1].extend((weak + (seam + 1)).tolist())
                 
-                # Create chunk with metadata
-                chunk = Chunk(
-                    text=chunk_text,
-                    metadata={
-                        "filename": pdf_path.name,
-                        "chunk_index": chunk_index
-                    }
-                )
-                chunks.append(chunk)
+            # Emit every chunk that lies entirely within the text so far
+            while start + self.chunk_size <= buffer_start + len(buffer):
+                if cuts is not None:
+                    end = next_start = self._next_content_cut(start, cuts, start + self.chunk_size)
+                else:
+                    end, next_start = self._next_cut(start, boundaries)
+                yield span(end)
                 
                 # Move to next chunk with overlap
+                start = next_start
+                
+            # Drop text and boundaries no later chunk can reach
+            if start > buffer_start:
+                buffer = buffer[start - buffer_start:]
+                buffer_start = start
+                if boundaries:
+                    del boundaries[:bisect_left(boundaries, start)]
+                if cuts is not None:
+                    for offsets in cuts:
+                        del offsets[:bisect_right(offsets, start)]
+                        
+        total = buffer_start + len(buffer)
+        if cuts is not None:
+            # Keep cutting the rest by content so the last chunks stay stable
+            while start < total:
+                end = self._next_content_cut(start, cuts, total)
+                if buffer[start - buffer_start:end - buffer_start].strip():
+                    yield span(end)
+                start = end
+        elif boundaries is not None or not slice_tail:
+            # The rest fits in one chunk; skip it if it is only whitespace
+            if start < total and buffer[start - buffer_start:].strip():
+                yield span(total)
+        else:
+            # Emit the remaining, shorter chunks
+            while start < total:
+                end = start + self.chunk_size
+                yield span(end)
                 start = end - self.chunk_overlap
+                
+    def iter_chunks(self, pdf_path: Path) -> Iterator[Chunk]:
+        """Extract text from a PDF page by page and yield chunks as they fill.
+        
+        In ``"char"`` mode chunks are identical to slicing the whole document
+        text. Each chunk records the first and last page (1-based) it draws
+        text from. In ``"content"`` mode it also records its ``occurrence``,
+        how many earlier chunks of the document have the same text, so
+        repeated text still gets distinct IDs.
+        
+        Args:
+            pdf_path: Path to the PDF file.
+            
+        Yields:
+            Chunk objects containing text and metadata.
+        """
+        try:
+            shared = {"filename": pdf_path.name}
+            seen: Optional[Dict[int, int]] = {} if self.split_at == "content" else None
+            chunk_index = 0
+            for buffer, start, end, page_start, page_end in self._iter_spans(self.iter_pages(pdf_path)):
+                # Chunks cut from the same buffer share it instead of copying
+                if seen is None:
+                    yield Chunk.view(buffer, start, end, shared, _PDF_KEYS, (chunk_index, page_start, page_end))
+                else:
+                    key = hash(buffer[start:end])
+                    occurrence = seen.get(key, 0)
+                    seen[key] = occurrence + 1
+                    yield Chunk.view(
+                        buffer, start, end, shared, _CONTENT_KEYS, (chunk_index, page_start, page_end, occurrence)
+                    )
                 chunk_index += 1
                 
-            logger.info(f"Split PDF into {len(chunks)} chunks")
-            return chunks
+            logger.info(f"Split PDF into {chunk_index} chunks")
+            
+        except Exception as e:
+            logger.error(f"Error chunking PDF {pdf_path}: {str(e)}")
+            raise
+            
+    def iter_page_chunks(self, pdf_path: Path, pages: Optional[Iterable[int]] = None) -> Iterator[Chunk]:
+        """Extract pages of a PDF and chunk each page on its own.
+        
+        Chunks never span pages, so the chunks of a page only change when
+        the page does. Their metadata holds the 1-based ``page`` and the
+        ``chunk_index`` within that page.
+        
+        Args:
+            pdf_path: Path to the PDF file.
+            pages: 0-based numbers of the pages to extract, or None for all.
+            
+        Yields:
+            Chunk objects containing text and metadata.
+        """
+        try:
+            if pages is None:
+                numbered = enumerate(self.iter_pages(pdf_path))
+            else:
+                numbered = _extract_numbered_pages(pdf_path, sorted(set(pages)), self.mode)
+                
+            shared = {"filename": pdf_path.name}
+            n_chunks = 0
+            for page, page_text in numbered:
+                spans = self._iter_spans([page_text], slice_tail=False)
+                for chunk_index, (buffer, start, end, _, _) in enumerate(spans):
+                    yield Chunk.view(buffer, start, end, shared, _PAGE_KEYS, (chunk_index, page + 1))
+                    n_chunks += 1
+                    
+            logger.info(f"Split PDF pages into {n_chunks} chunks")
             
         except Exception as e:
             logger.error(f"Error chunking PDF {pdf_path}: {str(e)}")
-            raise 
\ No newline at end of file
+            raise
+            
+    def chunk_pdf(self, pdf_path: Path) -> List[Chunk]:
+        """Extract text from a PDF and split it into chunks.
+        
+        Args:
+            pdf_path: Path to the PDF file.
+            
+        Returns:
+            List of Chunk objects containing text and metadata.
+        """
+        return list(self.iter_chunks(pdf_path))
+
+def count_pages(pdf_path: Path) -> int:
+    """Count the pages of a PDF without extracting them.
+    
+    Args:
+        pdf_path: Path to the PDF file.
+        
+    Returns:
+        Number of pages.
+    """
+    with open(pdf_path, "rb") as fp:
+        document = PDFDocument(PDFParser(fp))
+        return sum(1 for _ in PDFPage.create_pages(document))
+
+def iter_pdf_pages(fp: BinaryIO, pagenos: Optional[Container[int]] = None, maxpages: int = 0) -> Iterator[PDFPage]:
+    """Yield the pages of an open PDF, dropping each page's parsed objects after use.
+    
+    pdfminer's object cache keeps every object it parses, so its memory grows
+    with the page count; without it, every object read from an object stream
+    parses the whole stream again. Here the cache stays on while a page is
+    processed, and once the caller is done with the page the objects parsed
+    since the first page are dropped, along with all but the
+    ``OBJECT_STREAM_CACHE`` most recently parsed object streams.
+    
+    Args:
+        fp: PDF file opened in binary mode.
+        pagenos: 0-based numbers of the pages to yield, or None for all.
+        maxpages: Number of pages after which to stop, or 0 for no limit.
+        
+    Yields:
+        Each selected page, in order.
+    """
+    document = PDFDocument(PDFParser(fp))
+    # Objects cached while opening the document, such as the catalog, are kept
+    kept = set(document._cached_objs)
+    for pageno, page in enumerate(PDFPage.create_pages(document)):
+        if maxpages and pageno >= maxpages:
+            break
+        if pagenos is not None and pageno not in pagenos:
+            continue
+        yield page
+        
+        # pdfminer's content parser keeps the page's streams in a reference
+        # cycle until the garbage collector runs, so free their data now
+        for stream in page.contents:
+            stream = resolve1(stream)
+            if isinstance(stream, PDFStream):
+                stream.data = stream.rawdata = None
+        for objid in [objid for objid in document._cached_objs if objid not in kept]:
+            del document._cached_objs[objid]
+        while len(document._parsed_objs) > OBJECT_STREAM_CACHE:
+            del document._parsed_objs[next(iter(document._parsed_objs))]
+            
+def _extract_pages(
+    pdf_path: Path,
+    first: int = 0,
+    last: Optional[int] = None,
+    mode: str = "layout"
+) -> Iterator[str]:
+    """Extract the text of a range of pages of a PDF one page at a time.
+    
+    Args:
+        pdf_path: Path to the PDF file.
+        first: 0-based number of the first page.
+        last: 0-based number one past the last page, or None for the end.
+        mode: Extraction mode, one of EXTRACTION_MODES.
+        
+    Yields:
+        Text of each page, in order.
+    """
+    pagenos = range(first, last) if last is not None else None
+    with open(pdf_path, "rb") as fp, StringIO() as output:
+        resource_manager = PDFResourceManager(caching=True)
+        if mode == "fast":
+            device = RawTextDevice(resource_manager, output)
+        else:
+            device = TextConverter(resource_manager, output, codec="utf-8", laparams=LAParams())
+        interpreter = PDFPageInterpreter(resource_manager, device)
+        
+        for page in iter_pdf_pages(fp, pagenos=pagenos, maxpages=last or 0):
+            interpreter.process_page(page)
+            text = output.getvalue()
+            output.seek(0)
+            output.truncate(0)
+            yield text
+
+def _extract_numbered_pages(pdf_path: Path, pages: List[int], mode: str = "layout") -> Iterator[Tuple[int, str]]:
+    """Extract selected pages, reading each run of consecutive pages in one pass.
+    
+    Args:
+        pdf_path: Path to the PDF file.
+        pages: Sorted, distinct 0-based page numbers.
+        mode: Extraction mode, one of EXTRACTION_MODES.
+        
+    Yields:
+        Tuples of (page number, page text), in order.
+    """
+    run_start = 0
+    for i in range(1, len(pages) + 1):
+        if i == len(pages) or pages[i] != pages[i - 1] + 1:
+            first, last = pages[run_start], pages[i - 1] + 1
+            yield from zip(range(first, last), _extract_pages(pdf_path, first, last, mode))
+            run_start = i
+
+def _extract_page_range(pdf_path: str, first: int, last: int, mode: str = "layout") -> List[str]:
+    """Extract pages ``first`` to ``last - 1`` in a pool worker.
+    
+    Args:
+        pdf_path: Path to the PDF file.
+        first: 0-based number of the first page.
+        last: 0-based number one past the last page.
+        mode: Extraction mode, one of EXTRACTION_MODES.
+        
+    Returns:
+        Text of each page of the range, in order.
+    """
+    return list(_extract_pages(Path(pdf_path), first, last, mode))
\ No newline at end of file
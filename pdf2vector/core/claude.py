@@ -12,11 +12,16 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
+from .rate_limit import AdaptiveRateLimiter, parse_retry_after
+
 logger = logging.getLogger(__name__)
 
 # Load environment variables
 load_dotenv()
 
+# Number of times a throttled (429) request is retried
+MAX_THROTTLE_RETRIES = 5
+
 class ClaudeError(Exception):
     """Custom exception for Claude API errors."""
     pass
@@ -24,22 +29,27 @@ class ClaudeError(Exception):
 class ClaudeClient:
     """Client for interacting with Claude's API."""
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, rate_limiter: Optional[AdaptiveRateLimiter] = None):
         """
         Initialize the Claude client.
         
         Args:
             api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY env var)
+            rate_limiter: Limiter shared with other API clients (defaults to
+                a new AdaptiveRateLimiter)
         """
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         if not self.api_key:
             raise ValueError("Anthropic API key not found. Set ANTHROPIC_API_KEY environment variable.")
             
-        # Configure retry strategy
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter()
+        
+        # Configure retry strategy for server errors; throttling (429) is
+        # handled by the rate limiter
         retry_strategy = Retry(
             total=3,
             backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
+            status_forcelist=[500, 502, 503, 504],
         )
         
         # Create session with retry strategy
@@ -118,21 +128,27 @@ class ClaudeClient:
             })
             
             # Call Claude API
-            response = self.session.post(
-                "https://api.anthropic.com/v1/messages",
-                headers={
-                    "x-api-key": self.api_key,
-                    "anthropic-version": "2023-06-01",
-                    "content-type": "application/json"
-                },
-                json={
-                    "model": "claude-3-opus-20240229",
-                    "max_tokens": 1000,
-                    "messages": messages
-                }
-            )
-            
+            for _ in range(MAX_THROTTLE_RETRIES + 1):
+                sent_at = self.rate_limiter.acquire()
+                response = self.session.post(
+                    "https://api.anthropic.com/v1/messages",
+                    headers={
+                        "x-api-key": self.api_key,
+                        "anthropic-version": "2023-06-01",
+                        "content-type": "application/json"
+                    },
+                    json={
+                        "model": "claude-3-opus-20240229",
+                        "max_tokens": 1000,
+                        "messages": messages
+                    }
+                )
+                if response.status_code != 429:
+                    break
+                self.rate_limiter.on_throttle(parse_retry_after(response.headers), sent_at)
+                
             response.raise_for_status()
+            self.rate_limiter.on_success(response.headers)
             result = response.json()
             
             # Extract sources from context chunks
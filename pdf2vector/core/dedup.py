@@ -0,0 +1,285 @@
+"""
+Near-duplicate detection module for pdf2vector.
+
+This module provides MinHash signatures of chunk texts and an LSH index over
+them, so chunks that nearly repeat a stored chunk (disclaimers, template
+pages, revisions of a document) can be found before they are embedded.
+"""
+
+import json
+import logging
+import os
+import re
+import zlib
+from pathlib import Path
+from typing import AbstractSet, Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from .chunking import Chunk
+
+logger = logging.getLogger(__name__)
+
+# Number of hash functions in a signature, split into bands of equal rows
+NUM_PERM = 128
+BANDS = 16
+
+# Words per shingle
+SHINGLE_SIZE = 3
+
+# Estimated Jaccard similarity from which a chunk is a near-duplicate
+DEFAULT_THRESHOLD = 0.8
+
+# What happens to near-duplicates: dropped, or kept as references
+DEDUP_MODES = ("skip", "reference")
+
+# Format version of the file written by MinHashIndex.save
+INDEX_FORMAT = 1
+
+_WORD = re.compile(r"\w+")
+
+def _splitmix(values: np.ndarray) -> np.ndarray:
+    """Mix uint64 values into pseudo-random uint64 values."""
+    values = values + np.uint64(0x9E3779B97F4A7C15)
+    values = (values ^ (values >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    values = (values ^ (values >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+# Multiply-add-shift hash functions; odd multipliers keep them bijective
+_PERM_A = _splitmix(np.arange(NUM_PERM, dtype=np.uint64)) | np.uint64(1)
+_PERM_B = _splitmix(np.arange(NUM_PERM, 2 * NUM_PERM, dtype=np.uint64))
+
+def minhash(text: str) -> Optional[np.ndarray]:
+    """Compute the MinHash signature of a text.
+    
+    The text is reduced to its set of lower-cased word shingles, so
+    whitespace and case do not matter. Two signatures agree in each position
+    with a probability equal to the Jaccard similarity of the shingle sets.
+    
+    Args:
+        text: Text to sign.
+        
+    Returns:
+        np.ndarray: uint32 signature of ``NUM_PERM`` values, or None if the
+        text has no words.
+    """
+    words = _WORD.findall(text.lower())
+    if not words:
+        return None
+        
+    hashes = _splitmix(np.array([zlib.crc32(word.encode()) for word in words], dtype=np.uint64))
+    n_shingles = max(1, len(hashes) - SHINGLE_SIZE + 1)
+    shingles = hashes[:n_shingles].copy()
+    for offset in range(1, min(SHINGLE_SIZE, len(hashes))):
+        shingles = _splitmix(shingles ^ hashes[offset:offset + n_shingles])
+    shingles = np.unique(shingles)
+    
+    values = (shingles[:, None] * _PERM_A + _PERM_B) >> np.uint64(32)
+    return values.min(axis=0).astype(np.uint32)
+
+class MinHashIndex:
+    """LSH index of chunk signatures, with references from near-duplicates.
+    
+    Every stored chunk is a canonical chunk with a signature. A reference
+    records a near-duplicate chunk that was not stored itself: its text, if
+    kept, its metadata and the ID of the canonical chunk it repeats.
+    """
+    
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD):
+        """Initialize an empty index.
+        
+        Args:
+            threshold: Estimated Jaccard similarity from which a chunk is a
+                near-duplicate of a stored one.
+        """
+        self.threshold = threshold
+        self.ids: List[str] = []
+        self._positions: Dict[str, int] = {}
+        # Signature of each ID; rows past len(ids) are spare capacity
+        self._signatures = np.empty((0, NUM_PERM), dtype=np.uint32)
+        self._buckets: List[Dict[bytes, Set[str]]] = [{} for _ in range(BANDS)]
+        self.references: Dict[str, Dict[str, Any]] = {}
+        
+    def __len__(self) -> int:
+        """Return the number of canonical chunks."""
+        return len(self.ids)
+        
+    def __contains__(self, chunk_id: str) -> bool:
+        """Return whether a chunk is stored as a canonical chunk."""
+        return chunk_id in self._positions
+        
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        """Split a signature into the bucket key of each band."""
+        return [band.tobytes() for band in np.split(signature, BANDS)]
+        
+    def find(self, signature: np.ndarray, exclude: AbstractSet[str] = frozenset()) -> Optional[Tuple[str, float]]:
+        """Find the canonical chunk most similar to a signature.
+        
+        Chunks sharing a band with the signature are candidates, and the
+        one whose signature agrees in the most positions wins if it reaches
+        the threshold.
+        
+        Args:
+            signature: Signature to look up.
+            exclude: IDs of chunks to ignore, such as chunks about to be
+                replaced.
+            
+        Returns:
+            Tuple of (canonical ID, estimated Jaccard similarity), or None
+            if no stored chunk is similar enough.
+        """
+        candidates: Set[str] = set()
+        for bucket, key in zip(self._buckets, self._band_keys(signature)):
+            candidates.update(bucket.get(key, ()))
+        candidates = {chunk_id for chunk_id in candidates if chunk_id not in exclude}
+        if not candidates:
+            return None
+            
+        candidates = sorted(candidates)
+        rows = [self._positions[chunk_id] for chunk_id in candidates]
+        similarity = (self._signatures[rows] == signature).mean(axis=1)
+        best = int(np.argmax(similarity))
+        if similarity[best] < self.threshold:
+            return None
+        return candidates[best], float(similarity[best])
+        
+    def add(self, chunk_id: str, signature: np.ndarray):
+        """Add or replace the signature of a canonical chunk.
+        
+        Args:
+            chunk_id: ID of the chunk.
+            signature: Its MinHash signature.
+        """
+        position = self._positions.get(chunk_id)
+        if position is not None:
+            self._unbucket(chunk_id, self._signatures[position])
+            self._signatures[position] = signature
+        else:
+            position = len(self.ids)
+            if position == len(self._signatures):
+                # Grow geometrically so adding chunks one by one stays linear
+                grown = np.empty((max(64, 2 * position), NUM_PERM), dtype=np.uint32)
+                grown[:position] = self._signatures[:position]
+                self._signatures = grown
+            self._signatures[position] = signature
+            self._positions[chunk_id] = position
+            self.ids.append(chunk_id)
+        for bucket, key in zip(self._buckets, self._band_keys(signature)):
+            bucket.setdefault(key, set()).add(chunk_id)
+            
+    def add_reference(self, chunk_id: str, canonical_id: str, text: Optional[str], metadata: Dict[str, Any]):
+        """Record a near-duplicate chunk as a reference to a canonical chunk.
+        
+        Args:
+            chunk_id: ID of the near-duplicate chunk.
+            canonical_id: ID of the stored chunk it repeats.
+            text: Text of the near-duplicate, or None to drop it.
+            metadata: Metadata of the near-duplicate.
+        """
+        self.references[chunk_id] = {"canonical": canonical_id, "text": text, "metadata": dict(metadata)}
+        
+    def references_to(self, canonical_id: str) -> List[Dict[str, Any]]:
+        """Return the metadata of the chunks referencing a canonical chunk."""
+        return [
+            reference["metadata"] for reference in self.references.values()
+            if reference["canonical"] == canonical_id
+        ]
+        
+    def document_references(self, filename: str) -> Dict[str, Dict[str, Any]]:
+        """Return the metadata of the references of a document, by chunk ID."""
+        return {
+            chunk_id: reference["metadata"] for chunk_id, reference in self.references.items()
+            if reference["metadata"].get("filename") == filename
+        }
+        
+    def _unbucket(self, chunk_id: str, signature: np.ndarray):
+        """Remove a chunk from the buckets of its signature."""
+        for bucket, key in zip(self._buckets, self._band_keys(signature)):
+            members = bucket.get(key)
+            if members is not None:
+                members.discard(chunk_id)
+                if not members:
+                    del bucket[key]
+                    
+    def remove(self, ids: List[str]) -> List[Chunk]:
+        """Remove canonical chunks and references by ID; unknown IDs are ignored.
+        
+        References to a removed canonical chunk are dropped as well, and
+        those that kept their text are returned so the caller can store them
+        again.
+        
+        Args:
+            ids: IDs of the chunks to remove.
+            
+        Returns:
+            List[Chunk]: Near-duplicates left without a canonical chunk.
+        """
+        removed = set(ids)
+        for chunk_id in removed:
+            self.references.pop(chunk_id, None)
+            
+        drop = {self._positions[chunk_id] for chunk_id in removed if chunk_id in self._positions}
+        if not drop:
+            return []
+        for position in drop:
+            self._unbucket(self.ids[position], self._signatures[position])
+        keep = np.array([i for i in range(len(self.ids)) if i not in drop], dtype=np.int64)
+        dropped_ids = {self.ids[i] for i in drop}
+        self.ids = [self.ids[i] for i in keep]
+        self._positions = {chunk_id: i for i, chunk_id in enumerate(self.ids)}
+        self._signatures = self._signatures[keep]
+        
+        orphans = [
+            chunk_id for chunk_id, reference in self.references.items()
+            if reference["canonical"] in dropped_ids
+        ]
+        return [
+            Chunk(text=reference["text"], metadata=reference["metadata"])
+            for reference in (self.references.pop(chunk_id) for chunk_id in orphans)
+            if reference["text"] is not None
+        ]
+        
+    def save(self, path: Path):
+        """Write the index to an ``.npz`` file.
+        
+        Args:
+            path: Destination file, replaced atomically.
+        """
+        references = json.dumps(self.references).encode()
+        path = Path(path)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as file:
+            np.savez(
+                file,
+                format=np.array(INDEX_FORMAT),
+                threshold=np.array(self.threshold),
+                ids=np.array(self.ids, dtype=str),
+                signatures=self._signatures[:len(self.ids)],
+                references=np.frombuffer(references, dtype=np.uint8),
+            )
+        os.replace(tmp_path, path)
+        
+    @classmethod
+    def load(cls, path: Path, threshold: Optional[float] = None) -> "MinHashIndex":
+        """Read an index written by ``save``.
+        
+        Args:
+            path: Source file.
+            threshold: Similarity threshold to use instead of the saved one.
+            
+        Returns:
+            MinHashIndex: The loaded index.
+        """
+        with np.load(Path(path)) as data:
+            if int(data["format"]) != INDEX_FORMAT:
+                raise ValueError(f"Unsupported dedup index format in {path}")
+            index = cls(float(data["threshold"]) if threshold is None else threshold)
+            signatures = data["signatures"]
+            for chunk_id, signature in zip(data["ids"].tolist(), signatures):
+                index._positions[chunk_id] = len(index.ids)
+                index.ids.append(chunk_id)
+                for bucket, key in zip(index._buckets, index._band_keys(signature)):
+                    bucket.setdefault(key, set()).add(chunk_id)
+            index._signatures = signatures
+            index.references = json.loads(data["references"].tobytes().decode())
+        return index
\ No newline at end of file
@@ -0,0 +1,165 @@
+"""
+Embedding cache module for pdf2vector.
+
+This module provides a persistent, content-addressed cache of embeddings
+stored in SQLite, so identical chunk text is only embedded once per model.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of SQL parameters used per statement
+_SQL_BATCH = 500
+
+class EmbeddingCache:
+    """Stores embeddings on disk keyed by model, dimension and text digest."""
+    
+    def __init__(self, path: Path, max_entries: int = 1_000_000):
+        """Initialize the cache.
+        
+        Args:
+            path: Path of the SQLite database file. It can be shared by
+                several collections and persist directories.
+            max_entries: Maximum number of embeddings kept before the least
+                recently used ones are evicted.
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        
+        # Create parent directory if it doesn't exist
+        if not self.path.parent.exists():
+            self.path.parent.mkdir(parents=True)
+            
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            " model TEXT NOT NULL,"
+            " dimension INTEGER NOT NULL,"
+            " digest TEXT NOT NULL,"
+            " vector BLOB NOT NULL,"
+            " last_used INTEGER NOT NULL,"
+            " PRIMARY KEY (model, dimension, digest))"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)"
+        )
+        self._connection.commit()
+        
+        # Logical clock for LRU ordering, continued from previous sessions
+        (self._clock,) = self._connection.execute(
+            "SELECT COALESCE(MAX(last_used), 0) FROM embeddings"
+        ).fetchone()
+        
+        logger.info(f"Initialized embedding cache at {self.path}")
+        
+    @staticmethod
+    def digest(text: str) -> str:
+        """Return the content address of a text.
+        
+        Args:
+            text: Text to address.
+            
+        Returns:
+            str: Hex sha256 digest of the UTF-8 encoded text.
+        """
+        return hashlib.sha256(text.encode()).hexdigest()
+        
+    def get_many(self, model_name: str, dimension: int, digests: List[str]) -> Dict[str, np.ndarray]:
+        """Look up cached embeddings.
+        
+        Args:
+            model_name: Name of the embedding model.
+            dimension: Embedding dimension.
+            digests: Text digests to look up.
+            
+        Returns:
+            Dictionary mapping each digest found to its float64 embedding.
+        """
+        found: Dict[str, np.ndarray] = {}
+        unique = list(dict.fromkeys(digests))
+        
+        with self._lock:
+            for start in range(0, len(unique), _SQL_BATCH):
+                batch = unique[start:start + _SQL_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._connection.execute(
+                    "SELECT digest, vector FROM embeddings"
+                    f" WHERE model = ? AND dimension = ? AND digest IN ({placeholders})",
+                    [model_name, dimension, *batch]
+                )
+                for digest, vector in rows:
+                    found[digest] = np.frombuffer(vector, dtype=np.float64)
+                    
+            if found:
+                self._connection.executemany(
+                    "UPDATE embeddings SET last_used = ?"
+                    " WHERE model = ? AND dimension = ? AND digest = ?",
+                    [(self._tick(), model_name, dimension, digest) for digest in found]
+                )
+                self._connection.commit()
+                
+            self.hits += len(found)
+            self.misses += len(unique) - len(found)
+            
+        return found
+        
+    def put_many(self, model_name: str, dimension: int, digests: List[str], vectors: np.ndarray):
+        """Store embeddings and evict the least recently used entries.
+        
+        Args:
+            model_name: Name of the embedding model.
+            dimension: Embedding dimension.
+            digests: Text digests, one per row of ``vectors``.
+            vectors: Array of shape (len(digests), dimension).
+        """
+        vectors = np.ascontiguousarray(vectors, dtype=np.float64)
+        
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, dimension, digest, vector, last_used)"
+                " VALUES (?, ?, ?, ?, ?)",
+                [
+                    (model_name, dimension, digest, vector.tobytes(), self._tick())
+                    for digest, vector in zip(digests, vectors)
+                ]
+            )
+            self._evict()
+            self._connection.commit()
+            
+    def _tick(self) -> int:
+        """Advance and return the logical LRU clock."""
+        self._clock += 1
+        return self._clock
+        
+    def _evict(self):
+        """Delete the least recently used entries above ``max_entries``."""
+        (count,) = self._connection.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            self._connection.execute(
+                "DELETE FROM embeddings WHERE rowid IN"
+                " (SELECT rowid FROM embeddings ORDER BY last_used LIMIT ?)",
+                (excess,)
+            )
+            logger.debug(f"Evicted {excess} embeddings from cache")
+            
+    def __len__(self) -> int:
+        """Return the number of cached embeddings."""
+        with self._lock:
+            (count,) = self._connection.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        return count
+        
+    def close(self):
+        """Close the database connection."""
+        self._connection.close()
\ No newline at end of file
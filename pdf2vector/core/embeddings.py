@@ -1,25 +1,171 @@
 """
-Module for generating vector embeddings from text using a simple hash-based approach.
+Module for generating vector embeddings from text using a simple hash-based
+approach or an OpenAI-compatible embedding API.
 """
 
+import asyncio
 import logging
 import hashlib
+import json
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from multiprocessing import shared_memory
+from pathlib import Path
 import numpy as np
-from typing import List, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .backends import EmbeddingBackend, find_backend
+from .embedding_cache import EmbeddingCache
+from .onnx_embeddings import OnnxEmbeddingBackend  # registers the onnx: backend
+from .rate_limit import AdaptiveRateLimiter
+from .remote_embeddings import DEFAULT_BASE_URL, EmbeddingError, RemoteEmbeddingClient
+from .vocabulary import VocabularyTable
 
 logger = logging.getLogger(__name__)
 
+# Number of consecutive dimensions written by each word of the hash embedding
+HASH_SPAN = 32
+
+# Low bits of the word hash consumed by the 8-bit windows (HASH_SPAN - 1 + 8)
+_LOW_BITS_MASK = (1 << (HASH_SPAN + 7)) - 1
+
+# Number of texts embedded together when filling an output array
+ARRAY_BLOCK_SIZE = 256
+
+# Name of the local hash embedding model
+HASH_MODEL = "simple-hash"
+
+# Dimensions of known remote embedding models
+REMOTE_MODEL_DIMENSIONS = {
+    "text-embedding-3-small": 1536,
+    "text-embedding-3-large": 3072,
+    "text-embedding-ada-002": 1536,
+}
+
+# Generator owned by each pool worker process, set by _init_worker
+_worker_generator: Optional["EmbeddingGenerator"] = None
+
 class EmbeddingGenerator:
-    """Generates embeddings for text using a simple hash-based method."""
+    """Generates embeddings for text using a simple hash-based method or a remote API."""
     
-    def __init__(self, model_name: str = "simple-hash"):
+    def __init__(
+        self,
+        model_name: str = HASH_MODEL,
+        word_cache_size: int = 100_000,
+        cache: Optional[EmbeddingCache] = None,
+        workers: int = 1,
+        parallel_threshold: int = 2048,
+        api_key: Optional[str] = None,
+        base_url: str = DEFAULT_BASE_URL,
+        dimension: Optional[int] = None,
+        max_batch_items: int = 2048,
+        max_batch_tokens: int = 300_000,
+        max_concurrency: int = 8,
+        request_timeout: float = 30.0,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        vocabulary: Optional[Union[str, Path, VocabularyTable]] = None,
+        backend_options: Optional[Dict[str, Any]] = None
+    ):
         """Initialize the embedding generator.
         
+        Model names of the form ``prefix:location`` are served by the backend
+        registered for the prefix, e.g. ``onnx:/models/minilm`` runs a local
+        ONNX model. Any other model name except ``simple-hash`` is served by
+        an OpenAI-compatible embedding API.
+        
         Args:
             model_name: Name of the embedding model (default: simple-hash)
+            word_cache_size: Maximum number of words whose hash contributions are
+                memoized (default: 100000, 0 disables the cache)
+            cache: Optional persistent embedding cache consulted before computing
+            workers: Number of processes used to embed large batches (default: 1)
+            parallel_threshold: Minimum number of texts in a batch before the
+                process pool is used (default: 2048)
+            api_key: API key for remote models (defaults to OPENAI_API_KEY env var)
+            base_url: Base URL of the remote embedding API
+            dimension: Embedding dimension of a remote model not listed in
+                REMOTE_MODEL_DIMENSIONS
+            max_batch_items: Maximum number of texts per remote request
+            max_batch_tokens: Maximum estimated tokens per remote request
+            max_concurrency: Maximum number of remote requests in flight from ``aembed``
+            request_timeout: Timeout in seconds for each remote request
+            rate_limiter: Adaptive limiter for remote requests, which can be
+                shared with a ClaudeClient
+            vocabulary: Vocabulary table, or the directory of one, whose words
+                are looked up instead of hashed (hash model only)
+            backend_options: Keyword arguments for a registered backend, e.g.
+                ``{"batch_size": 16}`` for the onnx backend; a digest of them
+                is part of the persistent cache key
         """
         self.model_name = model_name
-        self.dimension = 1536  # Same dimension as text-embedding-ada-002 for compatibility
+        self.backend_options = dict(backend_options or {})
+        self._dimension: Optional[int] = 1536  # Same dimension as text-embedding-ada-002 for compatibility
+        self.cache = cache
+        self.workers = workers
+        self.parallel_threshold = parallel_threshold
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._client: Optional[EmbeddingBackend] = None
+        
+        backend = find_backend(model_name)
+        if backend is not None:
+            factory, location = backend
+            options = dict(backend_options or {})
+            if dimension is not None:
+                options.setdefault("dimension", dimension)
+            self._client = factory(location, **options)
+            # Asking the backend may load its model, so wait until it is needed
+            self._dimension = None
+            
+        elif model_name != HASH_MODEL:
+            self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+            if not self.api_key:
+                raise ValueError("OpenAI API key not found. Set OPENAI_API_KEY environment variable.")
+                
+            self._dimension = dimension or REMOTE_MODEL_DIMENSIONS.get(model_name, self._dimension)
+            self._client = RemoteEmbeddingClient(
+                api_key=self.api_key,
+                model_name=model_name,
+                base_url=base_url,
+                max_batch_items=max_batch_items,
+                max_batch_tokens=max_batch_tokens,
+                timeout=request_timeout,
+                max_concurrency=max_concurrency,
+                rate_limiter=rate_limiter
+            )
+            
+        # LRU memo of word -> slot in the contribution tables
+        self.word_cache_size = word_cache_size
+        self._word_slots: "OrderedDict[str, int]" = OrderedDict()
+        self.clear_word_cache()
+        
+        self.vocabulary: Optional[VocabularyTable] = None
+        if vocabulary is not None:
+            self.use_vocabulary(vocabulary)
+            
+    @property
+    def dimension(self) -> int:
+        """Embedding dimension, asked of a registered backend on first use."""
+        if self._dimension is None:
+            self._dimension = self._client.dimension or 1536
+        return self._dimension
+        
+    @dimension.setter
+    def dimension(self, dimension: int):
+        self._dimension = dimension
+        
+    @property
+    def _cache_model(self) -> str:
+        """Model key of the persistent cache.
+        
+        Backend options such as normalization or the maximum input length
+        change the vectors, so a digest of them is appended to the model name.
+        """
+        if not self.backend_options:
+            return self.model_name
+        options = json.dumps(self.backend_options, sort_keys=True, default=repr)
+        return f"{self.model_name}#{hashlib.sha256(options.encode()).hexdigest()[:16]}"
         
     def embed_text(self, text: Union[str, List[str]]) -> Union[List[float], List[List[float]]]:
         """Generate embeddings for the given text.
@@ -34,7 +180,7 @@ class EmbeddingGenerator:
             if isinstance(text, str):
                 return self._generate_single_embedding(text)
             elif isinstance(text, list):
-                return [self._generate_single_embedding(t) for t in text]
+                return self._embed_batch(text).tolist()
             else:
                 raise ValueError(f"Unsupported input type: {type(text)}")
                 
@@ -42,6 +188,57 @@ class EmbeddingGenerator:
             logger.error(f"Error generating embeddings: {str(e)}")
             raise
             
+    def embed_array(self, texts: List[str]) -> np.ndarray:
+        """Generate embeddings for a batch of texts as a float32 array.
+        
+        Unlike ``embed_text`` this never builds Python float lists, so the
+        result can be handed to NumPy-aware consumers such as ChromaDB as is.
+        
+        Args:
+            texts: List of strings to embed
+            
+        Returns:
+            C-contiguous float32 array of shape (len(texts), dimension)
+        """
+        try:
+            if not isinstance(texts, list):
+                raise ValueError(f"Unsupported input type: {type(texts)}")
+            return self._embed_batch(texts, dtype=np.float32)
+            
+        except Exception as e:
+            logger.error(f"Error generating embeddings: {str(e)}")
+            raise
+            
+    def embed_iter(
+        self,
+        texts: Iterable[str],
+        batch_size: int = ARRAY_BLOCK_SIZE
+    ) -> Iterator[Tuple[int, np.ndarray]]:
+        """Stream embeddings for an iterable of texts in fixed-size batches.
+        
+        Only one batch of texts and vectors is held at a time, so arbitrarily
+        large corpora can be embedded in constant memory.
+        
+        Args:
+            texts: Iterable of strings to embed, consumed lazily
+            batch_size: Maximum number of texts per yielded batch
+            
+        Yields:
+            Tuples of (start_index, embeddings) where embeddings is a float32
+            array for the texts at positions start_index onwards
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+            
+        iterator = iter(texts)
+        start = 0
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                return
+            yield start, self.embed_array(batch)
+            start += len(batch)
+            
     def _generate_single_embedding(self, text: str) -> List[float]:
         """Generate embedding for a single text string using hash-based approach.
         
@@ -51,24 +248,549 @@ class EmbeddingGenerator:
         Returns:
             List of floats representing the embedding
         """
-        # Initialize embedding vector
-        embedding = np.zeros(self.dimension)
+        return self._embed_batch([text])[0].tolist()
+        
+    def generate_embedding(self, text: str) -> List[float]:
+        """Generate the embedding of a single text.
+        
+        Args:
+            text: Text to embed
+            
+        Returns:
+            List of floats representing the embedding
+            
+        Raises:
+            EmbeddingError: If the remote API request fails
+        """
+        if self._client is not None:
+            return self._client.embed_one(text)
+        return self.embed_text(text)
+        
+    def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Generate embeddings for a list of texts.
+        
+        Remote models pack the texts into as few requests as the batch limits
+        allow and send duplicate texts only once.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            One list of floats per text
+            
+        Raises:
+            EmbeddingError: If a remote API request fails
+        """
+        if self._client is not None:
+            return self._client.embed_many(texts)
+        return self.embed_text(texts)
+        
+    def close(self):
+        """Shut down the worker process pool and the HTTP session, if any."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        if self._client is not None:
+            self._client.close()
+            
+    def __del__(self):
+        """Clean up resources."""
+        if getattr(self, "_pool", None) is not None:
+            self._pool.shutdown(wait=False)
+        if getattr(self, "_client", None) is not None:
+            self._client.close()
+            
+    async def aembed(self, texts: List[str]) -> np.ndarray:
+        """Generate embeddings for a batch of texts from asyncio code.
+        
+        Remote models keep up to ``max_concurrency`` requests in flight and
+        reassemble the results in input order. The hash model runs on the
+        default executor so the event loop is never blocked.
+        
+        Args:
+            texts: List of strings to embed
+            
+        Returns:
+            C-contiguous float32 array of shape (len(texts), dimension)
+            
+        Raises:
+            EmbeddingError: If a remote request fails or times out
+        """
+        try:
+            if not isinstance(texts, list):
+                raise ValueError(f"Unsupported input type: {type(texts)}")
+                
+            if self._client is None:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(None, self.embed_array, texts)
+                
+            if self.cache is None:
+                return self._to_array(await self._client.aembed_many(texts), np.float32)
+                
+            embeddings, pending = self._lookup_cache(texts, np.float32)
+            if pending:
+                vectors = await self._client.aembed_many([texts[rows[0]] for rows in pending.values()])
+                self._store_computed(pending, self._to_array(vectors, np.float64), embeddings)
+            return embeddings
+            
+        except Exception as e:
+            logger.error(f"Error generating embeddings: {str(e)}")
+            raise
+            
+    def _embed_batch(self, texts: List[str], dtype: Any = np.float64) -> np.ndarray:
+        """Embed a batch of texts, reusing vectors from the persistent cache.
+        
+        Args:
+            texts: Text strings to embed
+            dtype: Floating point type of the returned array
+            
+        Returns:
+            Array of shape (len(texts), dimension) with the embeddings
+        """
+        if self.cache is None:
+            return self._compute_embeddings(texts, dtype)
+            
+        embeddings, pending = self._lookup_cache(texts, dtype)
+        if pending:
+            # Cached vectors are always kept at full precision
+            computed = self._compute_embeddings(
+                [texts[rows[0]] for rows in pending.values()], np.float64
+            )
+            self._store_computed(pending, computed, embeddings)
+        return embeddings
+        
+    def _lookup_cache(self, texts: List[str], dtype: Any) -> Tuple[np.ndarray, Dict[str, List[int]]]:
+        """Fill rows found in the persistent cache and group the missing texts.
+        
+        Args:
+            texts: Text strings to embed
+            dtype: Floating point type of the output array
+            
+        Returns:
+            Tuple of (embeddings, pending) where embeddings holds the cached rows
+            and pending maps each missing text digest to its rows, in order
+        """
+        embeddings = np.empty((len(texts), self.dimension), dtype=dtype)
+        digests = [EmbeddingCache.digest(text) for text in texts]
+        found = self.cache.get_many(self._cache_model, self.dimension, digests)
+        
+        pending: Dict[str, List[int]] = {}
+        for row, digest in enumerate(digests):
+            if digest in found:
+                embeddings[row] = found[digest]
+            else:
+                pending.setdefault(digest, []).append(row)
+        return embeddings, pending
+        
+    def _store_computed(self, pending: Dict[str, List[int]], computed: np.ndarray, embeddings: np.ndarray):
+        """Scatter newly computed vectors into the output and the cache.
+        
+        Args:
+            pending: Mapping returned by ``_lookup_cache``
+            computed: One vector per entry of ``pending``, in order
+            embeddings: Output array receiving the rows
+        """
+        for vector, rows in zip(computed, pending.values()):
+            embeddings[rows] = vector
+        self.cache.put_many(self._cache_model, self.dimension, list(pending), computed)
+        
+    def _to_array(self, vectors: List[List[float]], dtype: Any) -> np.ndarray:
+        """Convert remote embeddings to an array, checking their dimension.
+        
+        Args:
+            vectors: Embeddings returned by the remote API
+            dtype: Floating point type of the returned array
+            
+        Returns:
+            C-contiguous array of shape (len(vectors), dimension)
+            
+        Raises:
+            EmbeddingError: If a vector does not have the expected dimension
+        """
+        if any(len(vector) != self.dimension for vector in vectors):
+            raise EmbeddingError(
+                f"Error generating embeddings: expected dimension {self.dimension} "
+                f"from {self.model_name}"
+            )
+        embeddings = np.empty((len(vectors), self.dimension), dtype=dtype)
+        if len(vectors):
+            embeddings[:] = vectors
+        return embeddings
+        
+    def _compute_embeddings(self, texts: List[str], dtype: Any) -> np.ndarray:
+        """Compute embeddings in the worker pool or in this process.
+        
+        The output is filled block by block so the float64 working set stays
+        bounded no matter how many texts are passed in.
+        
+        Args:
+            texts: Text strings to embed
+            dtype: Floating point type of the returned array
+            
+        Returns:
+            C-contiguous array of shape (len(texts), dimension)
+        """
+        if self._client is not None:
+            return self._to_array(self._client.embed_many(texts), dtype)
+            
+        if self.workers > 1 and len(texts) >= self.parallel_threshold:
+            return self._compute_embeddings_parallel(texts, dtype)
+            
+        embeddings = np.empty((len(texts), self.dimension), dtype=dtype)
+        _fill_embeddings(self, texts, embeddings)
+        return embeddings
+        
+    def _compute_embeddings_parallel(self, texts: List[str], dtype: Any) -> np.ndarray:
+        """Compute embeddings across the process pool into shared memory.
+        
+        Workers write their rows straight into a shared matrix, so vectors are
+        never pickled back to this process.
+        
+        Args:
+            texts: Text strings to embed
+            dtype: Floating point type of the returned array
+            
+        Returns:
+            C-contiguous array of shape (len(texts), dimension)
+        """
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(
+                    self.model_name, self.dimension, self.word_cache_size,
+                    str(self.vocabulary.path) if self.vocabulary is not None else None
+                )
+            )
+            
+        shape = (len(texts), self.dimension)
+        dtype = np.dtype(dtype)
+        size = max(1, shape[0] * shape[1] * dtype.itemsize)
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        try:
+            # A few slices per worker keeps the pool balanced
+            step = max(ARRAY_BLOCK_SIZE // 4, -(-len(texts) // (self.workers * 4)))
+            futures = [
+                self._pool.submit(
+                    _embed_into_shared, shm.name, shape, dtype.str, start,
+                    texts[start:start + step]
+                )
+                for start in range(0, len(texts), step)
+            ]
+            for future in futures:
+                future.result()
+                
+            shared = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+            embeddings = shared.copy()
+            del shared
+            return embeddings
+            
+        finally:
+            shm.close()
+            shm.unlink()
+            
+    def build_vocabulary(self, texts: Iterable[str], path: Union[str, Path]) -> VocabularyTable:
+        """Hash the words of a corpus into a vocabulary table and use it.
+        
+        Args:
+            texts: Texts whose distinct words are stored
+            path: Directory receiving the table files
+            
+        Returns:
+            VocabularyTable: The written table
+        """
+        if self._client is not None:
+            raise ValueError("Vocabulary tables are only supported by the hash model")
+            
+        words = list(dict.fromkeys(word for text in texts for word in text.split()))
+        bases, codes = self._hash_words(words)
+        table = VocabularyTable.write(path, words, bases, codes, self.dimension)
+        self.use_vocabulary(table)
+        return table
+        
+    def use_vocabulary(self, vocabulary: Union[str, Path, VocabularyTable]):
+        """Look words up in a vocabulary table before hashing them.
+        
+        Pool workers started afterwards open the same memory-mapped table.
+        
+        Args:
+            vocabulary: Vocabulary table, or the directory of one
+        """
+        if self._client is not None:
+            raise ValueError("Vocabulary tables are only supported by the hash model")
+        if not isinstance(vocabulary, VocabularyTable):
+            vocabulary = VocabularyTable(vocabulary)
+        if vocabulary.dimension != self.dimension:
+            raise ValueError(
+                f"Vocabulary table has dimension {vocabulary.dimension}, expected {self.dimension}"
+            )
+            
+        self.vocabulary = vocabulary
+        
+        # Restart the pool so its workers open the new table
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+            
+    def word_cache_info(self) -> Dict[str, int]:
+        """Return statistics about the word contribution cache.
+        
+        Returns:
+            Dictionary with hits, misses, current size and maximum size
+        """
+        return {
+            "hits": self.word_cache_hits,
+            "misses": self.word_cache_misses,
+            "size": len(self._word_slots),
+            "max_size": self.word_cache_size,
+        }
+        
+    def clear_word_cache(self):
+        """Empty the word contribution cache and reset its counters."""
+        self._word_slots.clear()
+        self._slot_bases = np.empty(0, dtype=np.int64)
+        # Sized to (capacity, span) when the first word is cached
+        self._slot_codes = np.empty((0, 0), dtype=np.uint8)
+        self.word_cache_hits = 0
+        self.word_cache_misses = 0
+        
+    @property
+    def _span(self) -> int:
+        """Number of dimensions written by each word."""
+        return min(HASH_SPAN, self.dimension)
+        
+    def _word_contributions(self, words: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the dimensions and values each word writes into an embedding.
+        
+        Word ``w`` with 256-bit hash ``h`` writes ``((h >> j) & 0xFF) / 255`` into
+        dimension ``(h + j) % dimension`` for ``j`` in ``range(32)``. Words found
+        in the vocabulary table or the LRU cache are not hashed again.
+        
+        Args:
+            words: Distinct words to look up
+            
+        Returns:
+            Tuple of (indices, values) arrays, each of shape (len(words), span)
+        """
+        if self.vocabulary is not None:
+            bases, codes = self._table_hash_words(words)
+        elif self.word_cache_size > 0:
+            bases, codes = self._cached_hash_words(words)
+        else:
+            bases, codes = self._hash_words(words)
+            
+        offsets = np.arange(self._span, dtype=np.int64)
+        indices = (bases[:, None] + offsets) % self.dimension
+        values = codes / 255.0
+        return indices, values
+        
+    def _table_hash_words(self, words: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Look up words in the vocabulary table, hashing only unknown words.
+        
+        Args:
+            words: Distinct words to look up
+            
+        Returns:
+            Tuple of (bases, codes) arrays as returned by ``_hash_words``
+        """
+        rows = self.vocabulary.lookup(words)
+        known = rows >= 0
+        bases = np.empty(len(words), dtype=np.int64)
+        codes = np.empty((len(words), self._span), dtype=np.uint8)
+        bases[known] = self.vocabulary.bases[rows[known]]
+        codes[known] = self.vocabulary.codes[rows[known]]
+        
+        missing = np.flatnonzero(~known)
+        if len(missing):
+            unknown = [words[i] for i in missing]
+            if self.word_cache_size > 0:
+                bases[missing], codes[missing] = self._cached_hash_words(unknown)
+            else:
+                bases[missing], codes[missing] = self._hash_words(unknown)
+                
+        return bases, codes
+        
+    def _cached_hash_words(self, words: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Look up hashed words in the LRU cache, hashing only the misses.
+        
+        Each cached word owns a slot in two contiguous tables holding its first
+        dimension and its 8-bit value codes, so a hit costs one dictionary
+        lookup plus a vectorized gather.
+        
+        Args:
+            words: Distinct words to look up
+            
+        Returns:
+            Tuple of (bases, codes) arrays as returned by ``_hash_words``
+        """
+        slots = self._word_slots
+        found = [slots.get(word, -1) for word in words]
+        missing = [i for i, slot in enumerate(found) if slot < 0]
+        self.word_cache_hits += len(words) - len(missing)
+        self.word_cache_misses += len(missing)
+        
+        for word, slot in zip(words, found):
+            if slot >= 0:
+                slots.move_to_end(word)
+                
+        found = np.asarray(found, dtype=np.int64)
+        bases = np.empty(len(words), dtype=np.int64)
+        codes = np.empty((len(words), self._span), dtype=np.uint8)
+        if len(missing) < len(words):
+            hit = found >= 0
+            bases[hit] = self._slot_bases[found[hit]]
+            codes[hit] = self._slot_codes[found[hit]]
+        
+        if missing:
+            new_bases, new_codes = self._hash_words([words[i] for i in missing])
+            bases[missing] = new_bases
+            codes[missing] = new_codes
+            
+            # Only the most recent misses fit when a batch exceeds the cache
+            keep = missing[-self.word_cache_size:]
+            new_slots = [self._claim_slot(words[i]) for i in keep]
+            self._slot_bases[new_slots] = bases[keep]
+            self._slot_codes[new_slots] = codes[keep]
+            
+        return bases, codes
+        
+    def _claim_slot(self, word: str) -> int:
+        """Assign a table slot to a word, evicting the least recently used one.
+        
+        Args:
+            word: Word to insert into the cache
+            
+        Returns:
+            Index of the slot now owned by the word
+        """
+        slots = self._word_slots
+        if len(slots) >= self.word_cache_size:
+            _, slot = slots.popitem(last=False)
+        else:
+            slot = len(slots)
+            if slot >= len(self._slot_bases):
+                # Grow the tables geometrically up to the configured size
+                capacity = min(self.word_cache_size, max(1024, 2 * len(self._slot_bases)))
+                self._slot_bases = np.resize(self._slot_bases, capacity)
+                self._slot_codes = np.resize(self._slot_codes, (capacity, self._span))
+        slots[word] = slot
+        return slot
         
-        # Split text into words and hash each one
-        words = text.split()
+    def _hash_words(self, words: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Hash words into their first dimension and 8-bit value codes.
+        
+        Args:
+            words: Words to hash
+            
+        Returns:
+            Tuple of (bases, codes): the first dimension written by each word and
+            a (len(words), span) uint8 array of the values scaled to 0-255
+        """
+        offsets = np.arange(self._span, dtype=np.int64)
+        
+        bases = np.empty(len(words), dtype=np.int64)
+        low_bits = np.empty(len(words), dtype=np.int64)
         for i, word in enumerate(words):
-            # Get hash of word
-            word_hash = int(hashlib.sha256(word.encode()).hexdigest(), 16)
-            
-            # Use hash to set values in embedding vector
-            for j in range(min(32, self.dimension)):  # Use first 32 bytes of hash
-                idx = (word_hash + j) % self.dimension
-                val = ((word_hash >> j) & 0xFF) / 255.0  # Normalize to [0,1]
-                embedding[idx] = val
+            word_hash = int.from_bytes(hashlib.sha256(word.encode()).digest(), "big")
+            bases[i] = word_hash % self.dimension
+            low_bits[i] = word_hash & _LOW_BITS_MASK
+            
+        codes = ((low_bits[:, None] >> offsets) & 0xFF).astype(np.uint8)
+        return bases, codes
+        
+    def _generate_batch_embeddings(self, texts: List[str]) -> np.ndarray:
+        """Generate hash embeddings for a batch of texts with array operations.
+        
+        Produces exactly the vectors of the original word-by-word loop: later
+        words overwrite the dimensions written by earlier ones, and each row is
+        L2-normalized.
+        
+        Args:
+            texts: Text strings to embed
+            
+        Returns:
+            Array of shape (len(texts), dimension) with float64 embeddings
+        """
+        embeddings = np.zeros((len(texts), self.dimension))
+        
+        # Only the last occurrence of a word within a text matters, since an
+        # earlier occurrence writes the same values to the same dimensions.
+        vocabulary: Dict[str, int] = {}
+        rows = []
+        word_ids = []
+        for row, text in enumerate(texts):
+            last_seen = {word: None for word in reversed(text.split())}
+            for word in reversed(last_seen):
+                word_id = vocabulary.setdefault(word, len(vocabulary))
+                rows.append(row)
+                word_ids.append(word_id)
                 
-        # Normalize the embedding vector
-        norm = np.linalg.norm(embedding)
-        if norm > 0:
-            embedding = embedding / norm
+        if word_ids:
+            indices, values = self._word_contributions(list(vocabulary))
+            rows = np.asarray(rows, dtype=np.int64)
+            word_ids = np.asarray(word_ids, dtype=np.int64)
             
-        return embedding.tolist()
\ No newline at end of file
+            # Flatten every write in order, then keep only the last write to
+            # each (row, dimension) cell so the scatter is order independent.
+            cells = (rows[:, None] * self.dimension + indices[word_ids]).ravel()
+            writes = values[word_ids].ravel()
+            last_write = np.full(embeddings.size, -1, dtype=np.int64)
+            np.maximum.at(last_write, cells, np.arange(cells.size, dtype=np.int64))
+            written = np.flatnonzero(last_write >= 0)
+            embeddings.ravel()[written] = writes[last_write[written]]
+            
+        # Normalize each row exactly like np.linalg.norm on a single vector
+        for row in embeddings:
+            norm = np.linalg.norm(row)
+            if norm > 0:
+                row /= norm
+                
+        return embeddings
+
+def _fill_embeddings(generator: EmbeddingGenerator, texts: List[str], out: np.ndarray):
+    """Embed texts block by block into a preallocated output array.
+    
+    Args:
+        generator: Generator used to compute the embeddings
+        texts: Text strings to embed
+        out: Array of shape (len(texts), dimension) receiving the rows
+    """
+    for start in range(0, len(texts), ARRAY_BLOCK_SIZE):
+        block = texts[start:start + ARRAY_BLOCK_SIZE]
+        out[start:start + len(block)] = generator._generate_batch_embeddings(block)
+
+def _init_worker(model_name: str, dimension: int, word_cache_size: int, vocabulary_path: Optional[str] = None):
+    """Create the generator used by a pool worker process.
+    
+    The generator lives for the whole process, so its word cache stays warm
+    across tasks. A vocabulary table is memory-mapped, so workers share its
+    pages instead of hashing the corpus again.
+    """
+    global _worker_generator
+    _worker_generator = EmbeddingGenerator(model_name=model_name, word_cache_size=word_cache_size)
+    _worker_generator.dimension = dimension
+    _worker_generator.clear_word_cache()
+    if vocabulary_path is not None:
+        _worker_generator.use_vocabulary(vocabulary_path)
+
+def _embed_into_shared(shm_name: str, shape: Tuple[int, int], dtype: str, start: int, texts: List[str]) -> int:
+    """Embed a slice of a batch into a shared memory matrix.
+    
+    Args:
+        shm_name: Name of the shared memory block holding the output matrix
+        shape: Shape of the full output matrix
+        dtype: NumPy dtype string of the output matrix
+        start: First row written by this task
+        texts: Text strings to embed
+        
+    Returns:
+        int: Number of rows written
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        shared = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+        _fill_embeddings(_worker_generator, texts, shared[start:start + len(texts)])
+        del shared
+        return len(texts)
+    finally:
+        shm.close()
\ No newline at end of file
@@ -1 +1,230 @@
- 
\ No newline at end of file
+"""
+Incremental ingestion module for pdf2vector.
+
+This module re-ingests edited PDFs page by page: a manifest kept next to the
+collection records a content hash and the chunk IDs of every page, so only
+the pages whose content changed are extracted and embedded again.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from pdfminer.pdftypes import PDFObjRef, PDFStream, resolve1
+
+from .chunking import PDFChunker, iter_pdf_pages
+from .vector_store import ChromaDBStore
+
+logger = logging.getLogger(__name__)
+
+# Format version of the manifest written by PageManifest.save
+MANIFEST_FORMAT = 1
+
+def _object_digest(obj: Any, memo: Dict[int, bytes]) -> bytes:
+    """Hash a PDF object and everything it references.
+    
+    Args:
+        obj: PDF object, such as a resource dictionary.
+        memo: Digests of the indirect objects hashed so far, by object ID,
+            so resources shared by many pages are hashed once.
+            
+    Returns:
+        sha256 digest of the object.
+    """
+    if isinstance(obj, PDFObjRef):
+        if obj.objid not in memo:
+            # A reference back to an object being hashed stands for its ID
+            memo[obj.objid] = f"ref {obj.objid}".encode()
+            memo[obj.objid] = _object_digest(obj.resolve(), memo)
+        return memo[obj.objid]
+        
+    digest = hashlib.sha256()
+    if isinstance(obj, PDFStream):
+        digest.update(b"stream")
+        digest.update(_object_digest(obj.attrs, memo))
+        # Raw bytes are as good as decoded ones to detect a change
+        data = obj.get_rawdata()
+        digest.update(data if data is not None else obj.get_data())
+    elif isinstance(obj, dict):
+        digest.update(b"dict")
+        for key in sorted(obj):
+            # The parent links back up to the page tree, not down to content
+            if key != "Parent":
+                digest.update(key.encode())
+                digest.update(_object_digest(obj[key], memo))
+    elif isinstance(obj, list):
+        digest.update(b"list")
+        for item in obj:
+            digest.update(_object_digest(item, memo))
+    else:
+        digest.update(repr(obj).encode())
+    return digest.digest()
+    
+def page_hashes(pdf_path: Path) -> List[str]:
+    """Hash the content of every page of a PDF without extracting its text.
+    
+    A page hash covers the decoded content streams, media box and rotation
+    of the page, and its resources with the fonts, ToUnicode maps and Form
+    XObjects they reference, which is far cheaper than layout analysis.
+    
+    Args:
+        pdf_path: Path to the PDF file.
+        
+    Returns:
+        Hex sha256 digest of each page, in order.
+    """
+    hashes = []
+    memo: Dict[int, bytes] = {}
+    with open(pdf_path, "rb") as fp:
+        for page in iter_pdf_pages(fp):
+            digest = hashlib.sha256(f"{page.mediabox}{page.rotate}".encode())
+            for stream in page.contents:
+                stream = resolve1(stream)
+                if stream is not None:
+                    digest.update(stream.get_data())
+            digest.update(_object_digest(page.resources, memo))
+            hashes.append(digest.hexdigest())
+    return hashes
+
+class PageManifest:
+    """Page hashes and chunk IDs of the ingested PDFs, stored as JSON."""
+    
+    def __init__(self, path: Union[str, Path]):
+        """Open a manifest, starting empty if the file does not exist.
+        
+        Args:
+            path: Path of the manifest file.
+        """
+        self.path = Path(path)
+        self.documents: Dict[str, Dict[str, Any]] = {}
+        if self.path.exists():
+            data = json.loads(self.path.read_text())
+            if data.get("format") != MANIFEST_FORMAT:
+                raise ValueError(f"Unsupported manifest format in {self.path}")
+            self.documents = data["documents"]
+            
+    def get(self, filename: str) -> Tuple[List[str], List[List[str]]]:
+        """Return the page hashes and per-page chunk IDs of a document.
+        
+        Args:
+            filename: Name of the PDF file.
+            
+        Returns:
+            Tuple of (page hashes, chunk IDs of each page), empty if the
+            document was never ingested page by page.
+        """
+        entry = self.documents.get(filename, {})
+        return entry.get("pages", []), entry.get("chunks", [])
+        
+    def set(self, filename: str, pages: List[str], chunks: List[List[str]]):
+        """Record the page hashes and per-page chunk IDs of a document.
+        
+        Args:
+            filename: Name of the PDF file.
+            pages: Hash of each page.
+            chunks: Chunk IDs of each page.
+        """
+        self.documents[filename] = {"pages": pages, "chunks": chunks}
+        
+    def save(self):
+        """Write the manifest, replacing the previous file atomically."""
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps({"format": MANIFEST_FORMAT, "documents": self.documents}))
+        os.replace(tmp_path, self.path)
+
+class IncrementalIngestor:
+    """Re-ingests PDFs by extracting and embedding only their changed pages."""
+    
+    def __init__(self, chunker: PDFChunker, vector_store: ChromaDBStore, manifest_path: Optional[Path] = None):
+        """Initialize the ingestor.
+        
+        Args:
+            chunker: Chunker used to extract and chunk pages.
+            vector_store: Store receiving the chunks.
+            manifest_path: Path of the manifest (default: ``manifest.json`` in
+                the store's persist directory).
+        """
+        self.chunker = chunker
+        self.vector_store = vector_store
+        self.manifest = PageManifest(manifest_path or vector_store.persist_dir / "manifest.json")
+        
+    def ingest(self, pdf_path: Path) -> List[int]:
+        """Bring the stored chunks of a PDF up to date with its pages.
+        
+        Pages are compared by position, so a page whose hash differs from the
+        stored hash at the same position is re-extracted. Chunks of changed
+        and removed pages are deleted once the new chunks are stored. The
+        first time a document is ingested this way, every chunk previously
+        stored for its filename is replaced.
+        
+        Args:
+            pdf_path: Path to the PDF file.
+            
+        Returns:
+            List[int]: 0-based numbers of the pages that were re-extracted.
+        """
+        try:
+            filename = pdf_path.name
+            hashes = page_hashes(pdf_path)
+            old_hashes, old_chunks = self.manifest.get(filename)
+            
+            changed = [
+                page for page, digest in enumerate(hashes)
+                if page >= len(old_hashes) or old_hashes[page] != digest
+            ]
+            if not changed and len(hashes) == len(old_hashes):
+                logger.info(f"{filename} is unchanged, nothing to ingest")
+                return []
+                
+            # Chunks of changed or removed pages, replaced by this ingest
+            replaced = set(changed)
+            if old_hashes:
+                previous = [
+                    chunk_id
+                    for page, page_ids in enumerate(old_chunks)
+                    if page >= len(hashes) or page in replaced
+                    for chunk_id in page_ids
+                ]
+            else:
+                # First page-level ingest: replace chunks stored without a manifest
+                previous = self.vector_store.document_ids(filename)
+                
+            # Index files are saved once, after both the upsert and the delete
+            with self.vector_store.deferred_saves():
+                # Store the chunks of the changed pages, noting the page of each
+                chunk_pages: List[int] = []
+                
+                def changed_chunks():
+                    for chunk in self.chunker.iter_page_chunks(pdf_path, changed):
+                        chunk_pages.append(chunk.metadata["page"] - 1)
+                        yield chunk
+                        
+                ids = self.vector_store.upsert(changed_chunks(), replacing=set(previous))
+                
+                chunks = [list(page_ids) for page_ids in old_chunks[:len(hashes)]]
+                chunks += [[] for _ in range(len(hashes) - len(chunks))]
+                for page in changed:
+                    chunks[page] = []
+                for page, chunk_id in zip(chunk_pages, ids):
+                    chunks[page].append(chunk_id)
+                
+                # Delete chunks of changed or removed pages that were not stored again
+                current = {chunk_id for page_ids in chunks for chunk_id in page_ids}
+                stale = [chunk_id for chunk_id in previous if chunk_id not in current]
+                self.vector_store.delete(stale)
+            
+            self.manifest.set(filename, hashes, chunks)
+            self.manifest.save()
+            
+            logger.info(
+                f"Re-ingested {len(changed)} of {len(hashes)} pages of {filename}, "
+                f"deleted {len(stale)} stale chunks"
+            )
+            return changed
+            
+        except Exception as e:
+            logger.error(f"Error ingesting PDF {pdf_path}: {str(e)}")
+            raise
\ No newline at end of file
@@ -0,0 +1,187 @@
+"""
+ONNX embedding module for pdf2vector.
+
+This module provides an embedding backend that runs a local transformer model
+with ONNX Runtime on the CPU, fully offline. onnxruntime and tokenizers are
+optional dependencies imported when the model is first used.
+"""
+
+import logging
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .backends import EmbeddingBackend, length_buckets, register_backend
+
+logger = logging.getLogger(__name__)
+
+def pad_batch(sequences: Sequence[Sequence[int]], pad_id: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """Pad token id sequences to the length of the longest one.
+    
+    Args:
+        sequences: Token ids of each item
+        pad_id: Token id used for padding
+        
+    Returns:
+        Tuple of (input_ids, attention_mask) int64 arrays of shape
+        (len(sequences), longest length)
+    """
+    width = max((len(ids) for ids in sequences), default=0)
+    input_ids = np.full((len(sequences), width), pad_id, dtype=np.int64)
+    attention_mask = np.zeros((len(sequences), width), dtype=np.int64)
+    for row, ids in enumerate(sequences):
+        input_ids[row, :len(ids)] = ids
+        attention_mask[row, :len(ids)] = 1
+    return input_ids, attention_mask
+
+def mean_pool(hidden: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+    """Average token embeddings over the unpadded positions.
+    
+    Args:
+        hidden: Token embeddings of shape (batch, tokens, dimension)
+        attention_mask: Mask of shape (batch, tokens), 1 for real tokens
+        
+    Returns:
+        Array of shape (batch, dimension)
+    """
+    mask = attention_mask[:, :, None].astype(hidden.dtype)
+    counts = np.maximum(mask.sum(axis=1), 1)
+    return (hidden * mask).sum(axis=1) / counts
+
+class OnnxEmbeddingBackend(EmbeddingBackend):
+    """Embeds texts with a local ONNX transformer model on the CPU."""
+    
+    def __init__(
+        self,
+        model_path: Union[str, Path],
+        dimension: Optional[int] = None,
+        batch_size: int = 32,
+        max_length: int = 512,
+        normalize: bool = True,
+        threads: Optional[int] = None,
+        bucket_by_length: bool = True
+    ):
+        """
+        Initialize the backend without loading the model.
+        
+        Args:
+            model_path: ``model.onnx`` file, or a directory holding it. The
+                directory must also hold the ``tokenizer.json`` of the model.
+            dimension: Embedding dimension; if omitted, the model is loaded
+                to read it
+            batch_size: Maximum number of texts per inference call
+            max_length: Maximum number of tokens per text
+            normalize: Whether to L2-normalize the embeddings
+            threads: Number of intra-op threads used by ONNX Runtime
+            bucket_by_length: Whether to batch texts of similar token length
+                together to reduce padding, instead of in input order
+        """
+        self.model_path = Path(model_path)
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self.normalize = normalize
+        self.threads = threads
+        self.bucket_by_length = bucket_by_length
+        self._dimension = dimension
+        self._session = None
+        self._tokenizer = None
+        self._input_names: List[str] = []
+        
+    @property
+    def dimension(self) -> int:
+        """Embedding dimension, loading the model if it is not known yet."""
+        if self._dimension is None:
+            self._load()
+        return self._dimension
+        
+    def _load(self):
+        """Load the model and tokenizer on first use."""
+        if self._session is not None:
+            return
+            
+        try:
+            import onnxruntime
+            from tokenizers import Tokenizer
+        except ImportError as e:
+            raise ImportError(
+                "The onnx embedding backend requires onnxruntime and tokenizers. "
+                "Install them with: pip install onnxruntime tokenizers"
+            ) from e
+            
+        model_file = self.model_path
+        if model_file.is_dir():
+            model_file = model_file / "model.onnx"
+        tokenizer_file = model_file.parent / "tokenizer.json"
+        
+        options = onnxruntime.SessionOptions()
+        if self.threads:
+            options.intra_op_num_threads = self.threads
+        self._session = onnxruntime.InferenceSession(
+            str(model_file), sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self._tokenizer = Tokenizer.from_file(str(tokenizer_file))
+        self._tokenizer.enable_truncation(self.max_length)
+        self._tokenizer.no_padding()
+        self._input_names = [model_input.name for model_input in self._session.get_inputs()]
+        
+        if self._dimension is None:
+            width = self._session.get_outputs()[0].shape[-1]
+            self._dimension = width if isinstance(width, int) else len(self._infer([[0]])[0])
+            
+        logger.info(f"Loaded ONNX embedding model from {model_file}")
+        
+    def _infer(self, sequences: List[List[int]]) -> np.ndarray:
+        """Run the model on one padded batch of token ids.
+        
+        Args:
+            sequences: Token ids of each text in the batch
+            
+        Returns:
+            Array of shape (len(sequences), dimension) with pooled embeddings
+        """
+        input_ids, attention_mask = pad_batch(sequences)
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self._input_names:
+            feeds["token_type_ids"] = np.zeros_like(input_ids)
+        feeds = {name: value for name, value in feeds.items() if name in self._input_names}
+        
+        output = self._session.run(None, feeds)[0]
+        if output.ndim == 3:
+            output = mean_pool(output, attention_mask)
+        return output
+        
+    def embed_many(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts in batches of similar token length.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            np.ndarray: float32 array of shape (len(texts), dimension), in input order
+        """
+        self._load()
+        sequences = [encoding.ids for encoding in self._tokenizer.encode_batch(texts)]
+        
+        if self.bucket_by_length:
+            batches = length_buckets([len(ids) for ids in sequences], self.batch_size)
+        else:
+            order = np.arange(len(texts))
+            batches = [order[start:start + self.batch_size] for start in range(0, len(texts), self.batch_size)]
+            
+        embeddings = np.empty((len(texts), self.dimension), dtype=np.float32)
+        for batch in batches:
+            embeddings[batch] = self._infer([sequences[i] for i in batch])
+            
+        if self.normalize:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings /= np.where(norms > 0, norms, 1.0)
+        return embeddings
+        
+    def close(self):
+        """Release the inference session."""
+        self._session = None
+        self._tokenizer = None
+
+register_backend("onnx", OnnxEmbeddingBackend)
\ No newline at end of file
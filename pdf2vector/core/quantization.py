@@ -0,0 +1,206 @@
+"""
+Quantization module for pdf2vector.
+
+This module provides compact int8 and float16 storage of embeddings and an
+index that searches them with asymmetric distance: stored vectors stay
+quantized while the query keeps full precision.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+QUANTIZATION_MODES = ("int8", "float16")
+
+# Number of stored vectors scored together during a search
+_SEARCH_BLOCK = 8192
+
+def quantize(embeddings: np.ndarray, mode: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Quantize a batch of embeddings.
+    
+    Args:
+        embeddings: Array of shape (n, dimension).
+        mode: ``"int8"`` for per-vector scaled int8 codes, or ``"float16"``.
+        
+    Returns:
+        Tuple of (codes, scales). For int8, ``codes * scales[:, None]``
+        approximates the input; for float16 the scales are all ones.
+    """
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    if mode == "int8":
+        scales = np.abs(embeddings).max(axis=1) / 127.0
+        safe = np.where(scales > 0, scales, 1.0)
+        codes = np.rint(embeddings / safe[:, None]).astype(np.int8)
+        return codes, scales.astype(np.float32)
+    if mode == "float16":
+        return embeddings.astype(np.float16), np.ones(len(embeddings), dtype=np.float32)
+    raise ValueError(f"Unsupported quantization mode: {mode}")
+
+def dequantize(codes: np.ndarray, scales: np.ndarray) -> np.ndarray:
+    """Reconstruct float32 embeddings from quantized codes.
+    
+    Args:
+        codes: Quantized codes of shape (n, dimension).
+        scales: Per-vector scales of shape (n,).
+        
+    Returns:
+        Array of shape (n, dimension) with float32 embeddings.
+    """
+    return codes.astype(np.float32) * scales[:, None]
+
+class QuantizedIndex:
+    """Exact search over quantized embeddings with asymmetric distance."""
+    
+    def __init__(self, mode: str, dimension: int):
+        """Initialize an empty index.
+        
+        Args:
+            mode: Quantization mode, one of QUANTIZATION_MODES.
+            dimension: Embedding dimension.
+        """
+        if mode not in QUANTIZATION_MODES:
+            raise ValueError(f"Unsupported quantization mode: {mode}")
+            
+        self.mode = mode
+        self.dimension = dimension
+        self.ids: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._codes = np.empty((0, dimension), dtype=np.int8 if mode == "int8" else np.float16)
+        self._scales = np.empty(0, dtype=np.float32)
+        self._norms = np.empty(0, dtype=np.float32)
+        
+    def __len__(self) -> int:
+        """Return the number of stored vectors."""
+        return len(self.ids)
+        
+    @property
+    def memory_bytes(self) -> int:
+        """Bytes used by the stored codes, scales and norms."""
+        return self._codes.nbytes + self._scales.nbytes + self._norms.nbytes
+        
+    def add(self, ids: List[str], embeddings: np.ndarray):
+        """Add or replace vectors.
+        
+        Args:
+            ids: Unique ID of each vector.
+            embeddings: Array of shape (len(ids), dimension).
+        """
+        codes, scales = quantize(embeddings, self.mode)
+        norms = np.linalg.norm(dequantize(codes, scales), axis=1).astype(np.float32)
+        
+        # Overwrite vectors whose ID is already stored, append the rest
+        new_rows = []
+        for row, chunk_id in enumerate(ids):
+            position = self._positions.get(chunk_id)
+            if position is None:
+                new_rows.append(row)
+            else:
+                self._codes[position] = codes[row]
+                self._scales[position] = scales[row]
+                self._norms[position] = norms[row]
+                
+        if new_rows:
+            for row in new_rows:
+                self._positions[ids[row]] = len(self.ids)
+                self.ids.append(ids[row])
+            self._codes = np.concatenate([self._codes, codes[new_rows]])
+            self._scales = np.concatenate([self._scales, scales[new_rows]])
+            self._norms = np.concatenate([self._norms, norms[new_rows]])
+            
+    def remove(self, ids: List[str]):
+        """Remove vectors by ID; unknown IDs are ignored.
+        
+        Args:
+            ids: IDs of the vectors to remove.
+        """
+        drop = {self._positions[chunk_id] for chunk_id in ids if chunk_id in self._positions}
+        if not drop:
+            return
+        keep = np.array([i for i in range(len(self.ids)) if i not in drop], dtype=np.int64)
+        self.ids = [self.ids[i] for i in keep]
+        self._positions = {chunk_id: i for i, chunk_id in enumerate(self.ids)}
+        self._codes = self._codes[keep]
+        self._scales = self._scales[keep]
+        self._norms = self._norms[keep]
+        
+    def search(self, query: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        """Find the stored vectors most similar to a query.
+        
+        The query is not quantized: each score is the cosine between the
+        full-precision query and a dequantized vector, computed block by block
+        from the codes.
+        
+        Args:
+            query: Query embedding of shape (dimension,).
+            k: Number of results to return.
+            
+        Returns:
+            List of (id, cosine similarity) pairs, best first.
+        """
+        if not self.ids or k <= 0:
+            return []
+            
+        query = np.asarray(query, dtype=np.float32).ravel()
+        query_norm = float(np.linalg.norm(query)) or 1.0
+        
+        scores = np.empty(len(self.ids), dtype=np.float32)
+        for start in range(0, len(self.ids), _SEARCH_BLOCK):
+            block = self._codes[start:start + _SEARCH_BLOCK].astype(np.float32)
+            scores[start:start + len(block)] = block @ query
+            
+        scores *= self._scales
+        scores /= np.where(self._norms > 0, self._norms, 1.0) * query_norm
+        
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self.ids[i], float(scores[i])) for i in top]
+        
+    def save(self, path: Path):
+        """Write the index to an ``.npz`` file.
+        
+        Args:
+            path: Destination file, replaced atomically.
+        """
+        path = Path(path)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as file:
+            np.savez(
+                file,
+                mode=np.array(self.mode),
+                ids=np.array(self.ids, dtype=str),
+                codes=self._codes,
+                scales=self._scales,
+                norms=self._norms,
+            )
+        os.replace(tmp_path, path)
+        
+    @classmethod
+    def load(cls, path: Path, dimension: Optional[int] = None) -> "QuantizedIndex":
+        """Read an index written by ``save``.
+        
+        Args:
+            path: Source file.
+            dimension: Expected embedding dimension, checked if given.
+            
+        Returns:
+            QuantizedIndex: The loaded index.
+        """
+        with np.load(Path(path)) as data:
+            codes = data["codes"]
+            if dimension is not None and codes.shape[1] != dimension:
+                raise ValueError(
+                    f"Quantized index {path} has dimension {codes.shape[1]}, expected {dimension}"
+                )
+            index = cls(str(data["mode"]), codes.shape[1])
+            index.ids = data["ids"].tolist()
+            index._positions = {chunk_id: i for i, chunk_id in enumerate(index.ids)}
+            index._codes = codes
+            index._scales = data["scales"]
+            index._norms = data["norms"]
+        return index
\ No newline at end of file
@@ -0,0 +1,230 @@
+"""
+Rate limiting module for pdf2vector.
+
+This module provides an adaptive token-bucket limiter shared by the clients
+of remote APIs. Its request rate grows additively while calls succeed and
+shrinks multiplicatively when the API throttles (AIMD). Unless given a
+starting rate, it lets requests through unlimited until the first throttle.
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+# Response headers reporting the remaining and total request quota
+_REMAINING_HEADERS = (
+    "x-ratelimit-remaining-requests",
+    "anthropic-ratelimit-requests-remaining",
+)
+_LIMIT_HEADERS = (
+    "x-ratelimit-limit-requests",
+    "anthropic-ratelimit-requests-limit",
+)
+
+def _header_number(headers: Any, names) -> Optional[float]:
+    """Read the first numeric header found among names.
+    
+    Args:
+        headers: Response headers mapping
+        names: Candidate header names
+        
+    Returns:
+        Optional[float]: The header value, or None if absent or not numeric
+    """
+    if not isinstance(headers, Mapping):
+        return None
+    for name in names:
+        try:
+            return float(headers[name])
+        except (KeyError, TypeError, ValueError):
+            continue
+    return None
+
+class AdaptiveRateLimiter:
+    """Token bucket whose refill rate adapts to throttling (AIMD)."""
+    
+    def __init__(
+        self,
+        initial_rate: Optional[float] = None,
+        min_rate: float = 0.2,
+        max_rate: float = 100.0,
+        increase: float = 0.5,
+        decrease_factor: float = 0.5,
+        low_quota_fraction: float = 0.1
+    ):
+        """
+        Initialize the limiter.
+        
+        Args:
+            initial_rate: Requests per second allowed at start, such as the
+                limit of the provider tier. If None, requests are not limited
+                until the API first throttles, and the rate then starts from
+                the rate observed over the last second
+            min_rate: Lower bound of the adapted rate
+            max_rate: Upper bound of the adapted rate once limited
+            increase: Requests per second added after each successful call
+            decrease_factor: Factor applied to the rate when throttled
+            low_quota_fraction: Fraction of the quota left, as reported by
+                response headers, below which the rate stops increasing
+        """
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.low_quota_fraction = low_quota_fraction
+        
+        if initial_rate is None:
+            self._rate = math.inf
+        else:
+            self._rate = min(max(initial_rate, min_rate), max_rate)
+        self._tokens = 1.0
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        # Requests admitted in the last second while unlimited
+        self._admitted: Deque[float] = deque()
+        self._last_decrease = -math.inf
+        self._lock = threading.Lock()
+        
+        self.requests = 0
+        self.throttled = 0
+        
+    @property
+    def rate(self) -> float:
+        """Current allowed requests per second (infinite until limited)."""
+        return self._rate
+        
+    def metrics(self) -> Dict[str, float]:
+        """
+        Return the limiter's current state for monitoring.
+        
+        Returns:
+            Dict[str, float]: Current rate, requests admitted and throttles seen
+        """
+        with self._lock:
+            return {
+                "rate": self._rate,
+                "requests": self.requests,
+                "throttled": self.throttled,
+            }
+            
+    def acquire(self) -> float:
+        """
+        Block until a request may be sent.
+        
+        Returns:
+            float: Monotonic time the request was admitted, to pass back to
+                ``on_throttle`` as ``sent_at``
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif math.isinf(self._rate):
+                    self._admitted.append(now)
+                    while self._admitted[0] < now - 1.0:
+                        self._admitted.popleft()
+                    self.requests += 1
+                    return now
+                elif self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    self.requests += 1
+                    return now
+                else:
+                    wait = (1.0 - self._tokens) / self._rate
+            time.sleep(wait)
+            
+    def on_success(self, headers: Any = None):
+        """
+        Record a successful response and raise the rate additively.
+        
+        Args:
+            headers: Response headers, used to hold the rate when the reported
+                remaining quota is low
+        """
+        remaining = _header_number(headers, _REMAINING_HEADERS)
+        limit = _header_number(headers, _LIMIT_HEADERS)
+        
+        with self._lock:
+            if remaining is not None and limit:
+                if remaining <= 0:
+                    self._decrease(None)
+                    return
+                if remaining / limit < self.low_quota_fraction:
+                    return
+            if not math.isinf(self._rate):
+                self._set_rate(self._rate + self.increase)
+            
+    def on_throttle(self, retry_after: Optional[float] = None, sent_at: Optional[float] = None):
+        """
+        Record a throttled (429) response and back off multiplicatively.
+        
+        The rate is decreased at most once per burst of throttles: requests
+        sent before the previous decrease were paced at the old rate, so
+        their 429s do not decrease it again.
+        
+        Args:
+            retry_after: Seconds the server asked to wait, if it said so
+            sent_at: Admission time returned by ``acquire`` for the throttled
+                request. If None, throttles within one request interval of
+                the previous decrease are treated as the same burst
+        """
+        with self._lock:
+            self.throttled += 1
+            self._decrease(sent_at)
+            pause = retry_after if retry_after is not None else 1.0 / self._rate
+            self._paused_until = max(self._paused_until, time.monotonic() + pause)
+            self._tokens = 0.0
+            logger.info(f"Throttled by API, backing off to {self._rate:.2f} requests/s")
+            
+    def _decrease(self, sent_at: Optional[float]):
+        """Apply one multiplicative decrease unless one already covers this burst."""
+        now = time.monotonic()
+        if sent_at is None:
+            if now - self._last_decrease < 1.0 / self._rate:
+                return
+        elif sent_at < self._last_decrease:
+            return
+            
+        if math.isinf(self._rate):
+            # Leave unlimited mode from the rate the API just refused
+            self._rate = min(max(float(len(self._admitted)), self.min_rate), self.max_rate)
+            self._admitted.clear()
+            self._tokens = 0.0
+        self._set_rate(self._rate * self.decrease_factor)
+        self._last_decrease = now
+        
+    def _refill(self, now: float):
+        """Add the tokens earned since the last update."""
+        if math.isinf(self._rate):
+            self._updated = now
+            return
+        capacity = max(1.0, self._rate)
+        self._tokens = min(capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+        
+    def _set_rate(self, rate: float):
+        """Clamp and apply a new rate."""
+        self._refill(time.monotonic())
+        rate = min(max(rate, self.min_rate), self.max_rate)
+        if rate != self._rate:
+            logger.debug(f"Rate limit adjusted to {rate:.2f} requests/s")
+        self._rate = rate
+
+def parse_retry_after(headers: Any) -> Optional[float]:
+    """
+    Read the Retry-After header in seconds.
+    
+    Args:
+        headers: Response headers mapping
+        
+    Returns:
+        Optional[float]: Seconds to wait, or None if absent or not numeric
+    """
+    return _header_number(headers, ("retry-after", "Retry-After"))
\ No newline at end of file
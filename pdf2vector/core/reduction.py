@@ -0,0 +1,168 @@
+"""
+Dimensionality reduction module for pdf2vector.
+
+This module provides a reduction stage that maps embeddings to a smaller
+dimension, either with randomized PCA fitted on a sample of the corpus or
+with a sparse random projection.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+REDUCTION_METHODS = ("pca", "random")
+
+# Extra random directions and power iterations used by randomized PCA
+_PCA_OVERSAMPLES = 10
+_PCA_POWER_ITERATIONS = 4
+
+class DimensionReducer:
+    """Reduces embeddings to ``target_dimension`` and re-normalizes them."""
+    
+    def __init__(self, target_dimension: int = 256, method: str = "pca", seed: int = 0):
+        """Initialize an unfitted reducer.
+        
+        Args:
+            target_dimension: Dimension of the reduced embeddings.
+            method: ``"pca"`` for randomized PCA fitted on a sample, or
+                ``"random"`` for a sparse random projection.
+            seed: Seed of the random generator.
+        """
+        if method not in REDUCTION_METHODS:
+            raise ValueError(f"Unsupported reduction method: {method}")
+            
+        self.target_dimension = target_dimension
+        self.method = method
+        self.seed = seed
+        self._mean: Optional[np.ndarray] = None
+        self._components: Optional[np.ndarray] = None
+        
+    @property
+    def fitted(self) -> bool:
+        """Whether the reducer can transform embeddings."""
+        return self._components is not None
+        
+    @property
+    def input_dimension(self) -> Optional[int]:
+        """Dimension of the embeddings the reducer was fitted on."""
+        return None if self._components is None else self._components.shape[1]
+        
+    def fit(self, embeddings: np.ndarray) -> "DimensionReducer":
+        """Fit the reducer on a sample of embeddings.
+        
+        A random projection only depends on the input dimension. PCA keeps
+        at most as many components as the sample has rows; the remaining
+        output dimensions are always zero.
+        
+        Args:
+            embeddings: Sample of shape (n, input dimension).
+            
+        Returns:
+            DimensionReducer: The fitted reducer.
+        """
+        embeddings = np.asarray(embeddings, dtype=np.float64)
+        rng = np.random.default_rng(self.seed)
+        if self.method == "random":
+            self._fit_random_projection(embeddings.shape[1], rng)
+        else:
+            self._fit_pca(embeddings, rng)
+            
+        logger.info(
+            f"Fitted {self.method} reduction from {embeddings.shape[1]} "
+            f"to {self.target_dimension} dimensions on {len(embeddings)} embeddings"
+        )
+        return self
+        
+    def _fit_random_projection(self, input_dimension: int, rng: np.random.Generator):
+        """Draw a sparse random projection (Achlioptas / Li et al.)."""
+        density = 1 / np.sqrt(input_dimension)
+        signs = rng.choice(
+            [-1.0, 0.0, 1.0],
+            size=(self.target_dimension, input_dimension),
+            p=[density / 2, 1 - density, density / 2]
+        )
+        self._mean = np.zeros(input_dimension, dtype=np.float32)
+        self._components = (signs / np.sqrt(density * self.target_dimension)).astype(np.float32)
+        
+    def _fit_pca(self, embeddings: np.ndarray, rng: np.random.Generator):
+        """Fit the leading principal components with a randomized SVD."""
+        mean = embeddings.mean(axis=0)
+        centered = embeddings - mean
+        n_components = min(self.target_dimension, *centered.shape)
+        
+        # Range finder with power iterations (Halko, Martinsson and Tropp)
+        sketch = centered @ rng.standard_normal((centered.shape[1], n_components + _PCA_OVERSAMPLES))
+        for _ in range(_PCA_POWER_ITERATIONS):
+            sketch, _ = np.linalg.qr(sketch)
+            sketch = centered @ (centered.T @ sketch)
+        basis, _ = np.linalg.qr(sketch)
+        _, _, vt = np.linalg.svd(basis.T @ centered, full_matrices=False)
+        
+        components = np.zeros((self.target_dimension, centered.shape[1]), dtype=np.float32)
+        components[:n_components] = vt[:n_components]
+        self._mean = mean.astype(np.float32)
+        self._components = components
+        
+    def transform(self, embeddings: np.ndarray) -> np.ndarray:
+        """Reduce embeddings.
+        
+        Args:
+            embeddings: Array of shape (n, input dimension).
+            
+        Returns:
+            Array of shape (n, target_dimension) with float32, L2-normalized rows.
+        """
+        if not self.fitted:
+            raise ValueError("DimensionReducer must be fitted before transform")
+            
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        if embeddings.shape[1] != self.input_dimension:
+            raise ValueError(
+                f"Expected embeddings of dimension {self.input_dimension}, got {embeddings.shape[1]}"
+            )
+            
+        reduced = (embeddings - self._mean) @ self._components.T
+        norms = np.linalg.norm(reduced, axis=1, keepdims=True)
+        return reduced / np.where(norms > 0, norms, 1.0)
+        
+    def save(self, path: Path):
+        """Write the fitted reducer to an ``.npz`` file.
+        
+        Args:
+            path: Destination file, replaced atomically.
+        """
+        if not self.fitted:
+            raise ValueError("DimensionReducer must be fitted before save")
+        path = Path(path)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as file:
+            np.savez(
+                file,
+                method=np.array(self.method),
+                seed=np.array(self.seed),
+                mean=self._mean,
+                components=self._components,
+            )
+        os.replace(tmp_path, path)
+        
+    @classmethod
+    def load(cls, path: Path) -> "DimensionReducer":
+        """Read a reducer written by ``save``.
+        
+        Args:
+            path: Source file.
+            
+        Returns:
+            DimensionReducer: The fitted reducer.
+        """
+        with np.load(Path(path)) as data:
+            components = data["components"]
+            reducer = cls(components.shape[0], str(data["method"]), int(data["seed"]))
+            reducer._mean = data["mean"]
+            reducer._components = components
+        return reducer
\ No newline at end of file
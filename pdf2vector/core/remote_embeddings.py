@@ -0,0 +1,295 @@
+"""
+Remote embedding module for pdf2vector.
+
+This module provides a client for OpenAI-compatible embedding APIs that
+packs many texts into each request over a pooled keep-alive session.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .backends import EmbeddingBackend
+from .rate_limit import AdaptiveRateLimiter, parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URL = "https://api.openai.com/v1"
+
+# Number of times a throttled (429) request is retried
+MAX_THROTTLE_RETRIES = 5
+
+class EmbeddingError(Exception):
+    """Custom exception for embedding API errors."""
+    pass
+
+def estimate_tokens(text: str) -> int:
+    """Roughly estimate the number of tokens in a text.
+    
+    Args:
+        text: Text to measure.
+        
+    Returns:
+        int: Estimated token count, assuming about four characters per token.
+    """
+    return len(text) // 4 + 1
+
+class RemoteEmbeddingClient(EmbeddingBackend):
+    """Client for an OpenAI-compatible ``/embeddings`` endpoint."""
+    
+    def __init__(
+        self,
+        api_key: str,
+        model_name: str,
+        base_url: str = DEFAULT_BASE_URL,
+        max_batch_items: int = 2048,
+        max_batch_tokens: int = 300_000,
+        timeout: float = 30.0,
+        pool_size: int = 10,
+        max_concurrency: int = 8,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None
+    ):
+        """
+        Initialize the client.
+        
+        Args:
+            api_key: API key sent as a bearer token
+            model_name: Name of the remote embedding model
+            base_url: Base URL of the API, e.g. a local stand-in server
+            max_batch_items: Maximum number of texts packed into one request
+            max_batch_tokens: Maximum estimated tokens packed into one request
+            timeout: Timeout in seconds for each request
+            pool_size: Number of keep-alive connections kept per host
+            max_concurrency: Maximum number of requests in flight from the
+                asyncio API
+            rate_limiter: Limiter shared with other API clients (defaults to
+                a new AdaptiveRateLimiter)
+        """
+        self.api_key = api_key
+        self.model_name = model_name
+        self.url = f"{base_url.rstrip('/')}/embeddings"
+        self.max_batch_items = max_batch_items
+        self.max_batch_tokens = max_batch_tokens
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter()
+        
+        # Configure retry strategy for server errors; embedding requests are
+        # safe to repeat. Throttling (429) is handled by the rate limiter.
+        retry_strategy = Retry(
+            total=3,
+            backoff_factor=1,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=["POST"],
+        )
+        
+        # Create pooled keep-alive session with retry strategy
+        pool_size = max(pool_size, max_concurrency)
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=retry_strategy
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+    @property
+    def dimension(self) -> Optional[int]:
+        """The API does not report dimensions; they are known per model."""
+        return None
+        
+    def _post(self, payload_input) -> List[List[float]]:
+        """
+        Send one embeddings request.
+        
+        Args:
+            payload_input: A single text or a list of texts
+            
+        Returns:
+            List[List[float]]: One embedding per input, in input order
+        """
+        for _ in range(MAX_THROTTLE_RETRIES + 1):
+            sent_at = self.rate_limiter.acquire()
+            response = self.session.post(
+                self.url,
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "model": self.model_name,
+                    "input": payload_input
+                },
+                timeout=self.timeout
+            )
+            if response.status_code != 429:
+                break
+            self.rate_limiter.on_throttle(parse_retry_after(response.headers), sent_at)
+            
+        response.raise_for_status()
+        self.rate_limiter.on_success(response.headers)
+        data = response.json()["data"]
+        
+        # The API reports each item's position; fall back to response order
+        if all("index" in item for item in data):
+            data = sorted(data, key=lambda item: item["index"])
+        return [item["embedding"] for item in data]
+        
+    def pack_batches(self, texts: List[str]) -> List[List[str]]:
+        """
+        Split texts into request-sized batches.
+        
+        Args:
+            texts: Texts to send, in order
+            
+        Returns:
+            List[List[str]]: Batches respecting the item and token limits
+        """
+        batches: List[List[str]] = []
+        batch: List[str] = []
+        batch_tokens = 0
+        for text in texts:
+            tokens = estimate_tokens(text)
+            if batch and (
+                len(batch) >= self.max_batch_items
+                or batch_tokens + tokens > self.max_batch_tokens
+            ):
+                batches.append(batch)
+                batch = []
+                batch_tokens = 0
+            batch.append(text)
+            batch_tokens += tokens
+        if batch:
+            batches.append(batch)
+        return batches
+        
+    def embed_one(self, text: str) -> List[float]:
+        """
+        Embed a single text.
+        
+        Args:
+            text: Text to embed
+            
+        Returns:
+            List[float]: The embedding
+            
+        Raises:
+            EmbeddingError: If the request fails
+        """
+        try:
+            return self._post(text)[0]
+            
+        except (requests.exceptions.RequestException, KeyError, IndexError) as e:
+            error_msg = f"Error generating embedding: {str(e)}"
+            logger.error(error_msg)
+            raise EmbeddingError(error_msg)
+            
+    def embed_many(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed many texts with as few requests as possible.
+        
+        Duplicate texts are sent once and their embedding is reused.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            List[List[float]]: One embedding per text, in input order
+            
+        Raises:
+            EmbeddingError: If a request fails
+        """
+        try:
+            unique = list(dict.fromkeys(texts))
+            vectors: Dict[str, List[float]] = {}
+            for batch in self.pack_batches(unique):
+                embeddings = self._post(batch)
+                if len(embeddings) != len(batch):
+                    raise EmbeddingError(
+                        f"Error generating embeddings: expected {len(batch)} "
+                        f"embeddings, got {len(embeddings)}"
+                    )
+                vectors.update(zip(batch, embeddings))
+                
+            if len(unique) < len(texts):
+                logger.debug(f"Skipped {len(texts) - len(unique)} duplicate texts")
+            return [vectors[text] for text in texts]
+            
+        except (requests.exceptions.RequestException, KeyError) as e:
+            error_msg = f"Error generating embeddings: {str(e)}"
+            logger.error(error_msg)
+            raise EmbeddingError(error_msg)
+            
+    async def aembed_many(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed many texts with up to ``max_concurrency`` requests in flight.
+        
+        Batches are packed and de-duplicated as in ``embed_many``. Each request
+        runs on a worker thread of the pooled session, is bounded by a
+        semaphore and times out after ``timeout`` seconds. Results are
+        reassembled in input order.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            List[List[float]]: One embedding per text, in input order
+            
+        Raises:
+            EmbeddingError: If a request fails or times out
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrency,
+                thread_name_prefix="embedding-request"
+            )
+            
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def fetch(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                embeddings = await asyncio.wait_for(
+                    loop.run_in_executor(self._executor, self._post, batch),
+                    timeout=self.timeout
+                )
+            if len(embeddings) != len(batch):
+                raise EmbeddingError(
+                    f"Error generating embeddings: expected {len(batch)} "
+                    f"embeddings, got {len(embeddings)}"
+                )
+            return embeddings
+            
+        try:
+            unique = list(dict.fromkeys(texts))
+            batches = self.pack_batches(unique)
+            results = await asyncio.gather(*(fetch(batch) for batch in batches))
+            
+            vectors: Dict[str, List[float]] = {}
+            for batch, embeddings in zip(batches, results):
+                vectors.update(zip(batch, embeddings))
+            return [vectors[text] for text in texts]
+            
+        except asyncio.TimeoutError:
+            error_msg = f"Error generating embeddings: request timed out after {self.timeout}s"
+            logger.error(error_msg)
+            raise EmbeddingError(error_msg)
+            
+        except (requests.exceptions.RequestException, KeyError) as e:
+            error_msg = f"Error generating embeddings: {str(e)}"
+            logger.error(error_msg)
+            raise EmbeddingError(error_msg)
+            
+    def close(self):
+        """Close the HTTP session and the request threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self.session.close()
\ No newline at end of file
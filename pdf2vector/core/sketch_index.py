@@ -0,0 +1,198 @@
+"""
+Sketch index module for pdf2vector.
+
+This module provides approximate search that scans a packed 1-bit sketch of
+every embedding with Hamming distance to shortlist candidates, then reranks
+the shortlist with exact cosine similarity.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Number of candidates reranked exactly per query
+DEFAULT_CANDIDATES = 1000
+
+# Bits set in each byte value, used when NumPy lacks bitwise_count
+_BYTE_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1).astype(np.uint8)
+
+def _popcount(words: np.ndarray) -> np.ndarray:
+    """Count the set bits of each uint64 word."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words)
+    return _BYTE_POPCOUNT[words.view(np.uint8)].reshape(*words.shape, 8).sum(axis=-1)
+
+def sketch(embeddings: np.ndarray) -> np.ndarray:
+    """Pack one bit per dimension into uint64 words.
+    
+    A bit is set when the value is above the mean of its vector. Hash
+    embeddings are never negative, so a plain sign bit would only record
+    which dimensions are nonzero.
+    
+    Args:
+        embeddings: Array of shape (n, dimension).
+        
+    Returns:
+        Array of shape (n, ceil(dimension / 64)) of uint64 words.
+    """
+    embeddings = np.atleast_2d(np.asarray(embeddings, dtype=np.float32))
+    bits = embeddings > embeddings.mean(axis=1, keepdims=True)
+    packed = np.packbits(bits, axis=1, bitorder="little")
+    padding = -packed.shape[1] % 8
+    if padding:
+        packed = np.pad(packed, ((0, 0), (0, padding)))
+    return np.ascontiguousarray(packed).view(np.uint64)
+
+class SketchIndex:
+    """Hamming-distance prefilter over bit sketches with exact cosine rerank."""
+    
+    def __init__(self, dimension: int, candidates: int = DEFAULT_CANDIDATES):
+        """Initialize an empty index.
+        
+        Args:
+            dimension: Embedding dimension.
+            candidates: Number of nearest sketches reranked per query.
+        """
+        self.dimension = dimension
+        self.candidates = candidates
+        self.ids: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._sketches = np.empty((0, -(-dimension // 64)), dtype=np.uint64)
+        self._vectors = np.empty((0, dimension), dtype=np.float32)
+        self._norms = np.empty(0, dtype=np.float32)
+        
+    def __len__(self) -> int:
+        """Return the number of stored vectors."""
+        return len(self.ids)
+        
+    @property
+    def sketch_bytes(self) -> int:
+        """Bytes of the sketch table scanned by every query."""
+        return self._sketches.nbytes
+        
+    def add(self, ids: List[str], embeddings: np.ndarray):
+        """Add or replace vectors.
+        
+        Args:
+            ids: Unique ID of each vector.
+            embeddings: Array of shape (len(ids), dimension).
+        """
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        sketches = sketch(embeddings)
+        norms = np.linalg.norm(embeddings, axis=1)
+        
+        # Overwrite vectors whose ID is already stored, append the rest
+        new_rows = []
+        for row, chunk_id in enumerate(ids):
+            position = self._positions.get(chunk_id)
+            if position is None:
+                new_rows.append(row)
+            else:
+                self._sketches[position] = sketches[row]
+                self._vectors[position] = embeddings[row]
+                self._norms[position] = norms[row]
+                
+        if new_rows:
+            for row in new_rows:
+                self._positions[ids[row]] = len(self.ids)
+                self.ids.append(ids[row])
+            self._sketches = np.concatenate([self._sketches, sketches[new_rows]])
+            self._vectors = np.concatenate([self._vectors, embeddings[new_rows]])
+            self._norms = np.concatenate([self._norms, norms[new_rows]])
+            
+    def remove(self, ids: List[str]):
+        """Remove vectors by ID; unknown IDs are ignored.
+        
+        Args:
+            ids: IDs of the vectors to remove.
+        """
+        drop = {self._positions[chunk_id] for chunk_id in ids if chunk_id in self._positions}
+        if not drop:
+            return
+        keep = np.array([i for i in range(len(self.ids)) if i not in drop], dtype=np.int64)
+        self.ids = [self.ids[i] for i in keep]
+        self._positions = {chunk_id: i for i, chunk_id in enumerate(self.ids)}
+        self._sketches = self._sketches[keep]
+        self._vectors = self._vectors[keep]
+        self._norms = self._norms[keep]
+        
+    def search(self, query: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        """Find the stored vectors most similar to a query.
+        
+        Args:
+            query: Query embedding of shape (dimension,).
+            k: Number of results to return.
+            
+        Returns:
+            List of (id, cosine similarity) pairs, best first.
+        """
+        if not self.ids or k <= 0:
+            return []
+            
+        query = np.asarray(query, dtype=np.float32).ravel()
+        distances = _popcount(self._sketches ^ sketch(query)).sum(axis=1, dtype=np.int32)
+        
+        # Shortlist the nearest sketches, then rerank them exactly
+        n_candidates = min(max(self.candidates, k), len(self.ids))
+        if n_candidates < len(self.ids):
+            shortlist = np.argpartition(distances, n_candidates - 1)[:n_candidates]
+        else:
+            shortlist = np.arange(len(self.ids))
+            
+        query_norm = float(np.linalg.norm(query)) or 1.0
+        norms = self._norms[shortlist]
+        scores = (self._vectors[shortlist] @ query) / (np.where(norms > 0, norms, 1.0) * query_norm)
+        
+        k = min(k, len(shortlist))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self.ids[shortlist[i]], float(scores[i])) for i in top]
+        
+    def save(self, path: Path):
+        """Write the index to an ``.npz`` file.
+        
+        Args:
+            path: Destination file, replaced atomically.
+        """
+        path = Path(path)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as file:
+            np.savez(
+                file,
+                candidates=np.array(self.candidates),
+                ids=np.array(self.ids, dtype=str),
+                sketches=self._sketches,
+                vectors=self._vectors,
+                norms=self._norms,
+            )
+        os.replace(tmp_path, path)
+        
+    @classmethod
+    def load(cls, path: Path, dimension: Optional[int] = None) -> "SketchIndex":
+        """Read an index written by ``save``.
+        
+        Args:
+            path: Source file.
+            dimension: Expected embedding dimension, checked if given.
+            
+        Returns:
+            SketchIndex: The loaded index.
+        """
+        with np.load(Path(path)) as data:
+            vectors = data["vectors"]
+            if dimension is not None and vectors.shape[1] != dimension:
+                raise ValueError(
+                    f"Sketch index {path} has dimension {vectors.shape[1]}, expected {dimension}"
+                )
+            index = cls(vectors.shape[1], int(data["candidates"]))
+            index.ids = data["ids"].tolist()
+            index._positions = {chunk_id: i for i, chunk_id in enumerate(index.ids)}
+            index._sketches = data["sketches"]
+            index._vectors = vectors
+            index._norms = data["norms"]
+        return index
\ No newline at end of file
@@ -0,0 +1,249 @@
+"""
+Text cache module for pdf2vector.
+
+This module provides a persistent cache of the text extracted from PDFs,
+stored compressed in SQLite one page per row and keyed by the content of the
+file, so a PDF is only run through pdfminer once per extractor version.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import zlib
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bytes read at a time when hashing a file
+_READ_BLOCK = 1 << 20
+
+# Pages fetched per query when reading a cached file
+_READ_PAGES = 64
+
+class TextCache:
+    """Stores the page texts of PDFs on disk keyed by file digest and extractor."""
+    
+    def __init__(self, path: Path, max_bytes: int = 512 * 2**20):
+        """Initialize the cache.
+        
+        Args:
+            path: Path of the SQLite database file.
+            max_bytes: Maximum total size of the compressed texts kept before
+                the least recently used ones are evicted.
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        
+        # Create parent directory if it doesn't exist
+        if not self.path.parent.exists():
+            self.path.parent.mkdir(parents=True)
+            
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        # Files are listed once fully extracted; their pages are stored one row each
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            " digest TEXT NOT NULL,"
+            " extractor TEXT NOT NULL,"
+            " pages INTEGER NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_used INTEGER NOT NULL,"
+            " PRIMARY KEY (digest, extractor))"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS files_last_used ON files (last_used)"
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            " digest TEXT NOT NULL,"
+            " extractor TEXT NOT NULL,"
+            " page INTEGER NOT NULL,"
+            " text BLOB NOT NULL,"
+            " PRIMARY KEY (digest, extractor, page))"
+        )
+        # Drop the pages of extractions that never finished
+        self._connection.execute(
+            "DELETE FROM pages WHERE NOT EXISTS (SELECT 1 FROM files"
+            " WHERE files.digest = pages.digest AND files.extractor = pages.extractor)"
+        )
+        self._connection.commit()
+        
+        # Logical clock for LRU ordering, continued from previous sessions
+        (self._clock,) = self._connection.execute(
+            "SELECT COALESCE(MAX(last_used), 0) FROM files"
+        ).fetchone()
+        
+        logger.info(f"Initialized text cache at {self.path}")
+        
+    @staticmethod
+    def digest(path: Path) -> str:
+        """Return the content address of a file.
+        
+        Args:
+            path: File to address.
+            
+        Returns:
+            str: Hex sha256 digest of the file content.
+        """
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(_READ_BLOCK), b""):
+                digest.update(block)
+        return digest.hexdigest()
+        
+    def get(self, digest: str, extractor: str) -> Optional[Iterator[str]]:
+        """Look up the page texts of a file.
+        
+        Pages are read from the database ``_READ_PAGES`` at a time as the
+        returned iterator is consumed, so a cached document is never held in
+        memory as a whole.
+        
+        Args:
+            digest: File digest.
+            extractor: Version of the extraction that produced the text.
+            
+        Returns:
+            Iterator over the text of each page, or None if the file is not
+            cached.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT pages FROM files WHERE digest = ? AND extractor = ?",
+                (digest, extractor)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+                
+            self._connection.execute(
+                "UPDATE files SET last_used = ? WHERE digest = ? AND extractor = ?",
+                (self._tick(), digest, extractor)
+            )
+            self._connection.commit()
+            self.hits += 1
+            
+        return self._read_pages(digest, extractor, row[0])
+        
+    def _read_pages(self, digest: str, extractor: str, n_pages: int) -> Iterator[str]:
+        """Yield the cached pages of a file, a block of pages per query."""
+        for start in range(0, n_pages, _READ_PAGES):
+            with self._lock:
+                rows = self._connection.execute(
+                    "SELECT text FROM pages WHERE digest = ? AND extractor = ? AND page >= ? AND page < ?"
+                    " ORDER BY page",
+                    (digest, extractor, start, start + _READ_PAGES)
+                ).fetchall()
+            if len(rows) != min(_READ_PAGES, n_pages - start):
+                raise LookupError(f"Cached text of {digest} was evicted while being read")
+            for (blob,) in rows:
+                yield zlib.decompress(blob).decode()
+                
+    def put_page(self, digest: str, extractor: str, page: int, text: str):
+        """Store the text of one page of a file being extracted.
+        
+        The file is only returned by ``get`` once ``finish`` records it.
+        
+        Args:
+            digest: File digest.
+            extractor: Version of the extraction that produced the text.
+            page: Zero-based page number.
+            text: Text of the page.
+        """
+        blob = zlib.compress(text.encode())
+        
+        with self._lock:
+            if page == 0:
+                # A new extraction of the file replaces any earlier one
+                self._connection.execute(
+                    "DELETE FROM files WHERE digest = ? AND extractor = ?", (digest, extractor)
+                )
+                self._connection.execute(
+                    "DELETE FROM pages WHERE digest = ? AND extractor = ?", (digest, extractor)
+                )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO pages (digest, extractor, page, text) VALUES (?, ?, ?, ?)",
+                (digest, extractor, page, blob)
+            )
+            
+    def finish(self, digest: str, extractor: str, n_pages: int):
+        """Record a file whose pages were all stored and evict the least recently used files.
+        
+        Args:
+            digest: File digest.
+            extractor: Version of the extraction that produced the text.
+            n_pages: Number of pages stored with ``put_page``.
+        """
+        with self._lock:
+            (size,) = self._connection.execute(
+                "SELECT COALESCE(SUM(LENGTH(text)), 0) FROM pages WHERE digest = ? AND extractor = ?",
+                (digest, extractor)
+            ).fetchone()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO files (digest, extractor, pages, size, last_used)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (digest, extractor, n_pages, size, self._tick())
+            )
+            self._evict()
+            self._connection.commit()
+            
+    def put(self, digest: str, extractor: str, pages: Iterable[str]):
+        """Store the page texts of a file and evict the least recently used entries.
+        
+        Args:
+            digest: File digest.
+            extractor: Version of the extraction that produced the text.
+            pages: Text of each page.
+        """
+        n_pages = 0
+        for n_pages, text in enumerate(pages, 1):
+            self.put_page(digest, extractor, n_pages - 1, text)
+        self.finish(digest, extractor, n_pages)
+        
+    def _tick(self) -> int:
+        """Advance and return the logical LRU clock."""
+        self._clock += 1
+        return self._clock
+        
+    def _evict(self):
+        """Delete the least recently used entries while above ``max_bytes``."""
+        (total,) = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM files").fetchone()
+        if total <= self.max_bytes:
+            return
+            
+        evicted = 0
+        rows = self._connection.execute(
+            "SELECT digest, extractor, size FROM files ORDER BY last_used"
+        ).fetchall()
+        for digest, extractor, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._connection.execute(
+                "DELETE FROM files WHERE digest = ? AND extractor = ?", (digest, extractor)
+            )
+            self._connection.execute(
+                "DELETE FROM pages WHERE digest = ? AND extractor = ?", (digest, extractor)
+            )
+            total -= size
+            evicted += 1
+        logger.debug(f"Evicted {evicted} texts from cache")
+        
+    @property
+    def size_bytes(self) -> int:
+        """Total size of the compressed texts in the cache."""
+        with self._lock:
+            (total,) = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM files").fetchone()
+        return total
+        
+    def __len__(self) -> int:
+        """Return the number of cached files."""
+        with self._lock:
+            (count,) = self._connection.execute("SELECT COUNT(*) FROM files").fetchone()
+        return count
+        
+    def close(self):
+        """Close the database connection."""
+        self._connection.close()
\ No newline at end of file
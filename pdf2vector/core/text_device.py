@@ -0,0 +1,101 @@
+"""
+Raw text device module for pdf2vector.
+
+This module provides a pdfminer device that writes the text of each string
+drawn on a page straight to a stream. Unlike ``TextConverter`` it builds no
+layout objects and runs no layout analysis: line and word breaks are
+inferred from where consecutive strings are drawn.
+"""
+
+import logging
+from typing import Optional, TextIO
+
+from pdfminer import utils
+from pdfminer.pdfdevice import PDFTextDevice
+from pdfminer.pdffont import PDFUnicodeNotDefined
+
+logger = logging.getLogger(__name__)
+
+# Horizontal gap, in font sizes, between strings that is read as a space
+WORD_GAP = 0.2
+
+# Vertical move, in font sizes, read as a new paragraph rather than a new line
+PARAGRAPH_GAP = 1.8
+
+class RawTextDevice(PDFTextDevice):
+    """Writes page text in content stream order without layout analysis."""
+    
+    def __init__(self, rsrcmgr, outfp: TextIO):
+        """Initialize the device.
+        
+        Args:
+            rsrcmgr: pdfminer resource manager.
+            outfp: Stream receiving the text.
+        """
+        super().__init__(rsrcmgr)
+        self.outfp = outfp
+        self._end: Optional[tuple] = None  # Device space (x, y) after the last string
+        self._size = 0.0  # Font size of the last string, in device space
+        self._at_space = True
+        
+    def begin_page(self, page, ctm):
+        """Start a page with no text written yet."""
+        super().begin_page(page, ctm)
+        self._end = None
+        self._at_space = True
+        
+    def end_page(self, page):
+        """End the page like ``TextConverter`` does, with a form feed."""
+        self.outfp.write("\n\n\f")
+        
+    def _write(self, text: str):
+        """Write text and remember whether it ended with whitespace."""
+        if text:
+            self.outfp.write(text)
+            self._at_space = text[-1].isspace()
+            
+    def render_string(self, textstate, seq, ncs, graphicstate):
+        """Write the text of a string and advance the text position."""
+        matrix = utils.mult_matrix(textstate.matrix, self.ctm)
+        font = textstate.font
+        fontsize = textstate.fontsize
+        scaling = textstate.scaling * 0.01
+        charspace = textstate.charspace * scaling
+        wordspace = 0 if font.is_multibyte() else textstate.wordspace * scaling
+        dxscale = 0.001 * fontsize * scaling
+        size = fontsize * max(abs(matrix[0]), abs(matrix[3])) or 1.0
+        
+        # Separate this string from the previous one by where it starts
+        start = utils.apply_matrix_pt(matrix, textstate.linematrix)
+        if self._end is not None:
+            dx = start[0] - self._end[0]
+            dy = abs(start[1] - self._end[1])
+            if dy > PARAGRAPH_GAP * max(size, self._size):
+                self._write("\n\n")
+            elif dy > 0.5 * max(size, self._size):
+                self._write("\n")
+            elif abs(dx) > WORD_GAP * size and not self._at_space:
+                self._write(" ")
+                
+        (x, y) = textstate.linematrix
+        parts = []
+        for obj in seq:
+            if isinstance(obj, (int, float)):
+                # A large negative adjustment in a TJ array is a word gap
+                if -obj * 0.001 > WORD_GAP and parts and not parts[-1].endswith(" "):
+                    parts.append(" ")
+                x -= obj * dxscale
+            elif isinstance(obj, bytes):
+                for cid in font.decode(obj):
+                    try:
+                        parts.append(font.to_unichr(cid))
+                    except PDFUnicodeNotDefined:
+                        pass
+                    x += font.char_width(cid) * fontsize * scaling + charspace
+                    if cid == 32:
+                        x += wordspace
+                        
+        self._write("".join(parts))
+        textstate.linematrix = (x, y)
+        self._end = utils.apply_matrix_pt(matrix, (x, y))
+        self._size = size
\ No newline at end of file
@@ -7,29 +7,82 @@ using ChromaDB.
 
 import logging
 import hashlib
+from collections import deque
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import AbstractSet, Deque, Iterable, Iterator, List, Dict, Any, Optional, Set, Tuple, Union
 
 import chromadb
+import numpy as np
 from chromadb.config import Settings
 
 from .chunking import Chunk
+from .dedup import DEDUP_MODES, DEFAULT_THRESHOLD, MinHashIndex, minhash
 from .embeddings import EmbeddingGenerator
+from .quantization import QuantizedIndex
+from .reduction import DimensionReducer
+from .sketch_index import SketchIndex
 
 logger = logging.getLogger(__name__)
 
 class ChromaDBStore:
     """Manages vector storage and retrieval using ChromaDB."""
     
-    def __init__(self, persist_dir: Path, embedding_generator: EmbeddingGenerator):
+    def __init__(
+        self,
+        persist_dir: Path,
+        embedding_generator: EmbeddingGenerator,
+        batch_size: int = 512,
+        quantization: Optional[str] = None,
+        reduce_dim: Optional[int] = None,
+        reduction: str = "pca",
+        sketch: bool = False,
+        dedup: Optional[str] = None,
+        dedup_threshold: float = DEFAULT_THRESHOLD
+    ):
         """Initialize the vector store.
         
         Args:
             persist_dir: Directory to persist the ChromaDB database.
             embedding_generator: Generator for creating embeddings.
+            batch_size: Number of chunks embedded and written per batch.
+            quantization: If ``"int8"`` or ``"float16"``, queries are answered
+                from a quantized index kept next to the database instead of
+                ChromaDB's full-precision index.
+            reduce_dim: If set, chunk and query embeddings are reduced to this
+                dimension before they are stored or searched. The reducer is
+                saved next to the database. PCA is fitted with
+                ``fit_reducer`` on a sample of the corpus, or else on the
+                first ``reduce_dim`` or more chunks of an upsert; a random
+                projection needs no sample.
+            reduction: Reduction method, ``"pca"`` or ``"random"``.
+            sketch: If True, queries shortlist candidates by Hamming distance
+                between packed 1-bit sketches and rerank them exactly. Cannot
+                be combined with quantization.
+            dedup: If ``"skip"`` or ``"reference"``, chunks whose MinHash
+                similarity to a stored chunk reaches ``dedup_threshold`` are
+                not embedded. ``"skip"`` drops their text and only records
+                their IDs, so syncing a document again does not store them;
+                ``"reference"`` records them in the dedup index as references
+                to the stored chunk, which queries report alongside it.
+            dedup_threshold: Estimated Jaccard similarity of word shingles
+                from which a chunk is a near-duplicate.
         """
+        if sketch and quantization is not None:
+            raise ValueError("Sketch search cannot be combined with quantization")
+        if dedup is not None and dedup not in DEDUP_MODES:
+            raise ValueError(f"Unsupported dedup mode: {dedup}")
+            
         self.persist_dir = Path(persist_dir)
         self.embedding_generator = embedding_generator
+        self.batch_size = batch_size
+        self.quantization = quantization
+        self.sketch = sketch
+        self.dedup = dedup
+        
+        # Index files are written when the outermost deferred_saves block exits
+        self._save_depth = 0
+        self._unsaved: Set[str] = set()
         
         # Create persist directory if it doesn't exist
         if not self.persist_dir.exists():
@@ -50,8 +103,172 @@ class ChromaDBStore:
             metadata={"hnsw:space": "cosine"}
         )
         
+        # Load or create the dimensionality reducer
+        self.reducer: Optional[DimensionReducer] = None
+        if reduce_dim is not None:
+            if self._reducer_path.exists():
+                self.reducer = DimensionReducer.load(self._reducer_path)
+                if self.reducer.target_dimension != reduce_dim:
+                    raise ValueError(
+                        f"Store at {self.persist_dir} was reduced to "
+                        f"{self.reducer.target_dimension} dimensions, not {reduce_dim}"
+                    )
+            else:
+                self.reducer = DimensionReducer(reduce_dim, reduction)
+                
+        # Load or create the index that answers queries instead of ChromaDB
+        self.search_index: Optional[Union[QuantizedIndex, SketchIndex]] = None
+        index_path = self._search_index_path
+        if quantization is not None:
+            if index_path.exists():
+                self.search_index = QuantizedIndex.load(index_path, self.dimension)
+            else:
+                self.search_index = QuantizedIndex(quantization, self.dimension)
+        elif sketch:
+            if index_path.exists():
+                self.search_index = SketchIndex.load(index_path, self.dimension)
+            else:
+                self.search_index = SketchIndex(self.dimension)
+        if self.search_index is not None and len(self.search_index) != self.collection.count():
+            # The index file is missing or out of step with the collection
+            self._rebuild_search_index()
+            
+        # Load or create the signature index of stored chunks for dedup
+        self.dedup_index: Optional[MinHashIndex] = None
+        if dedup is not None:
+            if self._dedup_index_path.exists():
+                self.dedup_index = MinHashIndex.load(self._dedup_index_path, dedup_threshold)
+            else:
+                self.dedup_index = MinHashIndex(dedup_threshold)
+                
         logger.info(f"Initialized ChromaDB store at {self.persist_dir}")
         
+    @property
+    def dimension(self) -> int:
+        """Dimension of the stored embeddings, after any reduction."""
+        if self.reducer is not None:
+            return self.reducer.target_dimension
+        return self.embedding_generator.dimension
+        
+    @property
+    def _search_index_path(self) -> Path:
+        """Path of the quantized or sketch index file."""
+        if self.sketch:
+            return self.persist_dir / "sketch_index.npz"
+        return self.persist_dir / f"quantized_{self.quantization}.npz"
+        
+    def _rebuild_search_index(self):
+        """Refill the search index from the embeddings stored in ChromaDB."""
+        logger.warning(f"Rebuilding search index {self._search_index_path.name} from the collection")
+        self.search_index.remove(list(self.search_index.ids))
+        offset = 0
+        while True:
+            records = self.collection.get(include=["embeddings"], limit=self.batch_size, offset=offset)
+            if not records["ids"]:
+                break
+            self.search_index.add(records["ids"], np.asarray(records["embeddings"], dtype=np.float32))
+            offset += len(records["ids"])
+        self.search_index.save(self._search_index_path)
+        
+    @contextmanager
+    def deferred_saves(self) -> Iterator[None]:
+        """Write changed search and dedup index files once, at the end of a block.
+        
+        Both indexes are rewritten whole when saved, so operations made of
+        several upserts and deletes, such as ``sync_document``, save them
+        only when their outermost block exits, even if it raises.
+        """
+        self._save_depth += 1
+        try:
+            yield
+        finally:
+            self._save_depth -= 1
+            if not self._save_depth:
+                self._save_indexes()
+                
+    def _indexes_changed(self, search: bool = False, dedup: bool = False):
+        """Note changed indexes and save them unless saves are deferred."""
+        if search and self.search_index is not None:
+            self._unsaved.add("search")
+        if dedup and self.dedup_index is not None:
+            self._unsaved.add("dedup")
+        if not self._save_depth:
+            self._save_indexes()
+            
+    def _save_indexes(self):
+        """Write the index files changed since they were last saved."""
+        if "search" in self._unsaved:
+            self.search_index.save(self._search_index_path)
+        if "dedup" in self._unsaved:
+            self.dedup_index.save(self._dedup_index_path)
+        self._unsaved.clear()
+        
+    @property
+    def _dedup_index_path(self) -> Path:
+        """Path of the near-duplicate signature index file."""
+        return self.persist_dir / "dedup_index.npz"
+        
+    @property
+    def _reducer_path(self) -> Path:
+        """Path of the dimensionality reducer file."""
+        return self.persist_dir / "reducer.npz"
+        
+    @property
+    def _needs_sample(self) -> bool:
+        """Whether a PCA reducer still has to be fitted on a corpus sample."""
+        return self.reducer is not None and not self.reducer.fitted and self.reducer.method == "pca"
+        
+    def _fit_reducer(self, embeddings):
+        """Fit the reducer on a sample of embeddings and save it."""
+        if self._needs_sample and len(embeddings) < self.reducer.target_dimension:
+            raise ValueError(
+                f"PCA reduction to {self.reducer.target_dimension} dimensions needs a sample of "
+                f"at least {self.reducer.target_dimension} chunks, got {len(embeddings)}; "
+                f"call fit_reducer with a sample of the corpus first"
+            )
+        self.reducer.fit(embeddings)
+        self.reducer.save(self._reducer_path)
+        
+    def fit_reducer(self, texts: Iterable[str]):
+        """Fit the dimensionality reducer on a sample of the corpus.
+        
+        Args:
+            texts: Sample texts, at least ``reduce_dim`` of them for PCA.
+        """
+        if self.reducer is None:
+            raise ValueError("Store was created without reduce_dim")
+        if self.reducer.fitted:
+            raise ValueError(f"Reducer of {self.persist_dir} is already fitted; stored vectors depend on it")
+        self._fit_reducer(self.embedding_generator.embed_array(list(texts)))
+        
+    def _reduce(self, embeddings):
+        """Apply the reducer, drawing a random projection if needed."""
+        if self.reducer is None:
+            return embeddings
+        if not self.reducer.fitted:
+            self._fit_reducer(embeddings)
+        return self.reducer.transform(embeddings)
+        
+    def _write(self, ids: List[str], batch: Tuple[Chunk, ...], embeddings) -> int:
+        """Reduce and write a batch of embedded chunks.
+        
+        Returns:
+            int: Number of chunks written.
+        """
+        embeddings = self._reduce(embeddings)
+        
+        # Perform bulk upsert
+        self.collection.upsert(
+            ids=ids,
+            documents=[chunk.text for chunk in batch],
+            metadatas=[chunk.metadata for chunk in batch],
+            embeddings=embeddings
+        )
+        if self.search_index is not None:
+            self.search_index.add(ids, embeddings)
+        return len(batch)
+        
+        
     def _generate_id(self, chunk: Chunk) -> str:
         """Generate a unique ID for a chunk.
         
@@ -62,46 +279,231 @@ class ChromaDBStore:
             str: Unique ID for the chunk.
         """
         # Create a unique string from chunk content
-        content = f"{chunk.text}{chunk.metadata['filename']}{chunk.metadata['chunk_index']}"
+        if "occurrence" in chunk.metadata:
+            # Content-defined chunks keep their ID wherever their text moves
+            content = f"{chunk.text}{chunk.metadata['filename']}#{chunk.metadata['occurrence']}"
+        else:
+            content = f"{chunk.text}{chunk.metadata['filename']}{chunk.metadata['chunk_index']}"
+        if "page" in chunk.metadata:
+            # Page-aligned chunks number their chunks within each page
+            content += f"@{chunk.metadata['page']}"
         return hashlib.sha256(content.encode()).hexdigest()
         
-    def upsert(self, chunks: List[Chunk]):
+    def upsert(self, chunks: Iterable[Chunk], replacing: AbstractSet[str] = frozenset()) -> List[str]:
         """Store chunks in the vector store.
         
+        Chunks are consumed lazily and written one batch at a time, so a
+        generator of chunks is stored in constant memory. With dedup, near-
+        duplicates of stored chunks, or of earlier chunks of the same call,
+        are neither embedded nor written.
+        
         Args:
-            chunks: List of Chunk objects to store.
+            chunks: Iterable of Chunk objects to store.
+            replacing: IDs of stored chunks that the given chunks replace and
+                that are deleted afterwards. They are not matched as
+                near-duplicates, so an edited chunk is not skipped as a
+                repeat of its own previous version.
+                
+        Returns:
+            List[str]: IDs of the given chunks, in order, including those
+            skipped as near-duplicates.
         """
         try:
-            # Prepare data for bulk upsert
-            ids = []
-            texts = []
-            metadatas = []
-            embeddings = []
-            
-            for chunk in chunks:
-                # Generate embedding
-                embedding = self.embedding_generator.embed_text(chunk.text)
+            pending: Deque[Tuple[str, Chunk]] = deque()
+            stored_ids: List[str] = []
+            duplicates = 0
+            
+            def texts() -> Iterator[str]:
+                nonlocal duplicates
+                for chunk in chunks:
+                    chunk_id = self._generate_id(chunk)
+                    stored_ids.append(chunk_id)
+                    if self.dedup_index is not None and self._is_duplicate(chunk_id, chunk, replacing):
+                        duplicates += 1
+                        continue
+                    pending.append((chunk_id, chunk))
+                    yield chunk.text
+                    
+            stored = 0
+            held: List[Tuple[List[str], Tuple[Chunk, ...], Any]] = []
+            for _, embeddings in self.embedding_generator.embed_iter(texts(), self.batch_size):
+                ids, batch = zip(*[pending.popleft() for _ in range(len(embeddings))])
+                if self._needs_sample:
+                    # Hold batches back until they are enough to fit PCA on
+                    held.append((list(ids), batch, embeddings))
+                    if sum(len(item[2]) for item in held) < self.reducer.target_dimension:
+                        continue
+                    self._fit_reducer(np.concatenate([item[2] for item in held]))
+                    for item in held:
+                        stored += self._write(*item)
+                    held = []
+                    continue
+                stored += self._write(list(ids), batch, embeddings)
                 
-                # Prepare data
-                ids.append(self._generate_id(chunk))
-                texts.append(chunk.text)
-                metadatas.append(chunk.metadata)
-                embeddings.append(embedding)
+            if held:
+                # Too few chunks to fit PCA on; this raises rather than fit a degenerate basis
+                self._fit_reducer(np.concatenate([item[2] for item in held]))
                 
-            # Perform bulk upsert
-            self.collection.upsert(
-                ids=ids,
-                documents=texts,
-                metadatas=metadatas,
-                embeddings=embeddings
-            )
-            
-            logger.info(f"Successfully stored {len(chunks)} chunks")
+            self._indexes_changed(search=bool(stored), dedup=bool(stored_ids))
+                
+            if duplicates:
+                logger.info(f"Skipped {duplicates} near-duplicate chunks")
+            logger.info(f"Successfully stored {stored} chunks")
+            return stored_ids
             
         except Exception as e:
             logger.error(f"Error storing chunks: {str(e)}")
             raise
             
+    def _is_duplicate(self, chunk_id: str, chunk: Chunk, replacing: AbstractSet[str]) -> bool:
+        """Check a chunk against the dedup index before it is stored.
+        
+        A near-duplicate is recorded as a reference in ``"reference"`` mode;
+        any other chunk is added to the index as a canonical chunk.
+        
+        Args:
+            chunk_id: ID of the chunk.
+            chunk: Chunk about to be stored.
+            replacing: IDs of stored chunks not to match against.
+            
+        Returns:
+            bool: True if the chunk repeats a stored chunk and must be skipped.
+        """
+        signature = minhash(chunk.text)
+        if signature is None or chunk_id in self.dedup_index:
+            # Chunks without words, or stored ones written again, are kept
+            return False
+            
+        match = self.dedup_index.find(signature, exclude=replacing)
+        if match is not None:
+            text = chunk.text if self.dedup == "reference" else None
+            self.dedup_index.add_reference(chunk_id, match[0], text, chunk.metadata)
+            return True
+            
+        self.dedup_index.add(chunk_id, signature)
+        return False
+        
+    def _references(self, chunk_id: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Attach the metadata of near-duplicates referencing a query result."""
+        if self.dedup == "reference":
+            result['references'] = self.dedup_index.references_to(chunk_id)
+        return result
+        
+    def sync_document(self, filename: str, chunks: Iterable[Chunk]) -> List[str]:
+        """Make the stored chunks of a document match the given chunks.
+        
+        Chunks whose ID is already stored are not embedded again; only their
+        metadata is rewritten if it changed. Stored chunks of the document
+        that are not among the given chunks are deleted afterwards. With
+        content-defined chunks, an edited document therefore only embeds
+        the chunks around its edits.
+        
+        Args:
+            filename: Name of the source file.
+            chunks: Iterable of the document's Chunk objects.
+            
+        Returns:
+            List[str]: IDs of the given chunks, in order.
+        """
+        try:
+            with self.deferred_saves():
+                stored = self.collection.get(where={"filename": filename}, include=["metadatas"])
+                existing = dict(zip(stored["ids"], stored["metadatas"]))
+                references: Dict[str, Dict[str, Any]] = {}
+                if self.dedup_index is not None:
+                    references = self.dedup_index.document_references(filename)
+                    existing.update(references)
+                ids: List[str] = []
+                moved_ids: List[str] = []
+                moved_metadatas: List[Dict[str, Any]] = []
+                skipped: List[Tuple[str, Chunk]] = []
+                
+                def new_chunks() -> Iterator[Chunk]:
+                    for chunk in chunks:
+                        chunk_id = self._generate_id(chunk)
+                        ids.append(chunk_id)
+                        if chunk_id not in existing:
+                            yield chunk
+                        elif chunk_id in references:
+                            reference = self.dedup_index.references[chunk_id]
+                            reference["metadata"] = dict(chunk.metadata)
+                            if reference["text"] is None:
+                                skipped.append((chunk_id, chunk))
+                        elif existing[chunk_id] != chunk.metadata:
+                            moved_ids.append(chunk_id)
+                            moved_metadatas.append(chunk.metadata)
+                            
+                self.upsert(new_chunks(), replacing=existing.keys())
+                
+                # Refresh positions of kept chunks without embedding them again
+                for i in range(0, len(moved_ids), self.batch_size):
+                    self.collection.update(
+                        ids=moved_ids[i:i + self.batch_size],
+                        metadatas=moved_metadatas[i:i + self.batch_size]
+                    )
+                
+                current = set(ids)
+                self.delete([chunk_id for chunk_id in existing if chunk_id not in current])
+                
+                # Skipped chunks whose stored near-duplicate was just deleted take its place
+                restored = [chunk for chunk_id, chunk in skipped if chunk_id not in self.dedup_index.references]
+                if restored:
+                    self.upsert(restored)
+                self._indexes_changed(dedup=True)
+            
+            logger.info(f"Synced {len(ids)} chunks of {filename}, {len(existing)} were stored before")
+            return ids
+            
+        except Exception as e:
+            logger.error(f"Error syncing chunks of {filename}: {str(e)}")
+            raise
+            
+    def document_ids(self, filename: str) -> List[str]:
+        """Return the IDs of all stored chunks of a document.
+        
+        Args:
+            filename: Name of the source file.
+            
+        Returns:
+            List[str]: IDs of its chunks, including near-duplicates kept as
+            references.
+        """
+        ids = self.collection.get(where={"filename": filename}, include=[])["ids"]
+        if self.dedup_index is not None:
+            ids += list(self.dedup_index.document_references(filename))
+        return ids
+        
+    def delete(self, ids: List[str]):
+        """Remove chunks from the vector store; unknown IDs are ignored.
+        
+        Near-duplicates referencing a removed chunk are stored again in its
+        place, so the first of them is embedded and the rest reference it.
+        
+        Args:
+            ids: IDs of the chunks to remove.
+        """
+        if not ids:
+            return
+            
+        try:
+            with self.deferred_saves():
+                self.collection.delete(ids=list(ids))
+                if self.search_index is not None:
+                    self.search_index.remove(list(ids))
+                orphans = []
+                if self.dedup_index is not None:
+                    orphans = self.dedup_index.remove(list(ids))
+                self._indexes_changed(search=True, dedup=True)
+                if orphans:
+                    logger.info(f"Storing {len(orphans)} near-duplicates of deleted chunks")
+                    self.upsert(orphans)
+                    
+            logger.info(f"Deleted {len(ids)} chunks")
+            
+        except Exception as e:
+            logger.error(f"Error deleting chunks: {str(e)}")
+            raise
+            
     def query(self, question: str, k: int = 5) -> List[Dict[str, Any]]:
         """Query the vector store for similar chunks.
         
@@ -114,11 +516,20 @@ class ChromaDBStore:
         """
         try:
             # Generate embedding for question
-            question_embedding = self.embedding_generator.embed_text(question)
+            question_embedding = self.embedding_generator.embed_array([question])
             
+            if self.reducer is not None:
+                if not self.reducer.fitted:
+                    # Nothing has been stored yet
+                    return []
+                question_embedding = self.reducer.transform(question_embedding)
+                
+            if self.search_index is not None:
+                return self._query_search_index(question_embedding[0], k)
+                
             # Query collection
             results = self.collection.query(
-                query_embeddings=[question_embedding],
+                query_embeddings=question_embedding,
                 n_results=k
             )
             
@@ -129,10 +540,37 @@ class ChromaDBStore:
                     'text': results['documents'][0][i],
                     'metadata': results['metadatas'][0][i]
                 }
-                chunks.append(chunk)
+                chunks.append(self._references(results['ids'][0][i], chunk))
                 
             return chunks
             
         except Exception as e:
             logger.error(f"Error querying vector store: {str(e)}")
-            raise 
\ No newline at end of file
+            raise
+            
+    def _query_search_index(self, question_embedding, k: int) -> List[Dict[str, Any]]:
+        """Answer a query from the quantized or sketch index.
+        
+        Args:
+            question_embedding: Full-precision embedding of the question.
+            k: Number of results to return.
+            
+        Returns:
+            List of dictionaries containing text and metadata for matching chunks.
+        """
+        hits = self.search_index.search(question_embedding, k)
+        if not hits:
+            return []
+            
+        # Fetch documents and restore the ranking order
+        records = self.collection.get(
+            ids=[chunk_id for chunk_id, _ in hits],
+            include=["documents", "metadatas"]
+        )
+        found = {
+            chunk_id: {'text': text, 'metadata': metadata}
+            for chunk_id, text, metadata in zip(
+                records['ids'], records['documents'], records['metadatas']
+            )
+        }
+        return [self._references(chunk_id, found[chunk_id]) for chunk_id, _ in hits if chunk_id in found]
\ No newline at end of file
@@ -0,0 +1,150 @@
+"""
+Vocabulary table module for pdf2vector.
+
+This module provides a persistent table of hash embedding contributions for
+the words of a corpus. The table is memory-mapped and sorted by word, so new
+processes binary-search it instead of hashing words again or building a
+word index, and share its pages with each other. Words are stored back to
+back in one byte blob, so a single long word does not widen every row.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import List, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Format version of the files written by VocabularyTable.write
+VOCABULARY_FORMAT = 3
+
+# Number of leading word bytes kept in the fixed-width search keys
+KEY_PREFIX = 16
+
+class VocabularyTable:
+    """Memory-mapped table mapping words to their hash contributions.
+    
+    Rows are sorted by the UTF-8 bytes of their word. Word ``i`` is
+    ``blob[offsets[i]:offsets[i + 1]]`` and ``prefixes[i]`` holds its first
+    ``KEY_PREFIX`` bytes, which is what the binary search runs on. Row ``i``
+    holds the first dimension written by word ``i`` and its 8-bit value
+    codes: the word writes ``codes[i, j] / 255`` into dimension
+    ``(bases[i] + j) % dimension``.
+    """
+    
+    def __init__(self, path: Union[str, Path]):
+        """Open a table written by ``write``.
+        
+        Args:
+            path: Directory holding the table files.
+        """
+        self.path = Path(path)
+        meta = json.loads((self.path / "meta.json").read_text())
+        if meta.get("format") != VOCABULARY_FORMAT:
+            raise ValueError(f"Unsupported vocabulary table format in {self.path}")
+            
+        self.dimension: int = meta["dimension"]
+        self.bases = np.load(self.path / "bases.npy", mmap_mode="r")
+        self.codes = np.load(self.path / "codes.npy", mmap_mode="r")
+        self.prefixes = np.load(self.path / "prefixes.npy", mmap_mode="r")
+        self.offsets = np.load(self.path / "offsets.npy", mmap_mode="r")
+        self.blob = np.load(self.path / "blob.npy", mmap_mode="r")
+        
+        logger.info(f"Loaded vocabulary table of {len(self)} words from {self.path}")
+        
+    def __len__(self) -> int:
+        """Return the number of words in the table."""
+        return len(self.prefixes)
+        
+    def word(self, row: int) -> str:
+        """Return the word of a table row."""
+        return self._word_bytes(row).decode("utf-8")
+        
+    def _word_bytes(self, row: int) -> bytes:
+        """Return the UTF-8 bytes of the word of a table row."""
+        return self.blob[self.offsets[row]:self.offsets[row + 1]].tobytes()
+        
+    def __contains__(self, word: str) -> bool:
+        """Return whether a word is in the table."""
+        return self.lookup([word])[0] >= 0
+        
+    def lookup(self, words: List[str]) -> np.ndarray:
+        """Return the table row of each word.
+        
+        Args:
+            words: Words to look up.
+            
+        Returns:
+            Array of row indices, with -1 for words not in the table.
+        """
+        rows = np.full(len(words), -1, dtype=np.int64)
+        if not words or not len(self):
+            return rows
+            
+        keys = [word.encode("utf-8") for word in words]
+        prefixes = np.array([key[:KEY_PREFIX] for key in keys], dtype=f"S{KEY_PREFIX}")
+        starts = np.searchsorted(self.prefixes, prefixes, side="left")
+        ends = np.searchsorted(self.prefixes, prefixes, side="right")
+        
+        # A word shorter than the prefix is the only row with its prefix
+        lengths = np.array([len(key) for key in keys])
+        short = (lengths < KEY_PREFIX) & (starts < ends)
+        rows[short] = starts[short]
+        
+        # Longer words are bisected by their full bytes among the rows sharing it
+        for i in np.flatnonzero((lengths >= KEY_PREFIX) & (starts < ends)):
+            low, high = int(starts[i]), int(ends[i])
+            while low < high:
+                middle = (low + high) // 2
+                if self._word_bytes(middle) < keys[i]:
+                    low = middle + 1
+                else:
+                    high = middle
+            if low < ends[i] and self._word_bytes(low) == keys[i]:
+                rows[i] = low
+        return rows
+        
+    @classmethod
+    def write(
+        cls,
+        path: Union[str, Path],
+        words: List[str],
+        bases: np.ndarray,
+        codes: np.ndarray,
+        dimension: int
+    ) -> "VocabularyTable":
+        """Write a table and open it.
+        
+        Args:
+            path: Directory receiving the table files.
+            words: Distinct words, none containing NUL characters.
+            bases: First dimension written by each word.
+            codes: Array of shape (len(words), span) with the uint8 value codes.
+            dimension: Embedding dimension the contributions were computed for.
+            
+        Returns:
+            VocabularyTable: The written table.
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        
+        # Sorted fixed-width prefixes can be binary-searched straight from the map
+        encoded = [word.encode("utf-8") for word in words]
+        order = np.array(sorted(range(len(encoded)), key=encoded.__getitem__), dtype=np.int64)
+        ordered = [encoded[i] for i in order]
+        offsets = np.zeros(len(ordered) + 1, dtype=np.int64)
+        np.cumsum([len(word) for word in ordered], out=offsets[1:])
+        np.save(path / "prefixes.npy", np.array([word[:KEY_PREFIX] for word in ordered], dtype=f"S{KEY_PREFIX}"))
+        np.save(path / "offsets.npy", offsets)
+        np.save(path / "blob.npy", np.frombuffer(b"".join(ordered), dtype=np.uint8))
+        np.save(path / "bases.npy", np.asarray(bases, dtype=np.int32)[order])
+        np.save(path / "codes.npy", np.asarray(codes, dtype=np.uint8)[order])
+        (path / "meta.json").write_text(json.dumps({
+            "format": VOCABULARY_FORMAT,
+            "dimension": dimension,
+        }))
+        
+        logger.info(f"Wrote vocabulary table of {len(words)} words to {path}")
+        return cls(path)
\ No newline at end of file
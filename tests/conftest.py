@@ -0,0 +1,39 @@
+"""Shared fixtures for the vector store, search index and reduction tests."""
+
+import pytest
+
+from pdf2vector.core.chunking import Chunk
+from pdf2vector.core.embeddings import EmbeddingGenerator
+from pdf2vector.core.vector_store import ChromaDBStore
+
+TEXTS = [
+    "Vector databases store embeddings for similarity search",
+    "Bread dough needs flour water salt and yeast",
+    "Mountains are formed by tectonic plate collisions",
+    "Rivers carve valleys through soft rock over time",
+    "Neural networks learn weights by gradient descent",
+    "Sourdough bread rises slowly with wild yeast",
+]
+
+@pytest.fixture
+def texts():
+    """Return sample texts on distinct topics."""
+    return list(TEXTS)
+
+@pytest.fixture
+def embeddings(texts):
+    """Embed the sample texts with the hash model."""
+    return EmbeddingGenerator().embed_array(texts)
+
+@pytest.fixture
+def chunks(texts):
+    """Wrap the sample texts in chunks of one document."""
+    return [
+        Chunk(text=text, metadata={"filename": "test.pdf", "chunk_index": i})
+        for i, text in enumerate(texts)
+    ]
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a ChromaDBStore backed by a temporary directory."""
+    return ChromaDBStore(persist_dir=tmp_path / "chroma", embedding_generator=EmbeddingGenerator())
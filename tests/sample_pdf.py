@@ -0,0 +1,57 @@
+"""
+Minimal PDF writer for tests and benchmarks.
+
+Writes text-only PDFs with one Helvetica text block per page, so chunking
+can be measured on documents of any page count without extra dependencies.
+"""
+
+from pathlib import Path
+from typing import Iterable, List
+
+def _escape(line: str) -> str:
+    """Escape a line for a PDF string literal."""
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+def write_pdf(path: Path, pages: Iterable[List[str]]):
+    """Write a PDF with one page per list of text lines.
+    
+    Args:
+        path: Destination file.
+        pages: Lines of text of each page.
+    """
+    pages = list(pages)
+    n_pages = len(pages)
+    # Objects: 1 catalog, 2 page tree, 3 font, then a page and its content per page
+    page_ids = [4 + 2 * i for i in range(n_pages)]
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        2: (
+            "<< /Type /Pages /Kids [" + " ".join(f"{i} 0 R" for i in page_ids)
+            + f"] /Count {n_pages} >>"
+        ).encode(),
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    for page_id, lines in zip(page_ids, pages):
+        text = " T* ".join(f"({_escape(line)}) Tj" for line in lines)
+        stream = f"BT /F1 11 Tf 14 TL 72 760 Td {text} ET".encode("latin-1")
+        objects[page_id] = (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {page_id + 1} 0 R >>"
+        ).encode()
+        objects[page_id + 1] = (
+            f"<< /Length {len(stream)} >>\nstream\n".encode() + stream + b"\nendstream"
+        )
+        
+    with open(path, "wb") as f:
+        f.write(b"%PDF-1.4\n")
+        offsets = {}
+        for object_id in sorted(objects):
+            offsets[object_id] = f.tell()
+            f.write(f"{object_id} 0 obj\n".encode() + objects[object_id] + b"\nendobj\n")
+        xref = f.tell()
+        f.write(f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode())
+        for object_id in sorted(objects):
+            f.write(f"{offsets[object_id]:010d} 00000 n \n".encode())
+        f.write(
+            f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+        )
\ No newline at end of file
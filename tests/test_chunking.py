@@ -136,4 +136,21 @@ def test_chunk_text_small(chunker):
     
     assert len(chunks) == 1
     assert chunks[0].text == text
-    assert chunks[0].metadata["filename"] == "test.md" 
\ No newline at end of file
+    assert chunks[0].metadata["filename"] == "test.md" 
+
+def test_clean_text_keeps_link_text(chunker):
+    """Test that links keep their text and unclosed code fences are dropped."""
+    text = "See [the manual](https://example.com/manual) for details.\n\n```\nunclosed code"
+    
+    assert chunker.clean_text(text) == "See the manual for details."
+
+def test_chunk_text_long_section(chunker):
+    """Test that long sections are split within max_chunk_size."""
+    text = "# Heading 1\n\n" + "word " * 100 + "\n\n" + "other " * 30
+    
+    chunks = chunker.chunk_text(text, {"filename": "test.md"})
+    
+    assert len(chunks) > 1
+    assert chunks[0].text.startswith("# Heading 1\n\nword")
+    assert all(chunk.metadata["chunk_size"] <= 200 for chunk in chunks)
+    assert [chunk.metadata["chunk_index"] for chunk in chunks] == list(range(len(chunks)))
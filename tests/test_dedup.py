@@ -0,0 +1,152 @@
+"""Tests for the near-duplicate detection module."""
+
+import pytest
+from unittest.mock import patch
+
+from pdf2vector.core.chunking import Chunk
+from pdf2vector.core.dedup import MinHashIndex, minhash
+from pdf2vector.core.embeddings import EmbeddingGenerator
+from pdf2vector.core.vector_store import ChromaDBStore
+
+DISCLAIMER = (
+    "This message and any attachments are confidential and intended solely for the addressee. "
+    "If you have received it in error, please notify the sender and delete it from your system. "
+    "Any unauthorised use, disclosure or copying of this message is strictly prohibited."
+)
+REVISED = DISCLAIMER.replace("strictly prohibited", "prohibited")
+UNRELATED = "Mountains are formed by tectonic plate collisions over millions of years of slow uplift."
+
+def make_chunk(text, filename, index):
+    """Create a chunk of a document."""
+    return Chunk(text=text, metadata={"filename": filename, "chunk_index": index})
+
+def make_store(path, dedup):
+    """Create a ChromaDBStore with dedup enabled."""
+    return ChromaDBStore(persist_dir=path, embedding_generator=EmbeddingGenerator(), dedup=dedup)
+
+def test_minhash_estimates_similarity():
+    """Test that signatures agree in proportion to shingle overlap."""
+    signature = minhash(DISCLAIMER)
+    
+    assert signature.shape == (128,)
+    assert (minhash(DISCLAIMER.upper().replace(" ", "  ")) == signature).all()
+    assert (minhash(REVISED) == signature).mean() > 0.8
+    assert (minhash(UNRELATED) == signature).mean() < 0.1
+    assert minhash(" \n\f ") is None
+
+def test_index_finds_near_duplicates_and_round_trips(tmp_path):
+    """Test lookup, removal and persistence of the index."""
+    index = MinHashIndex(threshold=0.8)
+    index.add("a", minhash(DISCLAIMER))
+    index.add("b", minhash(UNRELATED))
+    index.add_reference("c", "a", REVISED, {"filename": "other.pdf", "chunk_index": 3})
+    index.save(tmp_path / "dedup_index.npz")
+    
+    loaded = MinHashIndex.load(tmp_path / "dedup_index.npz")
+    
+    assert loaded.find(minhash(REVISED))[0] == "a"
+    assert loaded.find(minhash(DISCLAIMER), exclude={"a"}) is None
+    assert loaded.references_to("a") == [{"filename": "other.pdf", "chunk_index": 3}]
+    assert list(loaded.document_references("other.pdf")) == ["c"]
+    
+    # Removing the canonical chunk hands back its references
+    orphans = loaded.remove(["a"])
+    assert [chunk.text for chunk in orphans] == [REVISED]
+    assert len(loaded) == 1 and not loaded.references
+    assert loaded.find(minhash(REVISED)) is None
+
+def test_skip_mode_embeds_near_duplicates_once(tmp_path):
+    """Test that near-duplicates across documents and sessions are not stored."""
+    store = make_store(tmp_path / "chroma", "skip")
+    chunks = [make_chunk(DISCLAIMER, "a.pdf", 0), make_chunk(UNRELATED, "a.pdf", 1), make_chunk(REVISED, "b.pdf", 0)]
+    
+    with patch.object(store.collection, "upsert", wraps=store.collection.upsert) as mock_upsert:
+        ids = store.upsert(chunks)
+        
+    assert len(ids) == 3
+    assert mock_upsert.call_args.kwargs["documents"] == [DISCLAIMER, UNRELATED]
+    
+    # The signature index is persisted with the collection
+    reopened = make_store(tmp_path / "chroma", "skip")
+    reopened.upsert([make_chunk(REVISED, "c.pdf", 0)])
+    assert reopened.collection.count() == 2
+    assert [reference["text"] for reference in reopened.dedup_index.references.values()] == [None, None]
+
+def test_skip_mode_keeps_edits_of_a_synced_document(tmp_path):
+    """Test that an edited chunk is not skipped as a repeat of its old version."""
+    store = make_store(tmp_path / "chroma", "skip")
+    store.sync_document("a.pdf", [make_chunk(DISCLAIMER, "a.pdf", 0)])
+    
+    store.sync_document("a.pdf", [make_chunk(REVISED, "a.pdf", 0)])
+    
+    assert store.collection.get()["documents"] == [REVISED]
+    
+    # Near-duplicates in other documents are still skipped
+    store.sync_document("b.pdf", [make_chunk(DISCLAIMER, "b.pdf", 0)])
+    assert store.collection.count() == 1
+
+def test_skip_mode_resync_of_an_unchanged_document_stores_nothing(tmp_path):
+    """Test that chunks skipped on the first sync are not stored by the next one."""
+    store = make_store(tmp_path / "chroma", "skip")
+    chunks = [make_chunk(DISCLAIMER, "a.pdf", 0), make_chunk(UNRELATED, "a.pdf", 1), make_chunk(REVISED, "a.pdf", 2)]
+    store.sync_document("a.pdf", chunks)
+    
+    store.sync_document("a.pdf", chunks)
+    
+    assert store.collection.count() == 2
+    assert len(store.document_ids("a.pdf")) == 3
+    
+    # A skipped chunk is stored once the chunk it repeated is gone
+    store.sync_document("a.pdf", chunks[1:])
+    assert sorted(store.collection.get()["documents"]) == sorted([UNRELATED, REVISED])
+
+def test_reference_mode_reports_and_restores_duplicates(tmp_path):
+    """Test that references are returned with queries and survive deletion."""
+    store = make_store(tmp_path / "chroma", "reference")
+    _, duplicate = store.upsert([make_chunk(DISCLAIMER, "a.pdf", 0), make_chunk(REVISED, "b.pdf", 4)])
+    
+    results = store.query("confidential message intended for the addressee", k=1)
+    
+    assert results[0]["metadata"]["filename"] == "a.pdf"
+    assert results[0]["references"] == [{"filename": "b.pdf", "chunk_index": 4}]
+    assert store.document_ids("b.pdf") == [duplicate]
+    
+    # Deleting the canonical chunk stores the duplicate in its place
+    store.delete(store.document_ids("a.pdf"))
+    records = store.collection.get()
+    assert records["ids"] == [duplicate]
+    assert records["documents"] == [REVISED]
+    assert store.query("confidential message", k=1)[0]["references"] == []
+
+def test_sync_saves_each_index_once(tmp_path):
+    """Test that a sync rewriting, deleting and restoring chunks writes each index file once."""
+    store = ChromaDBStore(
+        persist_dir=tmp_path / "chroma",
+        embedding_generator=EmbeddingGenerator(),
+        quantization="int8",
+        dedup="reference"
+    )
+    store.sync_document("a.pdf", [make_chunk(DISCLAIMER, "a.pdf", 0), make_chunk(REVISED, "a.pdf", 1)])
+    
+    with patch.object(store.search_index, "save", wraps=store.search_index.save) as search_save, \
+            patch.object(store.dedup_index, "save", wraps=store.dedup_index.save) as dedup_save:
+        store.sync_document("a.pdf", [make_chunk(UNRELATED, "a.pdf", 0), make_chunk(REVISED, "a.pdf", 1)])
+        
+    assert search_save.call_count == 1
+    assert dedup_save.call_count == 1
+    assert sorted(store.collection.get()["documents"]) == sorted([UNRELATED, REVISED])
+    
+    # The saved files match the store after the sync
+    reopened = ChromaDBStore(
+        persist_dir=tmp_path / "chroma",
+        embedding_generator=EmbeddingGenerator(),
+        quantization="int8",
+        dedup="reference"
+    )
+    assert len(reopened.search_index) == 2
+    assert len(reopened.dedup_index.references) == 0
+
+def test_unknown_dedup_mode_is_rejected(tmp_path):
+    """Test that an unsupported dedup mode raises ValueError."""
+    with pytest.raises(ValueError):
+        make_store(tmp_path / "chroma", "merge")
\ No newline at end of file
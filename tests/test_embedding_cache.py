@@ -0,0 +1,105 @@
+"""Tests for the embedding cache module."""
+
+import pytest
+from unittest.mock import patch
+import numpy as np
+
+from pdf2vector.core.backends import EmbeddingBackend, register_backend
+from pdf2vector.core.embedding_cache import EmbeddingCache
+from pdf2vector.core.embeddings import EmbeddingGenerator
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create an EmbeddingCache in a temporary directory."""
+    cache = EmbeddingCache(tmp_path / "cache" / "embeddings.sqlite", max_entries=3)
+    yield cache
+    cache.close()
+
+def test_put_and_get(cache):
+    """Test storing and retrieving embeddings."""
+    digests = [EmbeddingCache.digest("a"), EmbeddingCache.digest("b")]
+    vectors = np.array([[0.1, 0.2], [0.3, 0.4]])
+    
+    cache.put_many("model", 2, digests, vectors)
+    found = cache.get_many("model", 2, digests)
+    
+    assert np.array_equal(found[digests[0]], vectors[0])
+    assert np.array_equal(found[digests[1]], vectors[1])
+    assert cache.hits == 2
+
+def test_keyed_by_model_and_dimension(cache):
+    """Test that other models and dimensions do not share entries."""
+    digest = EmbeddingCache.digest("a")
+    cache.put_many("model", 2, [digest], np.array([[0.1, 0.2]]))
+    
+    assert cache.get_many("other-model", 2, [digest]) == {}
+    assert cache.get_many("model", 3, [digest]) == {}
+    assert cache.misses == 2
+
+def test_evicts_least_recently_used(cache):
+    """Test that the cache evicts the least recently used entries."""
+    digests = [EmbeddingCache.digest(text) for text in "abcd"]
+    vectors = np.eye(4)
+    
+    cache.put_many("model", 4, digests[:3], vectors[:3])
+    cache.get_many("model", 4, [digests[0]])
+    cache.put_many("model", 4, digests[3:], vectors[3:])
+    
+    assert len(cache) == 3
+    assert set(cache.get_many("model", 4, digests)) == {digests[0], digests[2], digests[3]}
+
+def test_persists_across_instances(tmp_path):
+    """Test that entries survive reopening the database."""
+    path = tmp_path / "embeddings.sqlite"
+    digest = EmbeddingCache.digest("a")
+    first = EmbeddingCache(path)
+    first.put_many("model", 2, [digest], np.array([[0.5, 0.5]]))
+    first.close()
+    
+    second = EmbeddingCache(path)
+    
+    assert np.array_equal(second.get_many("model", 2, [digest])[digest], [0.5, 0.5])
+    second.close()
+
+def test_generator_uses_cache(tmp_path):
+    """Test that the generator only computes texts missing from the cache."""
+    cache = EmbeddingCache(tmp_path / "embeddings.sqlite")
+    generator = EmbeddingGenerator(cache=cache)
+    texts = ["first text", "second text", "first text"]
+    expected = EmbeddingGenerator().embed_text(texts)
+    
+    first = generator.embed_text(texts)
+    with patch.object(generator, "_generate_batch_embeddings") as mock_generate:
+        second = generator.embed_text(texts)
+        
+    mock_generate.assert_not_called()
+    assert first == second == expected
+    assert len(cache) == 2
+    cache.close()
+
+def test_cache_is_keyed_by_backend_options(tmp_path):
+    """Test that vectors computed with other backend options are not reused."""
+    class ScaledBackend(EmbeddingBackend):
+        def __init__(self, location, scale=1.0, batch_size=8):
+            self.scale = scale
+            
+        @property
+        def dimension(self):
+            return 2
+            
+        def embed_many(self, texts):
+            return [[self.scale, 0.0] for _ in texts]
+            
+    register_backend("scaled", ScaledBackend)
+    cache = EmbeddingCache(tmp_path / "embeddings.sqlite")
+    
+    def embed(**options):
+        generator = EmbeddingGenerator(model_name="scaled:model", cache=cache, backend_options=options)
+        return generator.embed_text("text")
+        
+    assert embed() == [1.0, 0.0]
+    assert embed(scale=2.0) == [2.0, 0.0]
+    assert embed(scale=2.0, batch_size=4) == [2.0, 0.0]
+    assert embed(batch_size=4, scale=2.0) == [2.0, 0.0]
+    assert len(cache) == 3
+    cache.close()
@@ -1,7 +1,10 @@
 """Tests for the embeddings module."""
 
+import asyncio
+import hashlib
 import pytest
 from unittest.mock import Mock, patch
+import numpy as np
 import requests
 
 from pdf2vector.core.embeddings import EmbeddingGenerator, EmbeddingError
@@ -14,28 +17,30 @@ def mock_session():
         mock.return_value = session
         yield session
 
+REMOTE_MODEL = "text-embedding-3-small"
+
 @pytest.fixture
 def generator(mock_session):
     """Create an EmbeddingGenerator instance with a mock session."""
     with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
-        return EmbeddingGenerator()
+        return EmbeddingGenerator(model_name=REMOTE_MODEL)
 
 def test_init_with_env_var():
     """Test initialization with environment variable."""
     with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
-        generator = EmbeddingGenerator()
+        generator = EmbeddingGenerator(model_name=REMOTE_MODEL)
         assert generator.api_key == "test-key"
 
 def test_init_with_api_key():
     """Test initialization with API key."""
-    generator = EmbeddingGenerator(api_key="test-key")
+    generator = EmbeddingGenerator(model_name=REMOTE_MODEL, api_key="test-key")
     assert generator.api_key == "test-key"
 
 def test_init_without_api_key():
     """Test initialization without API key."""
     with patch.dict("os.environ", {}, clear=True):
         with pytest.raises(ValueError, match="OpenAI API key not found"):
-            EmbeddingGenerator()
+            EmbeddingGenerator(model_name=REMOTE_MODEL)
 
 def test_generate_embedding_success(generator, mock_session):
     """Test successful embedding generation."""
@@ -59,7 +64,8 @@ def test_generate_embedding_success(generator, mock_session):
         json={
             "model": "text-embedding-3-small",
             "input": "Test text"
-        }
+        },
+        timeout=30.0
     )
     
     # Check result
@@ -100,7 +106,8 @@ def test_generate_embeddings_success(generator, mock_session):
         json={
             "model": "text-embedding-3-small",
             "input": texts
-        }
+        },
+        timeout=30.0
     )
     
     # Check result
@@ -119,5 +126,228 @@ def test_generate_embeddings_error(generator, mock_session):
 
 def test_cleanup(generator, mock_session):
     """Test cleanup of resources."""
-    del generator
-    mock_session.close.assert_called_once() 
\ No newline at end of file
+    generator.close()
+    mock_session.close.assert_called_once()
+
+def _legacy_embedding(text, dimension=1536):
+    """Reference implementation of the original word-by-word hash embedding."""
+    embedding = np.zeros(dimension)
+    for word in text.split():
+        word_hash = int(hashlib.sha256(word.encode()).hexdigest(), 16)
+        for j in range(min(32, dimension)):
+            embedding[(word_hash + j) % dimension] = ((word_hash >> j) & 0xFF) / 255.0
+    norm = np.linalg.norm(embedding)
+    if norm > 0:
+        embedding = embedding / norm
+    return embedding.tolist()
+
+HASH_TEXTS = [
+    "The quick brown fox jumps over the lazy dog",
+    "repeated words repeated words repeated",
+    "a b c d e f g h i j k l m n o p q r s t u v w x y z " * 20,
+    "",
+    "single",
+]
+
+def test_hash_batch_matches_legacy_vectors():
+    """Test that the batch engine reproduces the original vectors bit for bit."""
+    hash_generator = EmbeddingGenerator()
+    
+    embeddings = hash_generator.embed_text(HASH_TEXTS)
+    
+    assert len(embeddings) == len(HASH_TEXTS)
+    for embedding, text in zip(embeddings, HASH_TEXTS):
+        assert embedding == _legacy_embedding(text)
+
+def test_hash_single_text_matches_legacy_vector():
+    """Test that a single string still returns one list of floats."""
+    hash_generator = EmbeddingGenerator()
+    
+    embedding = hash_generator.embed_text(HASH_TEXTS[0])
+    
+    assert isinstance(embedding, list)
+    assert embedding == _legacy_embedding(HASH_TEXTS[0])
+
+def test_embed_array_returns_float32_matrix():
+    """Test that embed_array returns a contiguous float32 batch."""
+    hash_generator = EmbeddingGenerator()
+    
+    embeddings = hash_generator.embed_array(HASH_TEXTS)
+    
+    assert isinstance(embeddings, np.ndarray)
+    assert embeddings.dtype == np.float32
+    assert embeddings.shape == (len(HASH_TEXTS), hash_generator.dimension)
+    assert embeddings.flags["C_CONTIGUOUS"]
+    expected = np.asarray(hash_generator.embed_text(HASH_TEXTS), dtype=np.float32)
+    assert np.array_equal(embeddings, expected)
+
+def test_embed_array_spans_multiple_blocks():
+    """Test that batches larger than one block are filled completely."""
+    hash_generator = EmbeddingGenerator()
+    texts = [f"text number {i}" for i in range(600)]
+    
+    embeddings = hash_generator.embed_array(texts)
+    
+    assert embeddings.shape == (600, hash_generator.dimension)
+    assert np.array_equal(embeddings[599], np.float32(_legacy_embedding(texts[599])))
+
+def test_word_cache_counts_hits_and_misses():
+    """Test that repeated words are served from the word cache."""
+    hash_generator = EmbeddingGenerator(word_cache_size=100)
+    
+    hash_generator.embed_text("alpha beta alpha")
+    hash_generator.embed_text("beta gamma")
+    
+    info = hash_generator.word_cache_info()
+    assert info["misses"] == 3
+    assert info["hits"] == 1
+    assert info["size"] == 3
+
+def test_word_cache_is_bounded():
+    """Test that the least recently used words are evicted."""
+    hash_generator = EmbeddingGenerator(word_cache_size=2)
+    
+    hash_generator.embed_text("one two three")
+    embedding = hash_generator.embed_text("one three")
+    
+    assert hash_generator.word_cache_info()["size"] == 2
+    assert hash_generator.word_cache_info()["hits"] == 1
+    assert embedding == _legacy_embedding("one three")
+
+@pytest.mark.parametrize("word_cache_size", [0, 3, 100_000])
+def test_word_cache_does_not_change_vectors(word_cache_size):
+    """Test that vectors are identical with and without the word cache."""
+    hash_generator = EmbeddingGenerator(word_cache_size=word_cache_size)
+    
+    first = hash_generator.embed_text(HASH_TEXTS)
+    second = hash_generator.embed_text(HASH_TEXTS)
+    
+    assert first == second == [_legacy_embedding(text) for text in HASH_TEXTS]
+
+def test_parallel_embedding_matches_in_process():
+    """Test that the process pool produces the same vectors."""
+    texts = [f"chunk {i} " + HASH_TEXTS[i % len(HASH_TEXTS)] for i in range(300)]
+    parallel_generator = EmbeddingGenerator(workers=2, parallel_threshold=100)
+    
+    try:
+        embeddings = parallel_generator.embed_array(texts)
+        lists = parallel_generator.embed_text(texts)
+    finally:
+        parallel_generator.close()
+        
+    assert np.array_equal(embeddings, EmbeddingGenerator().embed_array(texts))
+    assert lists == [_legacy_embedding(text) for text in texts]
+
+def test_parallel_embedding_skips_pool_for_small_batches():
+    """Test that small batches are embedded in process."""
+    parallel_generator = EmbeddingGenerator(workers=2, parallel_threshold=100)
+    
+    parallel_generator.embed_array(HASH_TEXTS)
+    
+    assert parallel_generator._pool is None
+
+def test_embed_iter_yields_batches_with_start_indices():
+    """Test that embed_iter streams fixed-size batches in order."""
+    hash_generator = EmbeddingGenerator()
+    texts = [f"streamed text {i}" for i in range(7)]
+    
+    batches = list(hash_generator.embed_iter(iter(texts), batch_size=3))
+    
+    assert [start for start, _ in batches] == [0, 3, 6]
+    assert [len(embeddings) for _, embeddings in batches] == [3, 3, 1]
+    assert np.array_equal(
+        np.concatenate([embeddings for _, embeddings in batches]),
+        hash_generator.embed_array(texts)
+    )
+
+def test_embed_iter_consumes_input_lazily():
+    """Test that embed_iter does not read ahead of the current batch."""
+    hash_generator = EmbeddingGenerator()
+    consumed = []
+    
+    def texts():
+        for i in range(10):
+            consumed.append(i)
+            yield f"text {i}"
+            
+    stream = hash_generator.embed_iter(texts(), batch_size=4)
+    next(stream)
+    
+    assert consumed == [0, 1, 2, 3]
+
+def test_aembed_hash_matches_embed_array():
+    """Test that the async API returns the same vectors for the hash model."""
+    hash_generator = EmbeddingGenerator()
+    
+    embeddings = asyncio.run(hash_generator.aembed(HASH_TEXTS))
+    
+    assert np.array_equal(embeddings, hash_generator.embed_array(HASH_TEXTS))
+
+def test_vocabulary_table_matches_legacy_vectors(tmp_path):
+    """Test that embedding through a vocabulary table keeps vectors unchanged."""
+    builder = EmbeddingGenerator()
+    table = builder.build_vocabulary(HASH_TEXTS[:3], tmp_path / "vocabulary")
+    
+    # A fresh generator reads the table and hashes only unknown words
+    reader = EmbeddingGenerator(vocabulary=tmp_path / "vocabulary")
+    vectors = reader.embed_text(HASH_TEXTS)
+    
+    assert vectors == [_legacy_embedding(text) for text in HASH_TEXTS]
+    assert len(reader.vocabulary) == len(table)
+    assert isinstance(reader.vocabulary.codes, np.memmap)
+    assert reader.word_cache_info()["misses"] < len(set(" ".join(HASH_TEXTS).split()))
+
+def test_vocabulary_table_without_word_cache(tmp_path):
+    """Test that unknown words are hashed when the word cache is disabled."""
+    EmbeddingGenerator().build_vocabulary(["alpha beta"], tmp_path / "vocabulary")
+    reader = EmbeddingGenerator(word_cache_size=0, vocabulary=tmp_path / "vocabulary")
+    
+    assert reader.embed_text("beta gamma alpha") == _legacy_embedding("beta gamma alpha")
+
+def test_vocabulary_table_lookup(tmp_path):
+    """Test that words are found in the sorted table by their bytes, not a prefix."""
+    table = EmbeddingGenerator().build_vocabulary(["zeta naïve alpha"], tmp_path / "vocabulary")
+    
+    rows = table.lookup(["naïve", "alphabet", "alpha", "zz", "", "zeta"])
+    
+    assert rows[[1, 3, 4]].tolist() == [-1, -1, -1]
+    assert sorted(rows[[0, 2, 5]].tolist()) == [0, 1, 2]
+    assert table.word(rows[0]) == "naïve"
+    assert "alpha" in table and "alp" not in table
+    assert isinstance(table.blob, np.memmap)
+
+def test_vocabulary_table_stores_long_words_without_padding(tmp_path):
+    """Test that one long word neither widens the table nor confuses shared prefixes."""
+    long_word = "x" * 10000
+    words = ["alpha", "beta", long_word, "internationalization", "internationalizations"]
+    table = EmbeddingGenerator().build_vocabulary([" ".join(words)], tmp_path / "vocabulary")
+    
+    rows = table.lookup(words + ["internationalizatio", "x" * 9999])
+    
+    assert [table.word(row) for row in rows[:5]] == words
+    assert rows[5:].tolist() == [-1, -1]
+    assert table.blob.nbytes == sum(len(word) for word in words)
+    assert table.prefixes.itemsize == 16
+
+def test_vocabulary_table_rejects_other_dimension(tmp_path):
+    """Test that a table built for another dimension is refused."""
+    builder = EmbeddingGenerator()
+    builder.dimension = 768
+    builder.clear_word_cache()
+    builder.build_vocabulary(HASH_TEXTS, tmp_path / "vocabulary")
+    
+    with pytest.raises(ValueError):
+        EmbeddingGenerator(vocabulary=tmp_path / "vocabulary")
+
+def test_parallel_workers_use_vocabulary_table(tmp_path):
+    """Test that pool workers open the table and produce the same vectors."""
+    texts = [f"chunk {i} " + HASH_TEXTS[i % len(HASH_TEXTS)] for i in range(300)]
+    parallel_generator = EmbeddingGenerator(workers=2, parallel_threshold=100)
+    parallel_generator.build_vocabulary(texts, tmp_path / "vocabulary")
+    
+    try:
+        embeddings = parallel_generator.embed_array(texts)
+    finally:
+        parallel_generator.close()
+        
+    assert np.array_equal(embeddings, EmbeddingGenerator().embed_array(texts))
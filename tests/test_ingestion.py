@@ -1 +1,121 @@
- 
\ No newline at end of file
+"""Tests for the incremental ingestion module."""
+
+import pytest
+
+from pdf2vector.core.chunking import PDFChunker
+from pdf2vector.core.embeddings import EmbeddingGenerator
+from pdf2vector.core.ingestion import IncrementalIngestor, PageManifest, page_hashes
+from pdf2vector.core.vector_store import ChromaDBStore
+
+from sample_pdf import write_pdf
+
+def page_lines(page, topic="topic"):
+    """Build distinct lines of text for a page."""
+    return [f"Page {page} line {line} discusses {topic} number {page * 10 + line}." for line in range(12)]
+
+@pytest.fixture
+def ingestor(store):
+    """Create an ingestor with small chunks."""
+    return IncrementalIngestor(PDFChunker(chunk_size=300, chunk_overlap=50, workers=1), store)
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    """Write a four-page PDF."""
+    path = tmp_path / "spec.pdf"
+    write_pdf(path, [page_lines(page) for page in range(4)])
+    return path
+
+def stored_pages(store):
+    """Return the page of every stored chunk."""
+    return sorted(metadata["page"] for metadata in store.collection.get()["metadatas"])
+
+def test_page_hashes_change_only_for_edited_pages(tmp_path, pdf_path):
+    """Test that editing one page changes only its hash."""
+    before = page_hashes(pdf_path)
+    edited = tmp_path / "edited.pdf"
+    write_pdf(edited, [page_lines(page, "revised" if page == 2 else "topic") for page in range(4)])
+    
+    after = page_hashes(edited)
+    
+    assert len(before) == 4
+    assert [a == b for a, b in zip(before, after)] == [True, True, False, True]
+
+def test_page_hashes_cover_page_resources(tmp_path, pdf_path):
+    """Test that changing a font shared by the pages changes every page hash."""
+    edited = tmp_path / "edited.pdf"
+    # Same length, so the cross-reference offsets stay valid
+    edited.write_bytes(pdf_path.read_bytes().replace(b"/BaseFont /Helvetica", b"/BaseFont /Symbol   "))
+    
+    assert not set(page_hashes(pdf_path)) & set(page_hashes(edited))
+
+def test_first_ingest_stores_every_page(ingestor, store, pdf_path):
+    """Test that a new PDF is ingested completely and recorded in the manifest."""
+    changed = ingestor.ingest(pdf_path)
+    
+    assert changed == [0, 1, 2, 3]
+    assert set(stored_pages(store)) == {1, 2, 3, 4}
+    hashes, chunks = PageManifest(store.persist_dir / "manifest.json").get("spec.pdf")
+    assert hashes == page_hashes(pdf_path)
+    assert sorted(chunk_id for page_ids in chunks for chunk_id in page_ids) == sorted(store.collection.get()["ids"])
+
+def test_unchanged_pdf_is_not_extracted(ingestor, pdf_path, monkeypatch):
+    """Test that re-ingesting an unchanged PDF extracts nothing."""
+    ingestor.ingest(pdf_path)
+    
+    def no_extraction(*args, **kwargs):
+        raise AssertionError("pages extracted")
+        
+    monkeypatch.setattr(ingestor.chunker, "iter_page_chunks", no_extraction)
+    
+    assert ingestor.ingest(pdf_path) == []
+
+def test_edited_page_is_reingested(ingestor, store, pdf_path):
+    """Test that only the edited page is re-extracted and its old chunks deleted."""
+    ingestor.ingest(pdf_path)
+    ids_before = set(store.collection.get()["ids"])
+    write_pdf(pdf_path, [page_lines(page, "revised" if page == 2 else "topic") for page in range(4)])
+    
+    changed = ingestor.ingest(pdf_path)
+    
+    assert changed == [2]
+    records = store.collection.get()
+    page3 = [text for text, metadata in zip(records["documents"], records["metadatas"]) if metadata["page"] == 3]
+    assert page3 and all("revised" in text for text in page3)
+    assert not any("topic number 2" in text for text in page3)
+    
+    # Chunks of the other pages were kept as they were
+    _, chunks = ingestor.manifest.get("spec.pdf")
+    kept = {chunk_id for page, page_ids in enumerate(chunks) if page != 2 for chunk_id in page_ids}
+    assert kept <= ids_before
+    assert set(records["ids"]) == {chunk_id for page_ids in chunks for chunk_id in page_ids}
+
+def test_removed_pages_are_deleted(ingestor, store, pdf_path):
+    """Test that chunks of pages cut from the PDF are deleted."""
+    ingestor.ingest(pdf_path)
+    write_pdf(pdf_path, [page_lines(page) for page in range(2)])
+    
+    assert ingestor.ingest(pdf_path) == []
+    assert set(stored_pages(store)) == {1, 2}
+
+def test_first_ingest_replaces_chunks_stored_without_manifest(ingestor, store, pdf_path):
+    """Test that chunks from a whole-document ingest are replaced."""
+    store.upsert(PDFChunker(chunk_size=300, chunk_overlap=50, workers=1).iter_chunks(pdf_path))
+    
+    ingestor.ingest(pdf_path)
+    
+    assert all("page" in metadata for metadata in store.collection.get()["metadatas"])
+
+def test_edited_page_is_stored_with_dedup(tmp_path, pdf_path):
+    """Test that a slightly edited page is not skipped as a near-duplicate of itself."""
+    store = ChromaDBStore(persist_dir=tmp_path / "chroma", embedding_generator=EmbeddingGenerator(), dedup="skip")
+    ingestor = IncrementalIngestor(PDFChunker(chunk_size=3000, workers=1), store)
+    ingestor.ingest(pdf_path)
+    lines = [page_lines(page) for page in range(4)]
+    lines[2][3] = lines[2][3].replace("topic", "subject")
+    write_pdf(pdf_path, lines)
+    
+    assert ingestor.ingest(pdf_path) == [2]
+    
+    records = store.collection.get()
+    page3 = [text for text, metadata in zip(records["documents"], records["metadatas"]) if metadata["page"] == 3]
+    assert len(page3) == 1 and "discusses subject number 23" in page3[0]
\ No newline at end of file
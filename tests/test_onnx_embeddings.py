@@ -0,0 +1,141 @@
+"""Tests for the embedding backends and the ONNX backend."""
+
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from pdf2vector.core.backends import EmbeddingBackend, find_backend, length_buckets, register_backend
+from pdf2vector.core.embeddings import EmbeddingGenerator
+from pdf2vector.core.onnx_embeddings import OnnxEmbeddingBackend, mean_pool, pad_batch
+
+class StandInTokenizer:
+    """Tokenizer with one token per word, numbered by word length."""
+    
+    def encode_batch(self, texts):
+        return [SimpleNamespace(ids=[len(word) for word in text.split()]) for text in texts]
+
+class StandInSession:
+    """Session returning one-hot token embeddings and recording batch shapes."""
+    
+    def __init__(self, dimension=8):
+        self.dimension = dimension
+        self.shapes = []
+        
+    def run(self, output_names, feeds):
+        input_ids = feeds["input_ids"]
+        self.shapes.append(input_ids.shape)
+        hidden = np.zeros((*input_ids.shape, self.dimension), dtype=np.float32)
+        rows, columns = np.indices(input_ids.shape)
+        hidden[rows, columns, input_ids % self.dimension] = 1.0
+        return [hidden]
+
+@pytest.fixture
+def backend():
+    """Create an ONNX backend whose model is already loaded."""
+    backend = OnnxEmbeddingBackend("unused", dimension=8, batch_size=2, normalize=False)
+    backend._session = StandInSession()
+    backend._tokenizer = StandInTokenizer()
+    backend._input_names = ["input_ids", "attention_mask"]
+    return backend
+
+def test_length_buckets_group_similar_lengths():
+    """Test that batches hold items of neighbouring lengths."""
+    buckets = length_buckets([5, 1, 9, 2, 6], batch_size=2)
+    
+    assert [bucket.tolist() for bucket in buckets] == [[1, 3], [0, 4], [2]]
+
+def test_pad_batch_and_mean_pool():
+    """Test that padding is masked out of the pooled embedding."""
+    input_ids, attention_mask = pad_batch([[3, 4], [5]])
+    
+    assert input_ids.tolist() == [[3, 4], [5, 0]]
+    assert attention_mask.tolist() == [[1, 1], [1, 0]]
+    
+    hidden = np.array([[[1.0, 0.0], [3.0, 2.0]], [[4.0, 4.0], [100.0, 100.0]]])
+    assert mean_pool(hidden, attention_mask).tolist() == [[2.0, 1.0], [4.0, 4.0]]
+
+def test_embed_many_pads_each_bucket_to_its_own_length(backend):
+    """Test that batches are padded per bucket and results keep input order."""
+    texts = ["a bb ccc dddd", "x", "yy zz", "q r s t u v"]
+    
+    embeddings = backend.embed_many(texts)
+    
+    assert sorted(backend._session.shapes) == [(2, 2), (2, 6)]
+    assert embeddings.shape == (4, 8)
+    assert embeddings[1].tolist() == [0, 1, 0, 0, 0, 0, 0, 0]
+    assert embeddings[2].tolist() == [0, 0, 1, 0, 0, 0, 0, 0]
+    assert embeddings[0][1:5].tolist() == [0.25, 0.25, 0.25, 0.25]
+
+def test_generator_selects_backend_by_model_name(backend):
+    """Test that an onnx: model name builds the backend without loading it."""
+    generator = EmbeddingGenerator(
+        model_name="onnx:/models/minilm",
+        dimension=8,
+        backend_options={"batch_size": 4}
+    )
+    
+    assert isinstance(generator._client, OnnxEmbeddingBackend)
+    assert generator._client.model_path.as_posix() == "/models/minilm"
+    assert generator._client.batch_size == 4
+    assert generator._client._session is None
+    assert generator.dimension == 8
+    
+    generator._client = backend
+    embeddings = generator.embed_array(["a bb", "ccc"])
+    assert embeddings.dtype == np.float32
+    assert embeddings.shape == (2, 8)
+
+def test_generator_resolves_backend_dimension_on_first_use(monkeypatch):
+    """Test that the model is only loaded when its dimension is needed."""
+    loads = []
+    
+    def fake_load(self):
+        loads.append(self.model_path)
+        self._dimension = 8
+        
+    monkeypatch.setattr(OnnxEmbeddingBackend, "_load", fake_load)
+    generator = EmbeddingGenerator(model_name="onnx:/models/minilm")
+    
+    assert loads == []
+    assert generator.dimension == 8
+    assert len(loads) == 1
+
+def test_register_backend():
+    """Test that custom backends are found by their prefix."""
+    class ConstantBackend(EmbeddingBackend):
+        def __init__(self, location, dimension=3):
+            self.location = location
+            self._dimension = dimension
+            
+        @property
+        def dimension(self):
+            return self._dimension
+            
+        def embed_many(self, texts):
+            return [[1.0, 0.0, 0.0] for _ in texts]
+            
+    register_backend("constant", ConstantBackend)
+    generator = EmbeddingGenerator(model_name="constant:anything")
+    
+    assert find_backend("constant:anything")[1] == "anything"
+    assert find_backend("text-embedding-3-small") is None
+    assert generator.dimension == 3
+    assert generator.generate_embedding("text") == [1.0, 0.0, 0.0]
+
+def test_missing_onnxruntime_is_reported(monkeypatch):
+    """Test that the optional dependency is requested on first use."""
+    monkeypatch.setitem(sys.modules, "onnxruntime", None)
+    backend = OnnxEmbeddingBackend("/models/minilm", dimension=8)
+    
+    with pytest.raises(ImportError, match="pip install onnxruntime tokenizers"):
+        backend.embed_many(["text"])
+
+def test_embed_many_without_bucketing_keeps_input_batches(backend):
+    """Test that disabling bucketing batches texts in input order."""
+    backend.bucket_by_length = False
+    
+    backend.embed_many(["a bb ccc dddd", "x", "yy zz", "q r s t u v"])
+    
+    assert backend._session.shapes == [(2, 4), (2, 6)]
@@ -0,0 +1,243 @@
+"""Tests for the PDF chunker."""
+
+import tracemalloc
+
+import pytest
+from pdfminer.high_level import extract_text
+
+from pdf2vector.core.chunking import Chunk, PDFChunker, _extract_pages, _gear_hashes
+from pdf2vector.core.ingestion import page_hashes
+
+from sample_pdf import write_pdf
+
+def page_lines(page, n_lines=20):
+    """Build distinct lines of text for a page."""
+    return [f"Page {page} line {line} talks about topic {page * 7 + line}" for line in range(n_lines)]
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    """Write a five-page PDF."""
+    path = tmp_path / "book.pdf"
+    write_pdf(path, [page_lines(page) for page in range(5)])
+    return path
+
+def legacy_chunks(text, chunk_size, chunk_overlap):
+    """Slice the whole document text like the original chunker."""
+    chunks = []
+    start = 0
+    while start < len(text):
+        chunks.append(text[start:start + chunk_size])
+        start += chunk_size - chunk_overlap
+    return chunks
+
+@pytest.mark.parametrize("chunk_size, chunk_overlap", [(1000, 200), (300, 50), (5000, 0)])
+def test_chunks_match_whole_document_slicing(pdf_path, chunk_size, chunk_overlap):
+    """Test that streaming produces the same chunks as slicing the full text."""
+    chunker = PDFChunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+    
+    chunks = chunker.chunk_pdf(pdf_path)
+    
+    expected = legacy_chunks(extract_text(str(pdf_path)), chunk_size, chunk_overlap)
+    assert [chunk.text for chunk in chunks] == expected
+    assert [chunk.metadata["chunk_index"] for chunk in chunks] == list(range(len(expected)))
+    assert all(chunk.metadata["filename"] == "book.pdf" for chunk in chunks)
+
+def test_chunks_record_their_pages(pdf_path):
+    """Test that page_start and page_end cover the pages a chunk spans."""
+    chunker = PDFChunker(chunk_size=500, chunk_overlap=100)
+    
+    for chunk in chunker.iter_chunks(pdf_path):
+        pages = {
+            int(line.split()[1]) + 1
+            for line in chunk.text.splitlines()
+            if line.startswith("Page ") and len(line.split()) > 2
+        }
+        assert chunk.metadata["page_start"] <= chunk.metadata["page_end"]
+        if pages:
+            assert chunk.metadata["page_start"] <= min(pages)
+            assert max(pages) <= chunk.metadata["page_end"]
+            
+    last = chunker.chunk_pdf(pdf_path)[-1]
+    assert last.metadata["page_end"] == 5
+
+def test_first_chunk_is_yielded_before_the_rest_is_read(pdf_path, monkeypatch):
+    """Test that chunks are produced while pages are still being extracted."""
+    chunker = PDFChunker(chunk_size=500, chunk_overlap=100)
+    pages_read = []
+    iter_pages = chunker.iter_pages
+    
+    def counting_pages(path):
+        for text in iter_pages(path):
+            pages_read.append(text)
+            yield text
+            
+    monkeypatch.setattr(chunker, "iter_pages", counting_pages)
+    
+    next(chunker.iter_chunks(pdf_path))
+    
+    assert len(pages_read) == 1
+
+def test_iter_pages_concatenates_to_extract_text(pdf_path):
+    """Test that per-page extraction matches whole-document extraction."""
+    pages = list(PDFChunker().iter_pages(pdf_path))
+    
+    assert len(pages) == 5
+    assert "".join(pages) == extract_text(str(pdf_path))
+
+def test_parallel_extraction_matches_serial(tmp_path):
+    """Test that pages extracted in a process pool are stitched back in order."""
+    path = tmp_path / "long.pdf"
+    write_pdf(path, [page_lines(page, n_lines=10) for page in range(20)])
+    serial = PDFChunker(chunk_size=300, chunk_overlap=60, workers=1)
+    parallel = PDFChunker(chunk_size=300, chunk_overlap=60, workers=2, parallel_threshold=10)
+    
+    assert list(parallel.iter_pages(path)) == list(serial.iter_pages(path))
+    
+    serial_chunks = serial.chunk_pdf(path)
+    parallel_chunks = parallel.chunk_pdf(path)
+    assert [chunk.text for chunk in parallel_chunks] == [chunk.text for chunk in serial_chunks]
+    assert [chunk.metadata for chunk in parallel_chunks] == [chunk.metadata for chunk in serial_chunks]
+
+def test_small_pdfs_are_extracted_in_process(pdf_path, monkeypatch):
+    """Test that PDFs below the page threshold do not start a process pool."""
+    def no_pool(*args, **kwargs):
+        raise AssertionError("process pool started")
+        
+    monkeypatch.setattr("pdf2vector.core.chunking.ProcessPoolExecutor", no_pool)
+    chunker = PDFChunker(workers=4, parallel_threshold=6)
+    
+    assert len(list(chunker.iter_pages(pdf_path))) == 5
+
+def test_chunks_are_views_of_a_shared_buffer(pdf_path):
+    """Test that chunks share their buffer and build text and metadata on demand."""
+    chunks = PDFChunker(chunk_size=300, chunk_overlap=50).chunk_pdf(pdf_path)
+    
+    assert chunks[0]._buffer is chunks[1]._buffer
+    assert chunks[0]._metadata is None
+    assert len(chunks[0]) == len(chunks[0].text) == 300
+    assert chunks[1].text.startswith(chunks[0].text[-50:])
+    assert chunks[0] == Chunk(chunks[0].text, dict(chunks[0].metadata))
+    assert not hasattr(chunks[0], "__dict__")
+
+@pytest.fixture
+def prose_pdf(tmp_path):
+    """Write a PDF of short sentences of varying length."""
+    path = tmp_path / "prose.pdf"
+    write_pdf(path, [
+        [f"Sentence {page}.{line} {'is rather long and wordy ' * (line % 3)}ends here." for line in range(25)]
+        for page in range(4)
+    ])
+    return path
+
+def test_sentence_mode_cuts_at_sentence_boundaries(prose_pdf):
+    """Test that sentence mode cuts whole sentences within chunk_size."""
+    chunker = PDFChunker(chunk_size=400, chunk_overlap=100, split_at="sentence")
+    
+    chunks = chunker.chunk_pdf(prose_pdf)
+    
+    text = "".join(chunker.iter_pages(prose_pdf))
+    assert all(len(chunk) <= 400 for chunk in chunks)
+    assert all(chunk.text.startswith("Sentence ") for chunk in chunks)
+    assert all(chunk.text.rstrip().endswith("ends here.") for chunk in chunks)
+    assert [chunk.metadata["chunk_index"] for chunk in chunks] == list(range(len(chunks)))
+    
+    # Consecutive chunks overlap and together cover every sentence
+    offsets = [text.index(chunk.text) for chunk in chunks]
+    for previous, offset, chunk in zip(chunks, offsets[1:], chunks[1:]):
+        assert offset < text.index(previous.text) + len(previous)
+    assert offsets[0] == 0
+    assert offsets[-1] + len(chunks[-1]) >= len(text.rstrip())
+    
+    fixed = PDFChunker(chunk_size=400, chunk_overlap=100).chunk_pdf(prose_pdf)
+    assert len(chunks) < len(fixed)
+
+def test_unknown_split_mode_is_rejected():
+    """Test that an unsupported split mode raises ValueError."""
+    with pytest.raises(ValueError):
+        PDFChunker(split_at="word")
+
+def test_fast_mode_extracts_the_same_words(pdf_path):
+    """Test that fast extraction keeps the text of a simple PDF."""
+    layout = "".join(PDFChunker(workers=1).iter_pages(pdf_path))
+    fast_pages = list(PDFChunker(workers=1, mode="fast").iter_pages(pdf_path))
+    
+    assert len(fast_pages) == 5
+    assert all(page.endswith("\f") for page in fast_pages)
+    assert "".join(fast_pages).split() == layout.split()
+    assert "Page 0 line 1 talks about topic 1\nPage 0 line 2" in fast_pages[0]
+
+def peak_reading_memory(path):
+    """Return the peak bytes allocated while extracting and hashing the pages of a PDF."""
+    tracemalloc.start()
+    try:
+        for _ in _extract_pages(path, mode="fast"):
+            pass
+        page_hashes(path)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def test_reading_memory_does_not_grow_with_page_count(tmp_path):
+    """Test that parsed objects of finished pages are not kept."""
+    short, long = tmp_path / "short.pdf", tmp_path / "long.pdf"
+    write_pdf(short, [page_lines(page, 80) for page in range(10)])
+    write_pdf(long, [page_lines(page, 80) for page in range(100)])
+    
+    # Each page holds about 5 KiB of text; only about 1 KiB of cross-reference
+    # entries and parser leftovers per page may add up
+    assert peak_reading_memory(long) - peak_reading_memory(short) < 256 * 1024
+
+def test_extraction_modes_are_cached_separately():
+    """Test that each extraction mode has its own text cache key."""
+    assert PDFChunker(mode="fast").extractor_version != PDFChunker().extractor_version
+    with pytest.raises(ValueError):
+        PDFChunker(mode="ocr")
+
+def test_gear_hashes_match_rolling_update():
+    """Test that the vectorized gear hash equals FastCDC's rolling update."""
+    text = "Gear hashing \u00e9t\u00e9 \u4e2d\u6587 " * 20
+    hashes = _gear_hashes(text)
+    
+    rolling = int(hashes[0])
+    for i in range(1, len(text)):
+        rolling = ((rolling << 1) + int(_gear_hashes(text[i])[0])) % 2**64
+        assert int(hashes[i]) == rolling
+
+def test_content_mode_only_changes_chunks_near_an_edit(tmp_path):
+    """Test that content-defined chunks survive an insertion elsewhere."""
+    lines = [[f"Line {page}.{line} holds some text about item {page * 31 + line}" for line in range(30)] for page in range(8)]
+    original = tmp_path / "original.pdf"
+    write_pdf(original, lines)
+    lines[1].insert(5, "An inserted line that was not there before")
+    edited = tmp_path / "edited.pdf"
+    write_pdf(edited, lines)
+    chunker = PDFChunker(chunk_size=600, chunk_overlap=100, split_at="content")
+    
+    before = chunker.chunk_pdf(original)
+    after = chunker.chunk_pdf(edited)
+    
+    text = "".join(chunker.iter_pages(original))
+    assert "".join(chunk.text for chunk in before) == text
+    assert all(150 <= len(chunk) <= 600 for chunk in before[:-1])
+    assert all(chunk.metadata["occurrence"] == 0 for chunk in before)
+    
+    # Only chunks next to the edit change, unlike fixed-size chunks
+    kept = {chunk.text for chunk in before}
+    changed = [chunk for chunk in after if chunk.text not in kept]
+    assert 0 < len(changed) <= 5
+    assert all(chunk.metadata["page_start"] <= 3 for chunk in changed)
+    
+    fixed = PDFChunker(chunk_size=600, chunk_overlap=100)
+    fixed_kept = {chunk.text for chunk in fixed.chunk_pdf(original)}
+    assert sum(chunk.text not in fixed_kept for chunk in fixed.chunk_pdf(edited)) > len(after) // 2
+
+def test_content_mode_numbers_repeated_chunks(tmp_path):
+    """Test that identical content-defined chunks get distinct occurrences."""
+    path = tmp_path / "repeated.pdf"
+    write_pdf(path, [[f"This paragraph repeats on every page, line {line}" for line in range(20)]] * 4)
+    
+    chunks = PDFChunker(chunk_size=300, split_at="content").chunk_pdf(path)
+    
+    assert max(chunk.metadata["occurrence"] for chunk in chunks) >= 2
+    keys = [(chunk.text, chunk.metadata["occurrence"]) for chunk in chunks]
+    assert len(set(keys)) == len(keys)
\ No newline at end of file
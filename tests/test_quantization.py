@@ -0,0 +1,108 @@
+"""Tests for the quantization module."""
+
+import numpy as np
+import pytest
+
+from pdf2vector.core.embeddings import EmbeddingGenerator
+from pdf2vector.core.quantization import QuantizedIndex, dequantize, quantize
+from pdf2vector.core.vector_store import ChromaDBStore
+
+@pytest.mark.parametrize("mode, dtype, tolerance", [("int8", np.int8, 1e-2), ("float16", np.float16, 1e-3)])
+def test_quantize_round_trip(embeddings, mode, dtype, tolerance):
+    """Test that dequantized vectors stay close to the originals."""
+    codes, scales = quantize(embeddings, mode)
+    
+    assert codes.dtype == dtype
+    assert scales.shape == (len(embeddings),)
+    np.testing.assert_allclose(dequantize(codes, scales), embeddings, atol=tolerance)
+
+def test_quantize_zero_vector():
+    """Test that an all-zero vector quantizes without dividing by zero."""
+    codes, scales = quantize(np.zeros((1, 8), dtype=np.float32), "int8")
+    
+    assert not codes.any()
+    assert scales[0] == 0
+
+def test_quantize_rejects_unknown_mode(embeddings):
+    """Test that unsupported modes raise ValueError."""
+    with pytest.raises(ValueError):
+        quantize(embeddings, "int4")
+
+@pytest.mark.parametrize("mode", ["int8", "float16"])
+def test_index_search_matches_exact(embeddings, mode):
+    """Test that quantized search ranks vectors like full-precision search."""
+    index = QuantizedIndex(mode, embeddings.shape[1])
+    index.add([f"id{i}" for i in range(len(embeddings))], embeddings)
+    
+    for i, query in enumerate(embeddings):
+        hits = index.search(query, k=2)
+        assert hits[0][0] == f"id{i}"
+        assert hits[0][1] == pytest.approx(1.0, abs=1e-3)
+        
+    assert index.memory_bytes < embeddings.nbytes
+
+def test_index_replace_and_remove(embeddings):
+    """Test that re-adding an ID replaces it and removed IDs are not found."""
+    index = QuantizedIndex("int8", embeddings.shape[1])
+    index.add(["a", "b"], embeddings[:2])
+    index.add(["b", "c"], embeddings[2:4])
+    
+    assert len(index) == 3
+    assert index.search(embeddings[2], k=1)[0][0] == "b"
+    
+    index.remove(["b", "missing"])
+    assert index.ids == ["a", "c"]
+    assert index.search(embeddings[3], k=1)[0][0] == "c"
+
+def test_index_save_and_load(tmp_path, embeddings):
+    """Test that a saved index loads with the same contents."""
+    index = QuantizedIndex("int8", embeddings.shape[1])
+    index.add(["a", "b", "c"], embeddings[:3])
+    index.save(tmp_path / "index.npz")
+    
+    loaded = QuantizedIndex.load(tmp_path / "index.npz", embeddings.shape[1])
+    
+    assert loaded.mode == "int8"
+    assert loaded.ids == ["a", "b", "c"]
+    assert loaded.search(embeddings[1], k=3) == index.search(embeddings[1], k=3)
+    
+    with pytest.raises(ValueError):
+        QuantizedIndex.load(tmp_path / "index.npz", 16)
+
+def test_store_queries_quantized_index(tmp_path, chunks, texts):
+    """Test that a quantized store answers queries and persists its index."""
+    store = ChromaDBStore(
+        persist_dir=tmp_path / "chroma",
+        embedding_generator=EmbeddingGenerator(),
+        quantization="int8"
+    )
+    store.upsert(chunks)
+    
+    results = store.query("flour water salt and yeast", k=2)
+    
+    assert len(results) == 2
+    assert results[0]["text"] == texts[1]
+    assert results[0]["metadata"]["chunk_index"] == 1
+    assert (tmp_path / "chroma" / "quantized_int8.npz").exists()
+    
+    reopened = ChromaDBStore(
+        persist_dir=tmp_path / "chroma",
+        embedding_generator=EmbeddingGenerator(),
+        quantization="int8"
+    )
+    assert len(reopened.search_index) == len(texts)
+
+def test_store_rebuilds_missing_quantized_index(tmp_path, chunks, texts):
+    """Test that an index file missing next to a filled collection is rebuilt."""
+    ChromaDBStore(persist_dir=tmp_path / "chroma", embedding_generator=EmbeddingGenerator()).upsert(chunks)
+    
+    store = ChromaDBStore(
+        persist_dir=tmp_path / "chroma",
+        embedding_generator=EmbeddingGenerator(),
+        quantization="int8"
+    )
+    
+    assert len(store.search_index) == len(texts)
+    assert store.query("flour water salt and yeast", k=1)[0]["text"] == texts[1]
+    assert (tmp_path / "chroma" / "quantized_int8.npz").exists()
+    assert not (tmp_path / "chroma" / "quantized_int8.npz.tmp").exists()
@@ -0,0 +1,116 @@
+"""Tests for the rate limiting module."""
+
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from requests.structures import CaseInsensitiveDict
+
+from pdf2vector.core.claude import ClaudeClient
+from pdf2vector.core.rate_limit import AdaptiveRateLimiter, parse_retry_after
+
+def test_success_increases_rate_additively():
+    """Test that each success adds the configured increase."""
+    limiter = AdaptiveRateLimiter(initial_rate=2.0, increase=0.5)
+    
+    limiter.on_success()
+    limiter.on_success()
+    
+    assert limiter.rate == pytest.approx(3.0)
+
+def test_throttle_decreases_rate_multiplicatively():
+    """Test that a 429 halves the rate without going below the minimum."""
+    limiter = AdaptiveRateLimiter(initial_rate=4.0, min_rate=1.5, decrease_factor=0.5)
+    
+    limiter.on_throttle(retry_after=0, sent_at=limiter.acquire())
+    assert limiter.rate == pytest.approx(2.0)
+    limiter.on_throttle(retry_after=0, sent_at=limiter.acquire())
+    assert limiter.rate == pytest.approx(1.5)
+    assert limiter.metrics()["throttled"] == 2
+
+def test_burst_of_throttles_decreases_once():
+    """Test that 429s of requests sent before a decrease do not decrease it again."""
+    limiter = AdaptiveRateLimiter(initial_rate=8.0, decrease_factor=0.5)
+    sent = [limiter.acquire() for _ in range(3)]
+    
+    for sent_at in sent:
+        limiter.on_throttle(retry_after=0, sent_at=sent_at)
+    assert limiter.rate == pytest.approx(4.0)
+    
+    # Without a send time, throttles within one request interval are one burst
+    limiter.on_throttle(retry_after=0)
+    assert limiter.rate == pytest.approx(4.0)
+    assert limiter.metrics()["throttled"] == 4
+
+def test_unlimited_until_first_throttle():
+    """Test that the default limiter does not pace requests until throttled."""
+    limiter = AdaptiveRateLimiter(max_rate=1000.0, decrease_factor=0.5)
+    
+    start = time.monotonic()
+    for _ in range(50):
+        sent_at = limiter.acquire()
+    assert time.monotonic() - start < 0.1
+    limiter.on_success()
+    assert limiter.rate == float("inf")
+    
+    limiter.on_throttle(retry_after=0, sent_at=sent_at)
+    assert limiter.rate == pytest.approx(25.0)
+
+def test_low_quota_headers_hold_rate():
+    """Test that a nearly exhausted quota stops the additive increase."""
+    limiter = AdaptiveRateLimiter(initial_rate=2.0)
+    headers = CaseInsensitiveDict({
+        "X-RateLimit-Remaining-Requests": "5",
+        "X-RateLimit-Limit-Requests": "100",
+    })
+    
+    limiter.on_success(headers)
+    
+    assert limiter.rate == pytest.approx(2.0)
+
+def test_exhausted_quota_headers_back_off():
+    """Test that a zero remaining quota backs off like a throttle."""
+    limiter = AdaptiveRateLimiter(initial_rate=2.0, decrease_factor=0.5)
+    
+    limiter.on_success({"anthropic-ratelimit-requests-remaining": "0",
+                        "anthropic-ratelimit-requests-limit": "50"})
+    
+    assert limiter.rate == pytest.approx(1.0)
+
+def test_acquire_paces_requests():
+    """Test that acquire spaces requests at the current rate."""
+    limiter = AdaptiveRateLimiter(initial_rate=20.0, max_rate=20.0)
+    
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.acquire()
+    elapsed = time.monotonic() - start
+    
+    assert elapsed >= 0.15
+    assert limiter.metrics()["requests"] == 5
+
+def test_parse_retry_after():
+    """Test reading Retry-After in seconds."""
+    assert parse_retry_after(CaseInsensitiveDict({"Retry-After": "2"})) == 2.0
+    assert parse_retry_after({}) is None
+    assert parse_retry_after(Mock()) is None
+
+def test_claude_client_backs_off_on_429():
+    """Test that ClaudeClient retries throttled requests through the limiter."""
+    limiter = AdaptiveRateLimiter(initial_rate=4.0)
+    with patch("requests.Session") as mock_session_class:
+        session = Mock()
+        mock_session_class.return_value = session
+        client = ClaudeClient(api_key="test-key", rate_limiter=limiter)
+        
+    throttled = Mock(status_code=429, headers=CaseInsensitiveDict({"Retry-After": "0"}))
+    success = Mock(status_code=200, headers=CaseInsensitiveDict())
+    success.json.return_value = {"content": [{"text": "Test answer"}]}
+    session.post.side_effect = [throttled, success]
+    
+    response = client.answer_question("Question?", [])
+    
+    assert response["answer"] == "Test answer"
+    assert session.post.call_count == 2
+    assert limiter.metrics()["throttled"] == 1
+    assert limiter.rate == pytest.approx(2.5)
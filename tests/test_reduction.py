@@ -0,0 +1,121 @@
+"""Tests for the dimensionality reduction module."""
+
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+from pdf2vector.core.chunking import Chunk
+from pdf2vector.core.embeddings import EmbeddingGenerator
+from pdf2vector.core.reduction import DimensionReducer
+from pdf2vector.core.vector_store import ChromaDBStore
+
+@pytest.mark.parametrize("method", ["pca", "random"])
+def test_transform_shape_and_norm(embeddings, method):
+    """Test that reduced embeddings have the target dimension and unit length."""
+    reducer = DimensionReducer(16, method).fit(embeddings)
+    
+    reduced = reducer.transform(embeddings)
+    
+    assert reduced.shape == (len(embeddings), 16)
+    assert reduced.dtype == np.float32
+    np.testing.assert_allclose(np.linalg.norm(reduced, axis=1), 1.0, rtol=1e-5)
+
+def test_pca_preserves_nearest_neighbour(embeddings):
+    """Test that PCA fitted on the corpus keeps each vector closest to itself."""
+    reducer = DimensionReducer(8, "pca").fit(embeddings)
+    reduced = reducer.transform(embeddings)
+    
+    scores = reduced @ reduced.T
+    
+    assert (scores.argmax(axis=1) == np.arange(len(embeddings))).all()
+
+def test_pca_pads_small_samples(embeddings):
+    """Test that PCA on fewer rows than dimensions still outputs the target width."""
+    reducer = DimensionReducer(32, "pca").fit(embeddings[:3])
+    
+    assert reducer.transform(embeddings).shape == (len(embeddings), 32)
+
+def test_transform_errors(embeddings):
+    """Test that unfitted reducers and wrong dimensions are rejected."""
+    reducer = DimensionReducer(16)
+    with pytest.raises(ValueError):
+        reducer.transform(embeddings)
+        
+    reducer.fit(embeddings)
+    with pytest.raises(ValueError):
+        reducer.transform(embeddings[:, :100])
+        
+    with pytest.raises(ValueError):
+        DimensionReducer(16, "umap")
+
+def test_save_and_load(tmp_path, embeddings):
+    """Test that a saved reducer transforms identically after loading."""
+    reducer = DimensionReducer(16, "random").fit(embeddings)
+    reducer.save(tmp_path / "reducer.npz")
+    
+    loaded = DimensionReducer.load(tmp_path / "reducer.npz")
+    
+    assert loaded.method == "random"
+    assert loaded.target_dimension == 16
+    np.testing.assert_array_equal(loaded.transform(embeddings), reducer.transform(embeddings))
+
+def test_store_with_reduction(tmp_path, chunks, texts):
+    """Test that a reducing store stores and queries reduced embeddings."""
+    store = ChromaDBStore(
+        persist_dir=tmp_path / "chroma",
+        embedding_generator=EmbeddingGenerator(),
+        reduce_dim=4
+    )
+    assert store.query("anything") == []
+    
+    store.upsert(chunks)
+    results = store.query(texts[2], k=1)
+    
+    assert results[0]["text"] == texts[2]
+    stored = store.collection.get(ids=[store._generate_id(chunks[0])], include=["embeddings"])
+    assert len(stored["embeddings"][0]) == 4
+    assert (tmp_path / "chroma" / "reducer.npz").exists()
+    
+    with pytest.raises(ValueError):
+        ChromaDBStore(
+            persist_dir=tmp_path / "chroma",
+            embedding_generator=EmbeddingGenerator(),
+            reduce_dim=16
+        )
+
+def test_store_does_not_fit_pca_on_a_small_first_batch(tmp_path, chunks):
+    """Test that PCA waits for a sample of at least reduce_dim chunks."""
+    store = ChromaDBStore(
+        persist_dir=tmp_path / "chroma",
+        embedding_generator=EmbeddingGenerator(),
+        batch_size=2,
+        reduce_dim=5
+    )
+    
+    with pytest.raises(ValueError):
+        store.upsert(chunks[:3])
+    assert store.collection.count() == 0
+    assert not store.reducer.fitted
+    
+    # Batches are held back until they add up to a large enough sample
+    with patch.object(store.reducer, "fit", wraps=store.reducer.fit) as mock_fit:
+        store.upsert(chunks)
+    assert len(mock_fit.call_args.args[0]) == 6
+    assert store.collection.count() == 6
+
+def test_store_fits_reducer_on_a_corpus_sample(tmp_path, texts):
+    """Test fitting the reducer explicitly before storing single chunks."""
+    store = ChromaDBStore(
+        persist_dir=tmp_path / "chroma",
+        embedding_generator=EmbeddingGenerator(),
+        reduce_dim=4
+    )
+    with pytest.raises(ValueError):
+        store.fit_reducer(texts[:2])
+        
+    store.fit_reducer(texts)
+    store.upsert([Chunk(text=texts[0], metadata={"filename": "test.pdf", "chunk_index": 0})])
+    
+    assert store.query(texts[0], k=1)[0]["text"] == texts[0]
+    with pytest.raises(ValueError):
+        store.fit_reducer(texts)
\ No newline at end of file
@@ -0,0 +1,159 @@
+"""Tests for the remote embedding module against a local stand-in server."""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pytest
+
+from pdf2vector.core.embeddings import EmbeddingGenerator
+from pdf2vector.core.remote_embeddings import EmbeddingError, RemoteEmbeddingClient
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Serves fake embeddings of dimension 3 derived from each input text."""
+    
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.requests.append(body)
+        with self.server.lock:
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(self.server.max_in_flight, self.server.in_flight)
+        time.sleep(self.server.delay)
+        with self.server.lock:
+            self.server.in_flight -= 1
+            
+        if self.server.failures:
+            self.send_response(self.server.failures.pop(0))
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+            
+        inputs = body["input"] if isinstance(body["input"], list) else [body["input"]]
+        data = [
+            {"index": i, "embedding": [float(len(text)), float(i), 1.0]}
+            for i, text in enumerate(inputs)
+        ]
+        # Return items out of order to exercise index-based reassembly
+        payload = json.dumps({"data": data[::-1]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+        
+    def log_message(self, format, *args):
+        pass
+
+class StandInServer(ThreadingHTTPServer):
+    """Stand-in server that ignores clients hanging up early."""
+    
+    def handle_error(self, request, client_address):
+        pass
+
+@pytest.fixture
+def server():
+    """Run a stand-in embedding server on a free local port."""
+    server = StandInServer(("127.0.0.1", 0), StandInHandler)
+    server.requests = []
+    server.failures = []
+    server.delay = 0.0
+    server.lock = threading.Lock()
+    server.in_flight = 0
+    server.max_in_flight = 0
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def base_url(server):
+    """Base URL of the stand-in server."""
+    return f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+def test_packs_batches_by_item_limit(server, base_url):
+    """Test that texts are packed into requests of at most max_batch_items."""
+    client = RemoteEmbeddingClient("test-key", "stand-in", base_url=base_url, max_batch_items=2)
+    
+    embeddings = client.embed_many(["a", "bb", "ccc", "dddd", "eeeee"])
+    
+    assert [len(request["input"]) for request in server.requests] == [2, 2, 1]
+    assert [embedding[0] for embedding in embeddings] == [1.0, 2.0, 3.0, 4.0, 5.0]
+    client.close()
+
+def test_packs_batches_by_token_limit(base_url):
+    """Test that the estimated token budget splits batches."""
+    client = RemoteEmbeddingClient("test-key", "stand-in", base_url=base_url, max_batch_tokens=30)
+    
+    batches = client.pack_batches(["x" * 80, "y" * 80, "z" * 8])
+    
+    assert batches == [["x" * 80], ["y" * 80, "z" * 8]]
+    client.close()
+
+def test_removes_duplicates_within_batch(server, base_url):
+    """Test that duplicate texts are sent once."""
+    client = RemoteEmbeddingClient("test-key", "stand-in", base_url=base_url)
+    
+    embeddings = client.embed_many(["same", "other", "same"])
+    
+    assert server.requests[0]["input"] == ["same", "other"]
+    assert embeddings[0] == embeddings[2]
+    client.close()
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_retries_throttling_and_server_errors(server, base_url, status):
+    """Test that 429 and 5xx responses are retried."""
+    server.failures = [status]
+    client = RemoteEmbeddingClient("test-key", "stand-in", base_url=base_url)
+    
+    embeddings = client.embed_many(["retry me"])
+    
+    assert len(server.requests) == 2
+    assert embeddings == [[8.0, 0.0, 1.0]]
+    assert client.rate_limiter.metrics()["throttled"] == (1 if status == 429 else 0)
+    client.close()
+
+def test_generator_embeds_through_base_url(base_url):
+    """Test that EmbeddingGenerator uses the configured remote endpoint."""
+    generator = EmbeddingGenerator(
+        model_name="stand-in", api_key="test-key", base_url=base_url, dimension=3
+    )
+    
+    embeddings = generator.embed_array(["one", "three"])
+    
+    assert embeddings.dtype == np.float32
+    assert embeddings.tolist() == [[3.0, 0.0, 1.0], [5.0, 1.0, 1.0]]
+    generator.close()
+
+def test_aembed_keeps_requests_in_flight(server, base_url):
+    """Test that aembed overlaps requests up to max_concurrency."""
+    server.delay = 0.2
+    generator = EmbeddingGenerator(
+        model_name="stand-in", api_key="test-key", base_url=base_url, dimension=3,
+        max_batch_items=1, max_concurrency=3
+    )
+    texts = ["a" * (i + 1) for i in range(6)]
+    
+    start = time.perf_counter()
+    embeddings = asyncio.run(generator.aembed(texts))
+    elapsed = time.perf_counter() - start
+    
+    assert server.max_in_flight == 3
+    assert elapsed < 6 * server.delay
+    assert embeddings[:, 0].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+    generator.close()
+
+def test_aembed_request_timeout(server, base_url):
+    """Test that a slow request raises EmbeddingError."""
+    server.delay = 0.5
+    generator = EmbeddingGenerator(
+        model_name="stand-in", api_key="test-key", base_url=base_url, dimension=3,
+        request_timeout=0.1
+    )
+    
+    with pytest.raises(EmbeddingError, match="timed out"):
+        asyncio.run(generator.aembed(["slow"]))
+    generator.close()
@@ -0,0 +1,77 @@
+"""Tests for the sketch index module."""
+
+import numpy as np
+import pytest
+
+from pdf2vector.core import sketch_index
+from pdf2vector.core.embeddings import EmbeddingGenerator
+from pdf2vector.core.sketch_index import SketchIndex, sketch
+from pdf2vector.core.vector_store import ChromaDBStore
+
+def test_sketch_packs_bits_above_mean():
+    """Test that each bit records whether a value is above its vector's mean."""
+    vectors = np.zeros((1, 130), dtype=np.float32)
+    vectors[0, [0, 64, 129]] = 1.0
+    
+    packed = sketch(vectors)
+    
+    assert packed.dtype == np.uint64
+    assert packed.shape == (1, 3)
+    assert packed.tolist() == [[1, 1, 2]]
+
+def test_popcount_fallback_matches_numpy():
+    """Test that the byte table popcount counts the same bits."""
+    words = np.array([[0, 1, 3, 2**64 - 1]], dtype=np.uint64)
+    table = sketch_index._BYTE_POPCOUNT[words.view(np.uint8)].reshape(*words.shape, 8).sum(axis=-1)
+    
+    assert table.tolist() == [[0, 1, 2, 64]]
+    assert sketch_index._popcount(words).tolist() == [[0, 1, 2, 64]]
+
+def test_search_reranks_exactly(embeddings):
+    """Test that results carry exact cosine scores in descending order."""
+    index = SketchIndex(embeddings.shape[1], candidates=3)
+    index.add([f"id{i}" for i in range(len(embeddings))], embeddings)
+    
+    for i, query in enumerate(embeddings):
+        hits = index.search(query, k=2)
+        assert hits[0][0] == f"id{i}"
+        assert hits[0][1] == pytest.approx(1.0, abs=1e-5)
+        assert hits[0][1] >= hits[1][1]
+        
+    assert index.sketch_bytes == len(embeddings) * 24 * 8
+
+def test_replace_remove_save_and_load(tmp_path, embeddings):
+    """Test that replaced and removed vectors persist correctly."""
+    index = SketchIndex(embeddings.shape[1])
+    index.add(["a", "b"], embeddings[:2])
+    index.add(["b", "c"], embeddings[2:4])
+    index.remove(["a"])
+    index.save(tmp_path / "sketch.npz")
+    
+    loaded = SketchIndex.load(tmp_path / "sketch.npz", embeddings.shape[1])
+    
+    assert loaded.ids == ["b", "c"]
+    assert loaded.search(embeddings[2], k=1)[0][0] == "b"
+    with pytest.raises(ValueError):
+        SketchIndex.load(tmp_path / "sketch.npz", 16)
+
+def test_store_with_sketch_search(tmp_path, chunks, texts):
+    """Test that a sketch store answers queries and persists its index."""
+    store = ChromaDBStore(
+        persist_dir=tmp_path / "chroma",
+        embedding_generator=EmbeddingGenerator(),
+        sketch=True
+    )
+    store.upsert(chunks)
+    
+    results = store.query("flour water salt and yeast", k=1)
+    
+    assert results[0]["text"] == texts[1]
+    assert (tmp_path / "chroma" / "sketch_index.npz").exists()
+    with pytest.raises(ValueError):
+        ChromaDBStore(
+            persist_dir=tmp_path / "other",
+            embedding_generator=EmbeddingGenerator(),
+            sketch=True,
+            quantization="int8"
+        )
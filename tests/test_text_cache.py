@@ -0,0 +1,89 @@
+"""Tests for the text cache module."""
+
+import pytest
+
+from pdf2vector.core.chunking import PDFChunker
+from pdf2vector.core.text_cache import TextCache
+
+from sample_pdf import write_pdf
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a TextCache in a temporary directory."""
+    cache = TextCache(tmp_path / "cache" / "texts.sqlite")
+    yield cache
+    cache.close()
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    """Write a three-page PDF."""
+    path = tmp_path / "book.pdf"
+    write_pdf(path, [[f"Page {page} line {line} of the book" for line in range(10)] for page in range(3)])
+    return path
+
+def test_put_and_get(cache):
+    """Test storing and retrieving page texts."""
+    pages = ["first page\n\f", "second page ünïcode\n\f"]
+    
+    cache.put("digest", "v1", pages)
+    
+    assert list(cache.get("digest", "v1")) == pages
+    assert cache.get("digest", "v2") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert 0 < cache.size_bytes < len("".join(pages)) + 64
+
+def test_evicts_least_recently_used(tmp_path):
+    """Test that the cache evicts the least recently used texts above max_bytes."""
+    cache = TextCache(tmp_path / "texts.sqlite")
+    cache.put("a", "v1", ["a"])
+    cache.max_bytes = cache.size_bytes * 2
+    cache.put("b", "v1", ["b"])
+    cache.get("a", "v1")
+    
+    cache.put("c", "v1", ["c"])
+    
+    assert len(cache) == 2
+    assert cache.get("b", "v1") is None
+    assert list(cache.get("a", "v1")) == ["a"]
+    cache.close()
+
+def test_digest_depends_on_content(tmp_path):
+    """Test that files are addressed by content, not name."""
+    first, second, third = tmp_path / "1.pdf", tmp_path / "2.pdf", tmp_path / "3.pdf"
+    first.write_bytes(b"same")
+    second.write_bytes(b"same")
+    third.write_bytes(b"other")
+    
+    assert TextCache.digest(first) == TextCache.digest(second) != TextCache.digest(third)
+
+def test_chunker_reads_cached_pages(cache, pdf_path, monkeypatch):
+    """Test that a second chunking run reads the pages from the cache."""
+    chunker = PDFChunker(chunk_size=200, chunk_overlap=20, workers=1, text_cache=cache)
+    first = chunker.chunk_pdf(pdf_path)
+    
+    def no_extraction(*args, **kwargs):
+        raise AssertionError("PDF extracted again")
+        
+    monkeypatch.setattr("pdf2vector.core.chunking._extract_pages", no_extraction)
+    rechunked = PDFChunker(chunk_size=300, chunk_overlap=50, workers=1, text_cache=cache)
+    
+    assert [chunk.text for chunk in chunker.chunk_pdf(pdf_path)] == [chunk.text for chunk in first]
+    assert rechunked.chunk_pdf(pdf_path)[0].text == first[0].text[:200] + first[1].text[20:120]
+    assert cache.hits == 2
+
+def test_chunker_streams_pages_through_the_cache(cache, pdf_path):
+    """Test that pages are cached as extracted and only a finished PDF is a hit."""
+    chunker = PDFChunker(workers=1, text_cache=cache)
+    digest = TextCache.digest(pdf_path)
+    
+    pages = chunker.iter_pages(pdf_path)
+    first = next(pages)
+    pages.close()
+    assert cache.get(digest, chunker.extractor_version) is None
+    
+    extracted = [first] + list(chunker.iter_pages(pdf_path))[1:]
+    cached = cache.get(digest, chunker.extractor_version)
+    
+    assert next(cached) == first
+    assert [first] + list(cached) == extracted
+    assert len(cache) == 1
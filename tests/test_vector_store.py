@@ -1 +1,70 @@
- 
\ No newline at end of file
+"""Tests for the vector store module."""
+
+from unittest.mock import patch
+import numpy as np
+
+from pdf2vector.core.chunking import Chunk
+from pdf2vector.core.embeddings import EmbeddingGenerator
+from pdf2vector.core.vector_store import ChromaDBStore
+
+def test_upsert_passes_float32_array(store, chunks):
+    """Test that embeddings reach ChromaDB as one float32 array."""
+    with patch.object(store.collection, "upsert") as mock_upsert:
+        store.upsert(chunks)
+        
+    embeddings = mock_upsert.call_args.kwargs["embeddings"]
+    assert isinstance(embeddings, np.ndarray)
+    assert embeddings.dtype == np.float32
+    assert embeddings.shape == (len(chunks), store.embedding_generator.dimension)
+
+def test_upsert_and_query(store, chunks):
+    """Test that stored chunks can be retrieved by similarity."""
+    store.upsert(chunks)
+    
+    results = store.query("flour water salt and yeast", k=1)
+    
+    assert len(results) == 1
+    assert results[0]["text"] == chunks[1].text
+    assert results[0]["metadata"]["chunk_index"] == 1
+
+def test_upsert_streams_batches(tmp_path, chunks):
+    """Test that a generator of chunks is written batch by batch."""
+    store = ChromaDBStore(
+        persist_dir=tmp_path / "chroma",
+        embedding_generator=EmbeddingGenerator(),
+        batch_size=4
+    )
+    
+    with patch.object(store.collection, "upsert") as mock_upsert:
+        store.upsert(chunk for chunk in chunks)
+        
+    assert mock_upsert.call_count == 2
+    first, second = mock_upsert.call_args_list
+    assert first.kwargs["documents"] == [chunk.text for chunk in chunks[:4]]
+    assert second.kwargs["documents"] == [chunk.text for chunk in chunks[4:]]
+    assert second.kwargs["embeddings"].shape == (2, store.embedding_generator.dimension)
+
+def test_sync_document_embeds_only_new_chunks(store, chunks):
+    """Test that syncing a document re-embeds only chunks not stored yet."""
+    content_chunks = [
+        Chunk(text=chunk.text, metadata={**chunk.metadata, "occurrence": 0}) for chunk in chunks
+    ]
+    store.sync_document("test.pdf", content_chunks)
+    
+    # Insert a chunk at the front: the others move but keep their IDs
+    inserted = Chunk(text="Rivers carry sediment to the sea", metadata={"filename": "test.pdf", "occurrence": 0})
+    edited = [inserted] + content_chunks[:2]
+    for index, chunk in enumerate(edited):
+        chunk.metadata = {**chunk.metadata, "chunk_index": index}
+        
+    with patch.object(store.collection, "upsert", wraps=store.collection.upsert) as mock_upsert:
+        ids = store.sync_document("test.pdf", edited)
+        
+    assert mock_upsert.call_count == 1
+    assert mock_upsert.call_args.kwargs["documents"] == [inserted.text]
+    records = store.collection.get()
+    assert sorted(records["ids"]) == sorted(ids)
+    assert len(ids) == 3
+    by_text = {text: metadata for text, metadata in zip(records["documents"], records["metadatas"])}
+    assert by_text[chunks[1].text]["chunk_index"] == 2
+    assert chunks[2].text not in by_text
\ No newline at end of file